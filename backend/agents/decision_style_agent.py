@@ -0,0 +1,147 @@
+"""Decision Style Agent - Top-down 의사결정 감지 (로컬 규칙 기반)"""
+import re
+
+from agents.base_agent import BaseAgent, AnalysisResult
+from agents.principle_matcher import AhoCorasick, normalize
+from models.meeting import MeetingState, TranscriptEntry
+
+# 결정 선언/지시 표현과 가중치 (정규화: 소문자 + 공백 제거 후 매칭)
+TOP_DOWN_PHRASES: dict[str, float] = {
+    "이걸로 결정": 0.6,
+    "이걸로 하겠습니다": 0.5,
+    "이걸로 갑니다": 0.5,
+    "이대로 진행": 0.4,
+    "제가 정할게": 0.6,
+    "제가 정하겠": 0.6,
+    "제가 결정": 0.6,
+    "내가 결정": 0.6,
+    "제 결정": 0.5,
+    "결정했습니다": 0.5,
+    "확정합니다": 0.5,
+    "확정하겠습니다": 0.5,
+    "그렇게 하세요": 0.4,
+    "그냥 하세요": 0.5,
+    "그냥 해": 0.4,
+    "시키는 대로": 0.6,
+    "하라는 대로": 0.6,
+    "따라주세요": 0.4,
+    "따라오세요": 0.5,
+    "토 달지": 0.7,
+    "더 논의할 필요": 0.5,
+    "논의는 여기까지": 0.4,
+    "반대 없으시죠": 0.5,
+    "이견 없죠": 0.5,
+    "무조건": 0.3,
+}
+
+# 다른 의견을 구하는 표현 (Top-down 점수 감소)
+CONSULTATIVE_PHRASES: dict[str, float] = {
+    "어떻게 생각": 0.4,
+    "의견": 0.3,
+    "어떠세요": 0.4,
+    "괜찮을까요": 0.3,
+    "반대 의견": 0.4,
+    "다른 생각": 0.4,
+    "같이 정": 0.4,
+    "투표": 0.3,
+}
+
+# "...로 결정/확정합니다", "...하도록 하세요" 같은 문장 끝 선언형
+_DECREE_ENDING_RE = re.compile(
+    r"(으?로|대로)(결정|확정|정|진행)(합니다|하겠습니다|할게요|하겠어요|하죠)[.!]*$"
+    r"|하도록하세요[.!]*$"
+)
+
+# 결정 권한이 있는 역할 (소문자 비교)
+SENIOR_ROLE_KEYWORDS = (
+    "팀장", "리드", "lead", "매니저", "manager", "pm", "po", "본부장", "실장",
+    "이사", "대표", "head", "director", "cto", "ceo", "vp",
+)
+
+
+class DecisionStyleAgent(BaseAgent):
+    """
+    Top-down 의사결정을 감지하는 Agent
+
+    최신 발화를 미리 컴파일한 선언/지시 표현 매처로 점수화하고, 발화자의 역할과
+    최근 발언 점유율을 더해 판단합니다. LLM 호출 없이 CPU에서 바로 실행됩니다.
+    """
+
+    def __init__(self, min_confidence: float = 0.7):
+        super().__init__("DecisionStyleAgent")
+        self.min_confidence = min_confidence
+        self.role_bonus = 0.15
+        self.share_bonus = 0.15
+
+        self._top_down = AhoCorasick(self._patterns(TOP_DOWN_PHRASES))
+        self._top_down_weights = {normalize(p): w for p, w in TOP_DOWN_PHRASES.items()}
+        self._consultative = AhoCorasick(self._patterns(CONSULTATIVE_PHRASES))
+        self._consultative_weights = {normalize(p): w for p, w in CONSULTATIVE_PHRASES.items()}
+
+    @staticmethod
+    def _patterns(phrases: dict[str, float]) -> dict[str, list[int]]:
+        return {normalize(phrase): [] for phrase in phrases}
+
+    def score_text(self, text: str) -> float:
+        """발화 자체의 Top-down 점수 (0.0-1.0)"""
+        normalized = normalize(text)
+        hits = {pattern for pattern, _ in self._top_down.scan(normalized)}
+        score = sum(self._top_down_weights[p] for p in hits)
+        if _DECREE_ENDING_RE.search(normalized):
+            score += 0.3
+        if score == 0:
+            return 0.0
+
+        consulted = {pattern for pattern, _ in self._consultative.scan(normalized)}
+        score -= sum(self._consultative_weights[p] for p in consulted)
+        if normalized.endswith("?"):
+            score -= 0.3
+        return max(0.0, min(score, 1.0))
+
+    @staticmethod
+    def is_senior(role: str) -> bool:
+        role = role.lower()
+        return any(keyword in role for keyword in SENIOR_ROLE_KEYWORDS)
+
+    async def analyze(
+        self,
+        state: MeetingState,
+        recent_transcript: list[TranscriptEntry]
+    ) -> AnalysisResult:
+        if not recent_transcript or len(state.participants) < 2:
+            return AnalysisResult(agent_name=self.name, needs_intervention=False)
+
+        latest = recent_transcript[-1]
+        score = self.score_text(latest.text)
+        if score == 0:
+            return AnalysisResult(agent_name=self.name, needs_intervention=False)
+
+        stats = state.speaker_stats
+        speaker = stats.get_participant(latest.speaker)
+        if speaker is not None and self.is_senior(speaker.role):
+            score += self.role_bonus
+
+        # 최근 윈도우에서 균등 몫보다 많이 발언 중이면 가산
+        snapshot = stats.snapshot()
+        fair_share = 100 / len(state.participants)
+        if latest.speaker in snapshot and snapshot[latest.speaker]["recentPercentage"] > fair_share:
+            score += self.share_bonus
+
+        confidence = round(min(score, 1.0), 2)
+        if confidence < self.min_confidence:
+            return AnalysisResult(agent_name=self.name, needs_intervention=False)
+
+        # 최근 가장 적게 발언한 다른 참석자에게 발언 권유
+        others = [p for p in state.participants if p.name != latest.speaker]
+        quietest = min(
+            others,
+            key=lambda p: snapshot.get(p.name, {}).get("recentCount", p.speaking_count),
+        )
+        return AnalysisResult(
+            agent_name=self.name,
+            needs_intervention=True,
+            intervention_type="DECISION_STYLE",
+            message=f"멈춰주세요! {latest.speaker} 님, 혼자 결정하시면 안 돼요. {quietest.name} 님 의견도 들어볼까요?",
+            confidence=confidence,
+            suggested_speaker=quietest.name,
+        )
@@ -0,0 +1,150 @@
+"""Fused Analysis Agent - 주제/원칙/의사결정 방식을 단일 LLM 호출로 분석"""
+import json
+from openai import AsyncOpenAI
+from agents.base_agent import AnalysisResult
+from agents.principle_matcher import compiled_trigger_index, screened_principles_text
+from models.meeting import MeetingState, TranscriptEntry
+from services.analysis_cache import AnalysisCache, get_analysis_cache
+from services.llm_client import DEFAULT_LLM_TIMEOUT, get_llm_client
+
+
+class FusedAnalysisAgent:
+    """
+    TopicAgent와 PrincipleAgent의 판단을 하나의 구조화된 요청으로 합친 Agent
+
+    원칙은 PrincipleAgent와 같은 트리거 인덱스로 먼저 선별하고, 후보 원칙이
+    있을 때만 전문과 감지된 표현을 프롬프트에 넣어 위반 여부를 묻습니다.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        timeout: float = DEFAULT_LLM_TIMEOUT,
+        cache: AnalysisCache | None = None,
+    ):
+        self.name = "FusedAnalysisAgent"
+        self.client = client or get_llm_client()
+        self.timeout = timeout
+        self.cache = cache or get_analysis_cache()
+        self.min_confidence = 0.7
+
+    async def analyze(
+        self,
+        state: MeetingState,
+        recent_transcript: list[TranscriptEntry]
+    ) -> list[AnalysisResult]:
+        """한 번의 호출로 주제 이탈, 원칙 위반, 의사결정 방식 판정"""
+        if len(recent_transcript) < 1:
+            return []
+
+        window = recent_transcript[-5:]
+        transcript_text = "\n".join(
+            [f"{t.speaker}: {t.text}" for t in window]
+        )
+
+        # 최신 발화에서 트리거가 걸린 원칙만 후보 (트리거 없는 원칙은 항상 후보)
+        check_principles = False
+        principles_text = "검토할 원칙 없음 (원칙 위반은 판단하지 말고 false)"
+        if state.principles:
+            index = compiled_trigger_index(state.principles)
+            matches = index.match(window[-1].text)
+            if matches or index.unscreened:
+                check_principles = True
+                principles_text = screened_principles_text(index, matches)
+
+        prompt = f"""당신은 회의를 관찰하며 세 가지를 동시에 판단하는 전문가입니다.
+
+아젠다:
+{state.agenda or "아젠다 없음"}
+
+검토할 회의 원칙:
+{principles_text}
+
+최근 대화:
+{transcript_text}
+
+1. 주제 이탈: 회의와 관련 없는 잡담(점심 메뉴, 날씨 등)은 주제 이탈입니다.
+2. 원칙 위반: 마지막 발화가 위 회의 원칙을 위반했는지 판단하세요. 감지된 표현은 후보일 뿐이며 문맥상 위반이 아니면 false입니다.
+   - "수평적 의사결정" 위반: 혼자서 결정하거나 다른 의견을 묻지 않음
+   - "타임박스" 위반: 시간 관리 무시
+   - "Disagree and Commit" 위반: 반대 의견 없이 무조건 수용
+3. 의사결정 방식: 한 사람이 다른 의견을 묻지 않고 Top-down으로 결정했는지 판단하세요.
+
+JSON 응답:
+{{
+  "topic": {{
+    "is_off_topic": true/false,
+    "confidence": 0.0-1.0,
+    "parking_lot_item": "Parking Lot에 추가할 항목 (이탈 시)"
+  }},
+  "principle": {{
+    "is_violation": true/false,
+    "confidence": 0.0-1.0,
+    "violated_principle": "위반된 원칙명 (위반 시)"
+  }},
+  "decision_style": {{
+    "is_top_down": true/false,
+    "confidence": 0.0-1.0,
+    "decider": "결정한 참석자 (Top-down 시)"
+  }}
+}}
+"""
+
+        # 동일한 컨텍스트/발화 윈도우는 캐시된 판정 재사용
+        cache_key = self.cache.make_key(self.name, state, window)
+        result = self.cache.get(cache_key)
+        if result is None:
+            response = await self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+                timeout=self.timeout,
+            )
+            result = json.loads(response.choices[0].message.content)
+            self.cache.set(cache_key, result)
+
+        return self._to_results(result, check_principles)
+
+    def _to_results(self, result: dict, check_principles: bool) -> list[AnalysisResult]:
+        """통합 응답을 Agent별 AnalysisResult로 변환"""
+        results: list[AnalysisResult] = []
+
+        topic = result.get("topic") or {}
+        if topic.get("is_off_topic") and topic.get("confidence", 0) > self.min_confidence:
+            parking_lot = topic.get("parking_lot_item")
+            results.append(AnalysisResult(
+                agent_name="TopicAgent",
+                needs_intervention=True,
+                intervention_type="TOPIC_DRIFT",
+                message=f"잠깐요, 아젠다에서 벗어났어요. 원래 주제로 돌아갈게요.{f' {parking_lot}은(는) Parking Lot에 추가했습니다.' if parking_lot else ''}",
+                confidence=topic.get("confidence", 0.8),
+                parking_lot_item=parking_lot,
+            ))
+
+        principle = result.get("principle") or {}
+        if (
+            check_principles
+            and principle.get("is_violation")
+            and principle.get("confidence", 0) > self.min_confidence
+        ):
+            violated = principle.get("violated_principle") or "회의 원칙"
+            results.append(AnalysisResult(
+                agent_name="PrincipleAgent",
+                needs_intervention=True,
+                intervention_type="PRINCIPLE_VIOLATION",
+                message=f"멈춰주세요! '{violated}' 원칙 위반입니다. 다른 분들 의견은 어떠세요?",
+                confidence=principle.get("confidence", 0.8),
+                violated_principle=violated,
+            ))
+
+        decision = result.get("decision_style") or {}
+        if decision.get("is_top_down") and decision.get("confidence", 0) > self.min_confidence:
+            results.append(AnalysisResult(
+                agent_name=self.name,
+                needs_intervention=True,
+                intervention_type="DECISION_STYLE",
+                message="멈춰주세요! 혼자 결정하시면 안 돼요. 다른 분들 의견도 들어볼까요?",
+                confidence=decision.get("confidence", 0.8),
+            ))
+
+        return results
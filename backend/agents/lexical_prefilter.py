@@ -0,0 +1,144 @@
+"""Lexical Pre-filter - LLM Agent 호출 전 CPU 전용 게이트"""
+import os
+import re
+from dataclasses import dataclass
+
+from agents.principle_matcher import (
+    PrincipleTriggerIndex,
+    compiled_trigger_index,
+    principle_index_key,
+)
+from models.meeting import MeetingState, TranscriptEntry
+
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+
+# 트리거 목록이 없는 원칙용 기본 단서 (결정/시간/동의 관련 표현)
+DEFAULT_PRINCIPLE_CUES = (
+    "결정", "정하", "정할", "그냥", "무조건", "시키", "지시", "따라",
+    "시간", "넘어", "늦어", "연장",
+    "반대", "동의", "찬성", "이견",
+)
+
+
+def char_ngrams(text: str, n: int = 2) -> set[str]:
+    """
+    토큰별 문자 n-gram 집합.
+
+    한글 토큰은 조사가 붙어도 겹치도록 문자 n-gram으로 쪼개고 (형태소 분석 불필요),
+    영문/숫자 토큰은 단어 단위로 유지합니다.
+    """
+    grams: set[str] = set()
+    for token in _TOKEN_RE.findall(text.lower()):
+        if token.isascii() or len(token) < n:
+            grams.add(token)
+            continue
+        for i in range(len(token) - n + 1):
+            grams.add(token[i:i + n])
+    return grams
+
+
+@dataclass
+class PreFilterConfig:
+    """게이트 임계값"""
+    min_chars: int = int(os.getenv("PREFILTER_MIN_CHARS", "6"))
+    min_novelty: float = float(os.getenv("PREFILTER_MIN_NOVELTY", "0.3"))
+    on_topic_overlap: float = float(os.getenv("PREFILTER_ON_TOPIC_OVERLAP", "0.3"))
+    min_principle_cues: int = 1
+
+
+@dataclass
+class PreFilterDecision:
+    """게이트 판정 결과"""
+    run_topic: bool
+    run_principle: bool
+    reason: str = ""
+
+    @property
+    def skipped_all(self) -> bool:
+        return not self.run_topic and not self.run_principle
+
+
+class LexicalPreFilter:
+    """
+    발화 길이, 이전 윈도우 대비 새로움, 아젠다 겹침, 원칙 트리거로 LLM 호출 여부 판단
+
+    원칙 판정은 PrincipleAgent와 같은 컴파일된 트리거 인덱스를 사용하고,
+    트리거 목록이 없는 원칙이 있을 때만 기본 단서 n-gram을 보조로 봅니다.
+    """
+
+    def __init__(self, config: PreFilterConfig | None = None):
+        self.config = config or PreFilterConfig()
+        self.skipped_calls = 0
+
+        self._context_key: tuple | None = None
+        self._agenda_grams: set[str] = set()
+        self._trigger_index: PrincipleTriggerIndex | None = None
+        self._cue_grams: set[str] = set()
+
+    def _prepare(self, state: MeetingState) -> None:
+        """아젠다 n-gram과 원칙 트리거 인덱스는 내용이 바뀔 때만 다시 계산"""
+        key = (state.agenda, principle_index_key(state.principles))
+        if key == self._context_key:
+            return
+
+        self._context_key = key
+        self._agenda_grams = char_ngrams(state.agenda or "")
+        self._trigger_index = compiled_trigger_index(state.principles)
+        self._cue_grams = set()
+        if self._trigger_index.unscreened:
+            for cue in DEFAULT_PRINCIPLE_CUES:
+                self._cue_grams |= char_ngrams(cue)
+            for principle in self._trigger_index.unscreened:
+                self._cue_grams |= char_ngrams(principle.get("name", ""))
+
+    def evaluate(
+        self,
+        state: MeetingState,
+        recent_transcript: list[TranscriptEntry]
+    ) -> PreFilterDecision:
+        """모호한 윈도우만 LLM Agent로 전달"""
+        decision = self._decide(state, recent_transcript)
+        self.skipped_calls += (not decision.run_topic) + (not decision.run_principle)
+        return decision
+
+    def _decide(
+        self,
+        state: MeetingState,
+        recent_transcript: list[TranscriptEntry]
+    ) -> PreFilterDecision:
+        if not recent_transcript:
+            return PreFilterDecision(False, False, "empty")
+
+        self._prepare(state)
+        latest = recent_transcript[-1].text.strip()
+
+        # 1) 너무 짧은 발화 (맞장구, VAD 잡음)
+        if len(latest.replace(" ", "")) < self.config.min_chars:
+            return PreFilterDecision(False, False, "short")
+
+        # 2) 직전 윈도우 대비 새로운 내용이 거의 없음
+        latest_grams = char_ngrams(latest)
+        if not latest_grams:
+            return PreFilterDecision(False, False, "no_tokens")
+
+        previous_grams: set[str] = set()
+        for entry in recent_transcript[-6:-1]:
+            previous_grams |= char_ngrams(entry.text)
+        novelty = len(latest_grams - previous_grams) / len(latest_grams)
+        if novelty < self.config.min_novelty:
+            return PreFilterDecision(False, False, "repeated")
+
+        # 3) 아젠다 겹침이 충분하면 명백히 주제 내 발화
+        run_topic = True
+        if self._agenda_grams:
+            overlap = len(latest_grams & self._agenda_grams) / len(latest_grams)
+            run_topic = overlap < self.config.on_topic_overlap
+
+        # 4) 원칙 트리거가 걸리지 않고 (트리거 없는 원칙의) 단서도 없으면 명백히 무해한 발화
+        run_principle = bool(state.principles) and (
+            bool(self._trigger_index.match(latest))
+            or len(latest_grams & self._cue_grams) >= self.config.min_principle_cues
+        )
+
+        reason = "ambiguous" if run_topic or run_principle else "clear"
+        return PreFilterDecision(run_topic, run_principle, reason)
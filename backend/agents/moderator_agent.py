@@ -2,18 +2,27 @@ import json
 import time
 import uuid
 from datetime import datetime
-from openai import OpenAI
+from openai import AsyncOpenAI
 from models.meeting import (
     MeetingState,
     TranscriptEntry,
     Intervention,
     InterventionType,
 )
+from services.analysis_cache import AnalysisCache, get_analysis_cache
+from services.llm_client import DEFAULT_LLM_TIMEOUT, get_llm_client
 
 
 class ModeratorAgent:
-    def __init__(self):
-        self.client = OpenAI()
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        timeout: float = DEFAULT_LLM_TIMEOUT,
+        cache: AnalysisCache | None = None,
+    ):
+        self.client = client or get_llm_client()
+        self.timeout = timeout
+        self.cache = cache or get_analysis_cache()
         self.last_intervention_time = 0
         self.min_intervention_interval = 20  # 최소 20초 간격
 
@@ -58,20 +67,26 @@ JSON 응답:
 }}
 """
 
+        window = recent_transcript[-10:]
         transcript_text = "\n".join(
-            [f"{t.speaker}: {t.text}" for t in recent_transcript[-10:]]
+            [f"{t.speaker}: {t.text}" for t in window]
         )
 
-        response = self.client.chat.completions.create(
-            model="gpt-4o",
-            messages=[
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": f"최근 대화:\n{transcript_text}"},
-            ],
-            response_format={"type": "json_object"},
-        )
-
-        result = json.loads(response.choices[0].message.content)
+        # 동일한 컨텍스트/발화 윈도우는 캐시된 판정 재사용
+        cache_key = self.cache.make_key("ModeratorAgent", state, window, speaker_stats)
+        result = self.cache.get(cache_key)
+        if result is None:
+            response = await self.client.chat.completions.create(
+                model="gpt-4o",
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": f"최근 대화:\n{transcript_text}"},
+                ],
+                response_format={"type": "json_object"},
+                timeout=self.timeout,
+            )
+            result = json.loads(response.choices[0].message.content)
+            self.cache.set(cache_key, result)
 
         if result.get("needs_intervention"):
             self.last_intervention_time = current_time
@@ -89,14 +104,13 @@ JSON 응답:
         return None
 
     def _calculate_speaker_stats(self, state: MeetingState) -> dict:
-        total_count = sum(p.speaking_count for p in state.participants)
-        if total_count == 0:
+        if state.speaker_stats.total_count == 0:
             return {}
 
         return {
-            p.name: {
-                "percentage": round(p.speaking_count / total_count * 100),
-                "count": p.speaking_count,
+            name: {
+                "percentage": entry["percentage"],
+                "count": entry["count"],
             }
-            for p in state.participants
+            for name, entry in state.speaker_stats.snapshot().items()
         }
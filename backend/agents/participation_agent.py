@@ -18,14 +18,17 @@ class ParticipationAgent(BaseAgent):
         if len(state.participants) < 2:
             return AnalysisResult(agent_name=self.name, needs_intervention=False)
 
-        # 총 발언 수 계산
-        total_count = sum(p.speaking_count for p in state.participants)
+        # 총 발언 수 (엔진에 누적된 값)
+        stats = state.speaker_stats
+        total_count = stats.total_count
         if total_count < self.min_utterances_to_check:
             return AnalysisResult(agent_name=self.name, needs_intervention=False)
 
+        snapshot = stats.snapshot()
+
         # 발언하지 않은 참석자 찾기
         silent_participants = [
-            p for p in state.participants if p.speaking_count == 0
+            p for p in state.participants if snapshot[p.name]["count"] == 0
         ]
 
         if silent_participants:
@@ -39,20 +42,25 @@ class ParticipationAgent(BaseAgent):
                 suggested_speaker=silent.name,
             )
 
-        # 발언 불균형 체크 (한 사람이 50% 이상 차지)
-        for p in state.participants:
-            percentage = (p.speaking_count / total_count) * 100 if total_count > 0 else 0
-            if percentage > 50:
-                # 가장 적게 발언한 사람 찾기
-                least_speaker = min(state.participants, key=lambda x: x.speaking_count)
-                if least_speaker.speaking_count < total_count * 0.1:  # 10% 미만
-                    return AnalysisResult(
-                        agent_name=self.name,
-                        needs_intervention=True,
-                        intervention_type="PARTICIPATION_IMBALANCE",
-                        message=f"잠깐요! {p.name} 님이 대부분 발언하고 계세요. {least_speaker.name} 님 의견도 들어볼까요?",
-                        confidence=0.85,
-                        suggested_speaker=least_speaker.name,
-                    )
+        # 발언 불균형 체크 (최근 윈도우에서 한 사람이 50% 이상 차지)
+        # 최근 발언이 충분하지 않으면 누적 비율 사용
+        share_key = (
+            "recentPercentage"
+            if stats.window_total() >= self.min_utterances_to_check
+            else "percentage"
+        )
+        dominant = max(state.participants, key=lambda x: snapshot[x.name][share_key])
+        if snapshot[dominant.name][share_key] > 50:
+            # 가장 적게 발언한 사람 찾기
+            least_speaker = min(state.participants, key=lambda x: snapshot[x.name]["count"])
+            if snapshot[least_speaker.name]["count"] < total_count * 0.1:  # 10% 미만
+                return AnalysisResult(
+                    agent_name=self.name,
+                    needs_intervention=True,
+                    intervention_type="PARTICIPATION_IMBALANCE",
+                    message=f"잠깐요! {dominant.name} 님이 대부분 발언하고 계세요. {least_speaker.name} 님 의견도 들어볼까요?",
+                    confidence=0.85,
+                    suggested_speaker=least_speaker.name,
+                )
 
         return AnalysisResult(agent_name=self.name, needs_intervention=False)
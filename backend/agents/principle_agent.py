@@ -1,16 +1,40 @@
 """Principle Agent - 회의 원칙 위반 감지"""
 import json
-from openai import OpenAI
+from openai import AsyncOpenAI
 from agents.base_agent import BaseAgent, AnalysisResult
+from agents.principle_matcher import (
+    PrincipleTriggerIndex,
+    compiled_trigger_index,
+    screened_principles_text,
+)
 from models.meeting import MeetingState, TranscriptEntry
+from services.analysis_cache import AnalysisCache, get_analysis_cache
+from services.llm_client import DEFAULT_LLM_TIMEOUT, get_llm_client
+from services.metrics import TRIGGER_INDEX_SKIPPED_CALLS
 
 
 class PrincipleAgent(BaseAgent):
-    """회의 원칙 위반을 감지하는 Agent"""
+    """
+    회의 원칙 위반을 감지하는 Agent
 
-    def __init__(self):
+    최근 발화를 원칙 트리거 인덱스로 먼저 스캔하고, 트리거가 걸린 원칙만
+    전문과 함께 LLM에 판단을 요청합니다.
+    """
+
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        timeout: float = DEFAULT_LLM_TIMEOUT,
+        cache: AnalysisCache | None = None,
+    ):
         super().__init__("PrincipleAgent")
-        self.client = OpenAI()
+        self.client = client or get_llm_client()
+        self.timeout = timeout
+        self.cache = cache or get_analysis_cache()
+
+    def _trigger_index(self, state: MeetingState) -> PrincipleTriggerIndex:
+        """원칙 트리거 인덱스는 원칙 내용이 바뀔 때만 다시 컴파일 (게이트와 공유)"""
+        return compiled_trigger_index(state.principles)
 
     async def analyze(
         self,
@@ -20,23 +44,29 @@ class PrincipleAgent(BaseAgent):
         if len(recent_transcript) < 1 or not state.principles:
             return AnalysisResult(agent_name=self.name, needs_intervention=False)
 
+        # 최신 발화에서 트리거가 걸린 원칙만 후보 (트리거 없는 원칙은 항상 후보)
+        index = self._trigger_index(state)
+        matches = index.match(recent_transcript[-1].text)
+        if not matches and not index.unscreened:
+            TRIGGER_INDEX_SKIPPED_CALLS.inc()
+            return AnalysisResult(agent_name=self.name, needs_intervention=False)
+
+        window = recent_transcript[-5:]
         transcript_text = "\n".join(
-            [f"{t.speaker}: {t.text}" for t in recent_transcript[-5:]]
+            [f"{t.speaker}: {t.text}" for t in window]
         )
 
-        principles_text = "\n".join(
-            [f"- {p.get('name', '')}" for p in state.principles]
-        )
+        principles_text = screened_principles_text(index, matches)
 
         prompt = f"""당신은 회의 원칙 준수를 감시하는 전문가입니다.
 
-회의 원칙:
+검토할 회의 원칙:
 {principles_text}
 
 최근 대화:
 {transcript_text}
 
-원칙 위반 여부를 판단하세요.
+마지막 발화가 위 원칙을 위반하는지 판단하세요. 감지된 표현은 후보일 뿐이며 문맥상 위반이 아니면 false입니다.
 주요 위반 사례:
 - "수평적 의사결정" 위반: 혼자서 결정하거나 다른 의견을 묻지 않음
 - "타임박스" 위반: 시간 관리 무시
@@ -51,13 +81,18 @@ JSON 응답:
 }}
 """
 
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"},
-        )
-
-        result = json.loads(response.choices[0].message.content)
+        # 동일한 컨텍스트/발화 윈도우는 캐시된 판정 재사용
+        cache_key = self.cache.make_key(self.name, state, window)
+        result = self.cache.get(cache_key)
+        if result is None:
+            response = await self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+                timeout=self.timeout,
+            )
+            result = json.loads(response.choices[0].message.content)
+            self.cache.set(cache_key, result)
 
         if result.get("is_violation") and result.get("confidence", 0) > 0.7:
             violated = result.get("violated_principle", "회의 원칙")
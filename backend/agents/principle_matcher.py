@@ -0,0 +1,158 @@
+"""Principle trigger index - Aho-Corasick 다중 패턴 매칭으로 원칙 위반 후보 발화 선별"""
+import re
+from collections import deque
+from dataclasses import dataclass, field
+
+_SPACE_RE = re.compile(r"\s+")
+MIN_PATTERN_LENGTH = 2
+
+
+def normalize(text: str) -> str:
+    """소문자 + 공백 제거 (한국어 띄어쓰기 차이를 흡수)"""
+    return _SPACE_RE.sub("", text.lower())
+
+
+@dataclass
+class PrincipleMatch:
+    """발화에서 찾은 원칙 후보"""
+    principle: dict
+    phrases: list[str] = field(default_factory=list)
+
+
+class AhoCorasick:
+    """
+    정규화된 문구 집합에 대한 Aho-Corasick 오토마톤.
+
+    패턴 수와 무관하게 입력 길이에 선형인 한 번의 스캔으로 모든 매치를 찾습니다.
+    """
+
+    def __init__(self, patterns: dict[str, list[int]]):
+        # 상태별 전이, 실패 링크, 출력 (pattern, payloads)
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[list[tuple[str, list[int]]]] = [[]]
+
+        for pattern, payloads in patterns.items():
+            node = 0
+            for ch in pattern:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append((pattern, payloads))
+
+        # BFS로 실패 링크 계산 (깊이 1 상태는 루트로)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    @property
+    def size(self) -> int:
+        return len(self._goto)
+
+    def scan(self, text: str) -> list[tuple[str, list[int]]]:
+        """정규화된 텍스트에서 매치된 (pattern, payloads) 목록"""
+        matches = []
+        node = 0
+        goto, fail, out = self._goto, self._fail, self._out
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                matches.extend(out[node])
+        return matches
+
+
+class PrincipleTriggerIndex:
+    """
+    회의 원칙(규칙)별 트리거 문구를 하나의 오토마톤으로 컴파일한 인덱스.
+
+    트리거는 원칙 문서의 `트리거:` 목록과 규칙 이름입니다.
+    트리거 목록이 없는 규칙은 선별할 수 없으므로 unscreened로 분류됩니다.
+    """
+
+    def __init__(self, principles: list[dict]):
+        self.principles = principles
+        self.unscreened: list[dict] = []
+        patterns: dict[str, list[int]] = {}
+        for idx, principle in enumerate(principles):
+            triggers = principle.get("triggers") or []
+            if not triggers:
+                self.unscreened.append(principle)
+            for phrase in [*triggers, principle.get("name", "")]:
+                key = normalize(phrase)
+                if len(key) < MIN_PATTERN_LENGTH:
+                    continue
+                payloads = patterns.setdefault(key, [])
+                if idx not in payloads:
+                    payloads.append(idx)
+        self.pattern_count = len(patterns)
+        self._automaton = AhoCorasick(patterns)
+
+    def match(self, text: str) -> list[PrincipleMatch]:
+        """발화에서 트리거가 걸린 원칙 목록 (원칙 순서 유지)"""
+        found: dict[int, PrincipleMatch] = {}
+        for pattern, payloads in self._automaton.scan(normalize(text)):
+            for idx in payloads:
+                match = found.get(idx)
+                if match is None:
+                    match = found[idx] = PrincipleMatch(principle=self.principles[idx])
+                if pattern not in match.phrases:
+                    match.phrases.append(pattern)
+        return [found[idx] for idx in sorted(found)]
+
+
+_INDEX_CACHE_MAX = 32
+_index_cache: dict[tuple, PrincipleTriggerIndex] = {}
+
+
+def compiled_trigger_index(principles: list[dict]) -> PrincipleTriggerIndex:
+    """원칙 목록의 트리거 인덱스 (내용이 같으면 게이트와 Agent가 같은 인덱스를 공유)"""
+    key = principle_index_key(principles)
+    index = _index_cache.get(key)
+    if index is None:
+        if len(_index_cache) >= _INDEX_CACHE_MAX:
+            _index_cache.pop(next(iter(_index_cache)))
+        index = _index_cache[key] = PrincipleTriggerIndex(principles)
+    return index
+
+
+def principle_index_key(principles: list[dict]) -> tuple:
+    """인덱스 캐시 키 (원칙 내용이 바뀌면 다시 컴파일)"""
+    return tuple(
+        (p.get("name", ""), p.get("description", ""), tuple(p.get("triggers") or ()))
+        for p in principles
+    )
+
+
+def principle_full_text(principle: dict) -> str:
+    """LLM 프롬프트용 원칙 전문 (이름 + 설명)"""
+    name = principle.get("name", "")
+    description = principle.get("description", "")
+    return f"{name}: {description}" if description else name
+
+
+def screened_principles_text(index: PrincipleTriggerIndex, matches: list[PrincipleMatch]) -> str:
+    """LLM 프롬프트용 검토 대상 원칙 목록 (트리거가 걸린 원칙 + 트리거 없는 원칙의 전문)"""
+    lines = []
+    for match in matches:
+        phrases = ", ".join(match.phrases)
+        lines.append(f"- {principle_full_text(match.principle)} (감지된 표현: {phrases})")
+    matched = {id(match.principle) for match in matches}
+    lines.extend(
+        f"- {principle_full_text(p)}" for p in index.unscreened if id(p) not in matched
+    )
+    return "\n".join(lines)
@@ -0,0 +1,82 @@
+"""Sentiment Agent - 감정 톤 고조 감지 (로컬 어휘 기반)"""
+from agents.base_agent import BaseAgent, AnalysisResult
+from agents.sentiment_model import ToneLexiconModel
+from models.meeting import MeetingState, TranscriptEntry
+
+
+class SentimentAgent(BaseAgent):
+    """
+    발화 톤을 로컬 어휘 모델로 점수화하고 화자별 지수이동평균(EMA)으로 고조를 감지하는 Agent
+
+    네트워크 호출이 없으며, 분석이 건너뛰어진 발화도 다음 분석 때 EMA에 반영합니다.
+    """
+
+    def __init__(
+        self,
+        model: ToneLexiconModel | None = None,
+        alpha: float = 0.4,
+        escalation_threshold: float = -0.45,
+    ):
+        super().__init__("SentimentAgent")
+        self.model = model or ToneLexiconModel()
+        self.alpha = alpha
+        self.escalation_threshold = escalation_threshold
+
+        self.tone: dict[str, float] = {}  # 화자별 톤 EMA
+        self._last_entry_id: str | None = None
+
+    def observe(self, entry: TranscriptEntry) -> float:
+        """발화 하나를 화자 EMA에 반영하고 발화 톤을 반환"""
+        score = self.model.score(entry.text)
+        previous = self.tone.get(entry.speaker, 0.0)
+        self.tone[entry.speaker] = previous + self.alpha * (score - previous)
+        return score
+
+    def _observe_new(self, recent_transcript: list[TranscriptEntry]) -> float:
+        """아직 반영하지 않은 발화만 EMA에 반영 (마지막 발화 톤 반환)"""
+        start = 0
+        for i in range(len(recent_transcript) - 1, -1, -1):
+            if recent_transcript[i].id == self._last_entry_id:
+                start = i + 1
+                break
+
+        score = 0.0
+        for entry in recent_transcript[start:]:
+            score = self.observe(entry)
+        if start < len(recent_transcript):
+            self._last_entry_id = recent_transcript[-1].id
+        return score
+
+    async def analyze(
+        self,
+        state: MeetingState,
+        recent_transcript: list[TranscriptEntry]
+    ) -> AnalysisResult:
+        if not recent_transcript:
+            return AnalysisResult(agent_name=self.name, needs_intervention=False)
+
+        latest_score = self._observe_new(recent_transcript)
+        latest = recent_transcript[-1]
+        speaker_tone = self.tone.get(latest.speaker, 0.0)
+
+        # 최신 발화가 부정적이고 화자의 누적 톤도 임계값 아래일 때만 개입
+        if latest_score >= 0 or speaker_tone > self.escalation_threshold:
+            return AnalysisResult(agent_name=self.name, needs_intervention=False)
+
+        heated = [s for s, tone in self.tone.items() if tone <= self.escalation_threshold]
+        if len(heated) > 1:
+            message = "잠깐 멈춰요. 감정이 고조되고 있어요. 각자 핵심 우려사항 한 가지씩만 말씀해 주세요."
+        else:
+            message = f"잠깐 멈춰요. {latest.speaker} 님, 감정이 고조되고 있어요. 핵심 우려사항 한 가지만 말씀해 주세요."
+
+        # 개입 후 같은 고조로 반복 개입하지 않도록 EMA 완화
+        for speaker in heated:
+            self.tone[speaker] /= 2
+
+        return AnalysisResult(
+            agent_name=self.name,
+            needs_intervention=True,
+            intervention_type="SENTIMENT",
+            message=message,
+            confidence=round(min(1.0, -speaker_tone + 0.3), 2),
+        )
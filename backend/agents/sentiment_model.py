@@ -0,0 +1,122 @@
+"""Local tone scorer - 감정 어휘 Aho-Corasick 매칭 + NumPy 가중합"""
+import math
+import re
+
+import numpy as np
+
+from agents.principle_matcher import AhoCorasick
+
+_NON_WORD_RE = re.compile(r"[^0-9a-z가-힣]+")
+_EXCLAMATION_RE = re.compile(r"[!?]{2,}|!")
+
+# 어휘 -> 가중치 (음수: 부정/공격적, 양수: 긍정/건설적)
+DEFAULT_TONE_LEXICON: dict[str, float] = {
+    # 공격/비난
+    "말도 안": -1.0,
+    "말이 안": -0.9,
+    "어이없": -1.0,
+    "황당": -0.9,
+    "한심": -1.2,
+    "무능": -1.2,
+    "책임져": -1.0,
+    "무슨 소리": -0.8,
+    "이해가 안": -0.6,
+    "몇 번을": -0.9,
+    "틀렸": -0.6,
+    "잘못했": -0.7,
+    "당신": -0.6,
+    "그만하": -0.8,
+    "됐고": -0.8,
+    "짜증": -1.0,
+    "답답": -0.8,
+    "화났": -0.9,
+    "열받": -0.9,
+    "실망": -0.7,
+    "최악": -1.0,
+    "제발": -0.5,
+    "왜 이렇게": -0.6,
+    "ridiculous": -1.0,
+    "stupid": -1.2,
+    "useless": -1.0,
+    "annoying": -0.8,
+    # 방어/회피
+    "제 탓": -0.6,
+    "제 잘못 아": -0.8,
+    "변명": -0.6,
+    "억울": -0.7,
+    # 긍정/건설적
+    "좋은 의견": 0.8,
+    "좋네요": 0.6,
+    "좋습니다": 0.5,
+    "감사합니다": 0.6,
+    "감사해요": 0.6,
+    "감사드": 0.6,
+    "고맙": 0.6,
+    "동의합니다": 0.5,
+    "맞아요": 0.4,
+    "훌륭": 0.8,
+    "잘했": 0.7,
+    "great": 0.6,
+    "thanks": 0.5,
+}
+
+# 뒤따르는 감정 표현을 강하게 만드는 부사
+DEFAULT_INTENSIFIERS = ("진짜", "정말", "완전", "도대체", "너무", "대체")
+
+
+def compact(text: str) -> str:
+    """
+    소문자 + 공백/문장부호 제거.
+
+    띄어쓰기 차이가 있어도 어휘 항목이 연속 부분 문자열로 그대로 남습니다.
+    """
+    return _NON_WORD_RE.sub("", text.lower())
+
+
+class ToneLexiconModel:
+    """
+    감정 어휘를 Aho-Corasick 오토마톤으로 한 번만 컴파일하고 발화 톤을 점수화.
+
+    어휘 항목이 압축된 발화에 연속 부분 문자열로 나타날 때만 걸린 것으로 봅니다.
+    ("대화가"처럼 다른 단어 안에 우연히 겹치는 짧은 항목은 어휘에 두지 않습니다)
+    """
+
+    def __init__(
+        self,
+        lexicon: dict[str, float] | None = None,
+        intensifiers: tuple[str, ...] = DEFAULT_INTENSIFIERS,
+    ):
+        lexicon = lexicon or DEFAULT_TONE_LEXICON
+        self.terms = list(lexicon)
+        self.weights = np.fromiter(lexicon.values(), dtype=np.float32, count=len(lexicon))
+
+        # 압축된 어휘 -> 항목 인덱스 (띄어쓰기만 다른 항목은 같은 패턴을 공유)
+        patterns: dict[str, list[int]] = {}
+        for row, term in enumerate(self.terms):
+            key = compact(term)
+            if key:
+                patterns.setdefault(key, []).append(row)
+        self._automaton = AhoCorasick(patterns)
+
+        self.intensifiers = tuple(i.lower() for i in intensifiers)
+
+    def matched_terms(self, text: str) -> np.ndarray:
+        """발화에 걸린 어휘 항목의 boolean 마스크"""
+        mask = np.zeros(len(self.terms), dtype=bool)
+        for _, rows in self._automaton.scan(compact(text)):
+            mask[rows] = True
+        return mask
+
+    def score(self, text: str) -> float:
+        """발화 톤 (-1.0 부정 ~ 1.0 긍정)"""
+        mask = self.matched_terms(text)
+        if not mask.any():
+            return 0.0
+
+        raw = float(self.weights[mask].sum())
+        lowered = text.lower()
+        boost = 1.0 + 0.25 * sum(lowered.count(word) for word in self.intensifiers)
+        if raw < 0:
+            # 느낌표/연속 물음표는 부정 톤만 강화
+            boost += 0.15 * len(_EXCLAMATION_RE.findall(text))
+        return math.tanh(raw * min(boost, 2.0))
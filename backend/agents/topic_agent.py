@@ -1,16 +1,46 @@
 """Topic Agent - 주제 이탈 감지"""
 import json
-from openai import OpenAI
+import logging
+import os
+from openai import AsyncOpenAI
 from agents.base_agent import BaseAgent, AnalysisResult
+from agents.topic_drift_model import AgendaTopicModel
 from models.meeting import MeetingState, TranscriptEntry
+from services.analysis_cache import AnalysisCache, get_analysis_cache
+from services.llm_client import DEFAULT_LLM_TIMEOUT, get_llm_client
+
+logger = logging.getLogger(__name__)
+
+# 주제 이탈 판정 백엔드: LLM 판정 또는 로컬 TF-IDF 유사도
+TOPIC_BACKEND_LLM = "llm"
+TOPIC_BACKEND_LOCAL = "local"
+DEFAULT_TOPIC_BACKEND = os.getenv("TOPIC_AGENT_BACKEND", TOPIC_BACKEND_LLM)
 
 
 class TopicAgent(BaseAgent):
     """주제 이탈을 감지하고 Parking Lot 처리하는 Agent"""
 
-    def __init__(self):
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        timeout: float = DEFAULT_LLM_TIMEOUT,
+        cache: AnalysisCache | None = None,
+        backend: str = DEFAULT_TOPIC_BACKEND,
+    ):
         super().__init__("TopicAgent")
-        self.client = OpenAI()
+        if backend not in (TOPIC_BACKEND_LLM, TOPIC_BACKEND_LOCAL):
+            raise ValueError(f"Unknown topic agent backend: {backend}")
+        self.backend = backend
+        self.client = client or get_llm_client()
+        self.timeout = timeout
+        self.cache = cache or get_analysis_cache()
+
+        # 로컬 백엔드 설정
+        self.local_threshold = 0.05  # 아젠다 최대 유사도가 이보다 낮으면 이탈
+        self.local_min_chars = 8  # 짧은 맞장구는 판정하지 않음
+        self.local_window = 3  # 함께 점수화하는 최근 발화 수
+        self.local_min_off_turns = 2  # 이탈로 보려면 연속으로 낮아야 하는 발화 수
+        self._topic_model: AgendaTopicModel | None = None
 
     async def analyze(
         self,
@@ -20,8 +50,33 @@ class TopicAgent(BaseAgent):
         if len(recent_transcript) < 1:
             return AnalysisResult(agent_name=self.name, needs_intervention=False)
 
+        if self.backend == TOPIC_BACKEND_LOCAL and state.agenda.strip():
+            result = await self._analyze_local(state, recent_transcript)
+        else:
+            result = await self._analyze_llm(state, recent_transcript)
+
+        if result.get("is_off_topic") and result.get("confidence", 0) > 0.7:
+            parking_lot = result.get("parking_lot_item")
+            return AnalysisResult(
+                agent_name=self.name,
+                needs_intervention=True,
+                intervention_type="TOPIC_DRIFT",
+                message=f"잠깐요, 아젠다에서 벗어났어요. 원래 주제로 돌아갈게요.{f' {parking_lot}은(는) Parking Lot에 추가했습니다.' if parking_lot else ''}",
+                confidence=result.get("confidence", 0.8),
+                parking_lot_item=parking_lot,
+            )
+
+        return AnalysisResult(agent_name=self.name, needs_intervention=False)
+
+    async def _analyze_llm(
+        self,
+        state: MeetingState,
+        recent_transcript: list[TranscriptEntry]
+    ) -> dict:
+        """gpt-4o-mini로 주제 이탈 판정"""
+        window = recent_transcript[-5:]
         transcript_text = "\n".join(
-            [f"{t.speaker}: {t.text}" for t in recent_transcript[-5:]]
+            [f"{t.speaker}: {t.text}" for t in window]
         )
 
         prompt = f"""당신은 회의 주제 이탈을 감지하는 전문가입니다.
@@ -43,23 +98,99 @@ JSON 응답:
 }}
 """
 
-        response = self.client.chat.completions.create(
-            model="gpt-4o-mini",
-            messages=[{"role": "user", "content": prompt}],
-            response_format={"type": "json_object"},
-        )
+        # 동일한 컨텍스트/발화 윈도우는 캐시된 판정 재사용
+        cache_key = self.cache.make_key(self.name, state, window)
+        result = self.cache.get(cache_key)
+        if result is None:
+            response = await self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+                timeout=self.timeout,
+            )
+            result = json.loads(response.choices[0].message.content)
+            self.cache.set(cache_key, result)
 
-        result = json.loads(response.choices[0].message.content)
+        return result
 
-        if result.get("is_off_topic") and result.get("confidence", 0) > 0.7:
-            parking_lot = result.get("parking_lot_item")
-            return AnalysisResult(
-                agent_name=self.name,
-                needs_intervention=True,
-                intervention_type="TOPIC_DRIFT",
-                message=f"잠깐요, 아젠다에서 벗어났어요. 원래 주제로 돌아갈게요.{f' {parking_lot}은(는) Parking Lot에 추가했습니다.' if parking_lot else ''}",
-                confidence=result.get("confidence", 0.8),
-                parking_lot_item=parking_lot,
+    async def _analyze_local(
+        self,
+        state: MeetingState,
+        recent_transcript: list[TranscriptEntry]
+    ) -> dict:
+        """아젠다 TF-IDF 유사도로 판정, LLM은 Parking Lot 문구 작성에만 사용"""
+        # 아젠다 벡터는 회의(아젠다)당 한 번만 생성
+        if self._topic_model is None or self._topic_model.agenda != state.agenda:
+            self._topic_model = AgendaTopicModel(state.agenda)
+
+        latest = recent_transcript[-1]
+        if len(latest.text.replace(" ", "")) < self.local_min_chars:
+            return {"is_off_topic": False}
+
+        # 최근 발화 중 아젠다와 유사도가 낮은 연속 구간 (맞장구는 건너뜀)
+        drifting: list[TranscriptEntry] = []
+        for entry in reversed(recent_transcript):
+            if len(drifting) >= self.local_window:
+                break
+            if len(entry.text.replace(" ", "")) < self.local_min_chars:
+                continue
+            if self._topic_model.similarity(entry.text) >= self.local_threshold:
+                break
+            drifting.append(entry)
+
+        if len(drifting) < self.local_min_off_turns:
+            return {"is_off_topic": False}
+
+        # 한 발화에 아젠다 단어가 없어도 구간 전체로는 주제와 맞닿을 수 있음
+        similarity = self._topic_model.similarity(" ".join(e.text for e in reversed(drifting)))
+        if similarity >= self.local_threshold:
+            return {"is_off_topic": False, "similarity": similarity}
+
+        # 신뢰도는 임계값 대비 여유와 이탈 구간 길이로 산정
+        margin = 1 - similarity / self.local_threshold
+        span = (len(drifting) - 1) / max(1, self.local_window - 1)
+        confidence = 0.6 + 0.25 * margin + 0.1 * span
+        return {
+            "is_off_topic": True,
+            "confidence": round(confidence, 3),
+            "similarity": similarity,
+            "parking_lot_item": await self._phrase_parking_lot_item(state, latest),
+        }
+
+    async def _phrase_parking_lot_item(
+        self,
+        state: MeetingState,
+        entry: TranscriptEntry
+    ) -> str:
+        """이탈한 발화를 짧은 Parking Lot 항목으로 요약"""
+        prompt = f"""회의 아젠다에서 벗어난 발화를 Parking Lot 항목으로 짧게 요약하세요.
+
+아젠다:
+{state.agenda}
+
+발화:
+{entry.text}
+
+JSON 응답:
+{{"parking_lot_item": "Parking Lot에 추가할 항목 (15자 이내)"}}
+"""
+        cache_key = self.cache.make_key(f"{self.name}:parking_lot", state, [entry])
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = await self.client.chat.completions.create(
+                model="gpt-4o-mini",
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
+                timeout=self.timeout,
             )
+            item = json.loads(response.choices[0].message.content).get("parking_lot_item")
+        except Exception as e:
+            logger.warning(f"Failed to phrase parking lot item: {e}")
+            item = None
 
-        return AnalysisResult(agent_name=self.name, needs_intervention=False)
+        item = item or entry.text[:30]
+        self.cache.set(cache_key, item)
+        return item
@@ -0,0 +1,94 @@
+"""Local topic-drift scorer - 문자 n-gram TF-IDF + NumPy 코사인 유사도"""
+import math
+import re
+from collections import Counter
+
+import numpy as np
+
+_TOKEN_RE = re.compile(r"[0-9A-Za-z가-힣]+")
+_AGENDA_SPLIT_RE = re.compile(r"[\n,;/·]+|\s-\s|^\s*[-*\d.]+\s*", re.MULTILINE)
+
+
+def char_ngram_counts(text: str, n_min: int = 2, n_max: int = 3) -> Counter:
+    """
+    단어 경계 표시를 포함한 문자 n-gram 빈도.
+
+    한글은 조사/어미가 붙어도 어간 n-gram이 겹치므로 형태소 분석기가 필요 없습니다.
+    """
+    counts: Counter = Counter()
+    for token in _TOKEN_RE.findall(text.lower()):
+        padded = f" {token} "
+        for n in range(n_min, n_max + 1):
+            for i in range(len(padded) - n + 1):
+                gram = padded[i:i + n]
+                if gram.strip():
+                    counts[gram] += 1
+    return counts
+
+
+class AgendaTopicModel:
+    """
+    아젠다 항목별 TF-IDF 벡터를 한 번만 만들고 발화와의 최대 코사인 유사도를 계산.
+
+    아젠다는 줄바꿈/쉼표 단위로 항목을 나누며, 아젠다 전체도 하나의 문서로 포함합니다.
+    """
+
+    def __init__(self, agenda: str):
+        self.agenda = agenda
+        items = [item.strip() for item in _AGENDA_SPLIT_RE.split(agenda or "")]
+        documents = [item for item in items if item]
+        if len(documents) != 1 and agenda.strip():
+            documents.append(agenda)
+
+        doc_counts = [char_ngram_counts(doc) for doc in documents]
+        self.vocabulary: dict[str, int] = {}
+        for counts in doc_counts:
+            for gram in counts:
+                self.vocabulary.setdefault(gram, len(self.vocabulary))
+
+        num_docs = len(doc_counts)
+        doc_freq = np.zeros(len(self.vocabulary), dtype=np.float32)
+        for counts in doc_counts:
+            doc_freq[[self.vocabulary[g] for g in counts]] += 1
+
+        # Smoothed IDF; unseen n-grams get the maximum weight
+        self.idf = np.log((1 + num_docs) / (1 + doc_freq)).astype(np.float32) + 1.0
+        self.unknown_idf = math.log(1 + num_docs) + 1.0
+
+        self.matrix = np.zeros((num_docs, len(self.vocabulary)), dtype=np.float32)
+        for row, counts in enumerate(doc_counts):
+            indices = [self.vocabulary[g] for g in counts]
+            self.matrix[row, indices] = np.fromiter(counts.values(), dtype=np.float32)
+        self.matrix *= self.idf
+        norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix /= norms
+
+    @property
+    def is_empty(self) -> bool:
+        return self.matrix.size == 0
+
+    def similarity(self, text: str) -> float:
+        """발화와 가장 가까운 아젠다 항목의 코사인 유사도 (0.0-1.0)"""
+        counts = char_ngram_counts(text)
+        if not counts or self.is_empty:
+            return 0.0
+
+        known_idx: list[int] = []
+        known_tf: list[float] = []
+        unknown_sq = 0.0
+        for gram, tf in counts.items():
+            idx = self.vocabulary.get(gram)
+            if idx is None:
+                unknown_sq += (tf * self.unknown_idf) ** 2
+            else:
+                known_idx.append(idx)
+                known_tf.append(tf)
+
+        if not known_idx:
+            return 0.0
+
+        weights = np.asarray(known_tf, dtype=np.float32) * self.idf[known_idx]
+        norm = math.sqrt(float(weights @ weights) + unknown_sq)
+        scores = self.matrix[:, known_idx] @ weights
+        return float(scores.max()) / norm
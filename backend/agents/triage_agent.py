@@ -1,24 +1,53 @@
 """Triage Agent - 발화 분석 및 전문 Agent로 Handoff"""
 import asyncio
+import logging
+import os
 import time
 import uuid
 from datetime import datetime
 from typing import Optional
 
+from openai import AsyncOpenAI
+
 from agents.base_agent import AnalysisResult
+from agents.decision_style_agent import DecisionStyleAgent
+from agents.fused_agent import FusedAnalysisAgent
+from agents.lexical_prefilter import LexicalPreFilter, PreFilterConfig, PreFilterDecision
 from agents.topic_agent import TopicAgent
 from agents.principle_agent import PrincipleAgent
 from agents.participation_agent import ParticipationAgent
+from agents.sentiment_agent import SentimentAgent
 from models.meeting import MeetingState, TranscriptEntry, Intervention, InterventionType
+from services.metrics import AGENT_ANALYSIS_LATENCY, PREFILTER_SKIPPED_CALLS
+
+logger = logging.getLogger(__name__)
+
+# 분석 모드: Agent별 개별 호출 또는 단일 통합 호출
+ANALYSIS_MODE_PER_AGENT = "per_agent"
+ANALYSIS_MODE_FUSED = "fused"
+DEFAULT_ANALYSIS_MODE = os.getenv("TRIAGE_ANALYSIS_MODE", ANALYSIS_MODE_PER_AGENT)
 
 
 class TriageAgent:
     """발화를 분석하고 전문 Agent들에게 병렬로 Handoff하는 Agent"""
 
-    def __init__(self):
-        self.topic_agent = TopicAgent()
-        self.principle_agent = PrincipleAgent()
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        mode: str = DEFAULT_ANALYSIS_MODE,
+        prefilter_config: PreFilterConfig | None = None,
+    ):
+        if mode not in (ANALYSIS_MODE_PER_AGENT, ANALYSIS_MODE_FUSED):
+            raise ValueError(f"Unknown triage analysis mode: {mode}")
+        self.mode = mode
+
+        self.topic_agent = TopicAgent(client=client)
+        self.principle_agent = PrincipleAgent(client=client)
         self.participation_agent = ParticipationAgent()
+        self.decision_style_agent = DecisionStyleAgent()
+        self.sentiment_agent = SentimentAgent()
+        self.fused_agent = FusedAnalysisAgent(client=client)
+        self.prefilter = LexicalPreFilter(prefilter_config)
 
         self.last_intervention_time = 0
         self.min_intervention_interval = 15  # 최소 15초 간격
@@ -38,12 +67,29 @@ class TriageAgent:
         if len(recent_transcript) < 2:
             return None
 
+        # 로컬 게이트: 명백히 무해한 윈도우는 LLM Agent 호출 생략
+        skipped_before = self.prefilter.skipped_calls
+        gate = self.prefilter.evaluate(state, recent_transcript)
+        PREFILTER_SKIPPED_CALLS.inc(self.prefilter.skipped_calls - skipped_before)
+        if gate.skipped_all:
+            logger.debug(f"Pre-filter skipped LLM agents ({gate.reason})")
+
         # 병렬 분석 실행
-        results = await asyncio.gather(
-            self.topic_agent.analyze(state, recent_transcript),
-            self.principle_agent.analyze(state, recent_transcript),
-            self.participation_agent.analyze(state, recent_transcript),
-            return_exceptions=True
+        started = time.perf_counter()
+        if self.mode == ANALYSIS_MODE_FUSED:
+            results = await self._analyze_fused(state, recent_transcript, gate)
+        else:
+            agents = [self.participation_agent, self.decision_style_agent, self.sentiment_agent]
+            if gate.run_topic:
+                agents.append(self.topic_agent)
+            if gate.run_principle:
+                agents.append(self.principle_agent)
+            results = await asyncio.gather(
+                *(self._timed(agent.name, agent.analyze(state, recent_transcript)) for agent in agents),
+                return_exceptions=True
+            )
+        logger.debug(
+            f"Triage analysis ({self.mode}) took {(time.perf_counter() - started) * 1000:.1f}ms"
         )
 
         # 결과 필터링 (에러 제외, 개입 필요한 것만)
@@ -62,6 +108,40 @@ class TriageAgent:
 
         return intervention
 
+    async def _analyze_fused(
+        self,
+        state: MeetingState,
+        recent_transcript: list[TranscriptEntry],
+        gate: PreFilterDecision
+    ) -> list:
+        """통합 LLM 호출 1회 + 로컬 Agent(Participation, DecisionStyle, Sentiment) 병렬 실행"""
+        local_agents = (self.participation_agent, self.decision_style_agent, self.sentiment_agent)
+        local_calls = [
+            self._timed(agent.name, agent.analyze(state, recent_transcript))
+            for agent in local_agents
+        ]
+        if gate.skipped_all:
+            return await asyncio.gather(*local_calls, return_exceptions=True)
+
+        fused, *local = await asyncio.gather(
+            self._timed(self.fused_agent.name, self.fused_agent.analyze(state, recent_transcript)),
+            *local_calls,
+            return_exceptions=True
+        )
+        results = list(local)
+        if isinstance(fused, list):
+            # 게이트가 명백하다고 판정한 영역의 판정만 버림 (결과 유형별)
+            gated = {"TOPIC_DRIFT": gate.run_topic, "PRINCIPLE_VIOLATION": gate.run_principle}
+            results.extend(r for r in fused if gated.get(r.intervention_type, True))
+        else:
+            logger.warning(f"Fused analysis failed: {fused}")
+        return results
+
+    async def _timed(self, agent_name: str, coro):
+        """Agent별 분석 지연 시간 기록"""
+        with AGENT_ANALYSIS_LATENCY.time(agent=agent_name):
+            return await coro
+
     def _merge_interventions(
         self,
         results: list[AnalysisResult]
@@ -70,11 +150,13 @@ class TriageAgent:
         if not results:
             return None
 
-        # 우선순위: PRINCIPLE_VIOLATION > TOPIC_DRIFT > PARTICIPATION_IMBALANCE
+        # 우선순위: PRINCIPLE_VIOLATION > DECISION_STYLE > TOPIC_DRIFT > PARTICIPATION_IMBALANCE > SENTIMENT
         priority = {
-            "PRINCIPLE_VIOLATION": 3,
-            "TOPIC_DRIFT": 2,
-            "PARTICIPATION_IMBALANCE": 1,
+            "PRINCIPLE_VIOLATION": 5,
+            "DECISION_STYLE": 4,
+            "TOPIC_DRIFT": 3,
+            "PARTICIPATION_IMBALANCE": 2,
+            "SENTIMENT": 1,
         }
 
         # 우선순위 + 신뢰도로 정렬
@@ -3,6 +3,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Optional
 
+from models.speaker_stats import SpeakerStatsEngine
+
 
 class MeetingStatus(Enum):
     PREPARING = "preparing"
@@ -15,6 +17,7 @@ class InterventionType(Enum):
     PRINCIPLE_VIOLATION = "PRINCIPLE_VIOLATION"
     PARTICIPATION_IMBALANCE = "PARTICIPATION_IMBALANCE"
     DECISION_STYLE = "DECISION_STYLE"
+    SENTIMENT = "SENTIMENT"
 
 
 @dataclass
@@ -64,3 +67,70 @@ class MeetingState:
 
     started_at: Optional[datetime] = None
     ended_at: Optional[datetime] = None
+
+    speaker_stats: SpeakerStatsEngine = field(init=False, repr=False, compare=False)
+
+    # 화자 정정이 일어난 발화의 transcript 인덱스 (정정 순서대로, 증분 조회용)
+    speaker_updates: list[int] = field(default_factory=list, init=False, compare=False)
+
+    # 변경 시마다 증가하는 버전과 해당 버전의 직렬화 결과 캐시
+    version: int = field(default=0, init=False, compare=False)
+    _serialized: Optional[tuple[tuple[int, int], bytes]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self):
+        self.speaker_stats = SpeakerStatsEngine(self.participants)
+
+    @property
+    def revision(self) -> tuple[int, int]:
+        """회의 버전 + 발언 통계 버전 (통계는 시간 경과로도 바뀜)"""
+        return (self.version, self.speaker_stats.version)
+
+    def touch(self) -> None:
+        """변경을 기록하고 직렬화 캐시를 무효화"""
+        self.version += 1
+        self._serialized = None
+
+    def add_transcript(self, entry: TranscriptEntry) -> None:
+        self.transcript.append(entry)
+        self.touch()
+
+    def reassign_speaker(self, entry_id: str, speaker: str) -> Optional[str]:
+        """발화의 화자를 정정하고 통계를 소급 조정 (이전 화자 반환, 변경 없으면 None)"""
+        for index in range(len(self.transcript) - 1, -1, -1):
+            entry = self.transcript[index]
+            if entry.id != entry_id:
+                continue
+            previous = entry.speaker
+            if previous == speaker:
+                return None
+            entry.speaker = speaker
+            self.speaker_stats.reassign_utterance(entry_id, previous, speaker, entry.duration)
+            self.speaker_updates.append(index)
+            self.touch()
+            return previous
+        return None
+
+    def add_intervention(self, intervention: Intervention) -> None:
+        self.interventions.append(intervention)
+        if intervention.parking_lot_item:
+            self.parking_lot.append(intervention.parking_lot_item)
+        self.touch()
+
+    def set_status(self, status: MeetingStatus) -> None:
+        self.status = status
+        if status == MeetingStatus.IN_PROGRESS:
+            self.started_at = datetime.utcnow()
+        elif status == MeetingStatus.COMPLETED:
+            self.ended_at = datetime.utcnow()
+        self.touch()
+
+    def cached_json(self) -> Optional[bytes]:
+        """현재 revision의 직렬화 결과 (없거나 오래되었으면 None)"""
+        if self._serialized is not None and self._serialized[0] == self.revision:
+            return self._serialized[1]
+        return None
+
+    def cache_json(self, data: bytes) -> None:
+        self._serialized = (self.revision, data)
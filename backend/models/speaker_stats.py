@@ -0,0 +1,187 @@
+"""Incremental per-meeting speaker statistics."""
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from models.meeting import Participant
+
+DEFAULT_STATS_WINDOW = 300.0  # seconds (최근 5분)
+
+
+class SpeakerStatsEngine:
+    """
+    O(1) per-utterance speaker statistics for one meeting.
+
+    Keeps a name -> participant index, cumulative counts and speaking time,
+    and sliding-window counts over the last ``window_seconds``. Consumers
+    read precomputed snapshots instead of rescanning participants.
+    """
+
+    def __init__(
+        self,
+        participants: Optional[list["Participant"]] = None,
+        window_seconds: float = DEFAULT_STATS_WINDOW,
+    ):
+        self.window_seconds = window_seconds
+        # Shares the meeting's participant list so both views stay in sync
+        self._participants: list["Participant"] = participants if participants is not None else []
+        self._index: dict[str, "Participant"] = {}
+
+        self.total_count = 0
+        self.total_speaking_time = 0.0
+
+        # (monotonic time, speaker name, duration, transcript entry id) within the window
+        self._window: deque[tuple[float, str, float, Optional[str]]] = deque()
+        self._window_counts: dict[str, int] = {}
+        self._window_total = 0
+
+        self._snapshot: Optional[dict] = None
+        self.version = 0
+
+        for p in self._participants:
+            self._register(p)
+
+    @property
+    def participants(self) -> list["Participant"]:
+        return self._participants
+
+    def add_participant(self, participant: "Participant") -> None:
+        """Add a participant joining mid-meeting."""
+        if participant.name in self._index:
+            return
+        self._participants.append(participant)
+        self._register(participant)
+
+    def _register(self, participant: "Participant") -> None:
+        """Index a participant, folding in any counts it already carries."""
+        self._index.setdefault(participant.name, participant)
+        self.total_count += participant.speaking_count
+        self.total_speaking_time += participant.speaking_time
+        self._invalidate()
+
+    def get_participant(self, name: str) -> Optional["Participant"]:
+        return self._index.get(name)
+
+    def record_utterance(
+        self,
+        name: str,
+        duration: float = 0.0,
+        at: Optional[float] = None,
+        entry_id: Optional[str] = None,
+    ) -> Optional["Participant"]:
+        """Count one utterance (and its VAD duration) for ``name``; ``entry_id`` allows later reassignment."""
+        participant = self._index.get(name)
+        if participant is None:
+            return None
+
+        now = time.monotonic() if at is None else at
+        participant.speaking_count += 1
+        participant.speaking_time += duration
+        self.total_count += 1
+        self.total_speaking_time += duration
+
+        self._window.append((now, name, duration, entry_id))
+        self._window_counts[name] = self._window_counts.get(name, 0) + 1
+        self._window_total += 1
+
+        self._expire(now)
+        self._invalidate()
+        return participant
+
+    def reassign_utterance(
+        self,
+        entry_id: str,
+        old_name: str,
+        new_name: str,
+        duration: float = 0.0,
+    ) -> bool:
+        """Move the utterance recorded as ``entry_id`` (and its duration) from ``old_name`` to ``new_name``."""
+        if old_name == new_name:
+            return False
+        old = self._index.get(old_name)
+        new = self._index.get(new_name)
+        if old is not None:
+            old.speaking_count = max(0, old.speaking_count - 1)
+            old.speaking_time = max(0.0, old.speaking_time - duration)
+            self.total_count -= 1
+            self.total_speaking_time -= duration
+        if new is not None:
+            new.speaking_count += 1
+            new.speaking_time += duration
+            self.total_count += 1
+            self.total_speaking_time += duration
+
+        # Relabel the utterance's window entry (if not yet expired) so recent shares follow too
+        for i in range(len(self._window) - 1, -1, -1):
+            at, name, entry_duration, window_entry_id = self._window[i]
+            if window_entry_id == entry_id and name == old_name:
+                self._window_counts[old_name] -= 1
+                if new is not None:
+                    self._window[i] = (at, new_name, entry_duration, entry_id)
+                    self._window_counts[new_name] = self._window_counts.get(new_name, 0) + 1
+                else:
+                    del self._window[i]
+                    self._window_total -= 1
+                break
+        self._invalidate()
+        return True
+
+    def add_speaking_time(self, name: str, seconds: float) -> Optional["Participant"]:
+        """Credit speaking time measured outside utterances (e.g. per-participant audio tracks)."""
+        participant = self._index.get(name)
+        if participant is None or seconds <= 0:
+            return None
+        participant.speaking_time += seconds
+        self.total_speaking_time += seconds
+        self._invalidate()
+        return participant
+
+    def window_count(self, name: str, now: Optional[float] = None) -> int:
+        self._expire(time.monotonic() if now is None else now)
+        return self._window_counts.get(name, 0)
+
+    def window_total(self, now: Optional[float] = None) -> int:
+        self._expire(time.monotonic() if now is None else now)
+        return self._window_total
+
+    def _expire(self, now: float) -> None:
+        """Drop window entries older than ``window_seconds`` (amortized O(1))."""
+        cutoff = now - self.window_seconds
+        expired = False
+        while self._window and self._window[0][0] < cutoff:
+            _, name, _, _ = self._window.popleft()
+            self._window_counts[name] -= 1
+            self._window_total -= 1
+            expired = True
+        if expired:
+            self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._snapshot = None
+        self.version += 1
+
+    def snapshot(self, now: Optional[float] = None) -> dict:
+        """
+        Per-speaker statistics keyed by name.
+
+        Each entry has ``percentage``, ``speakingTime`` and ``count`` (cumulative)
+        plus ``recentCount`` and ``recentPercentage`` (sliding window).
+        """
+        self._expire(time.monotonic() if now is None else now)
+        if self._snapshot is not None:
+            return self._snapshot
+
+        total = self.total_count
+        window_total = self._window_total
+        self._snapshot = {}
+        for p in self._participants:
+            recent = self._window_counts.get(p.name, 0)
+            self._snapshot[p.name] = {
+                "percentage": round(p.speaking_count / total * 100, 1) if total > 0 else 0.0,
+                "speakingTime": round(p.speaking_time, 2),
+                "count": p.speaking_count,
+                "recentCount": recent,
+                "recentPercentage": round(recent / window_total * 100, 1) if window_total > 0 else 0.0,
+            }
+        return self._snapshot
@@ -1,12 +1,17 @@
 import asyncio
+import base64
+import binascii
+import hashlib
 import json
 import logging
 import os
 import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Dict
+from typing import Callable, Dict, Optional
 
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
+from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse
 
 # Configure logging
 logging.basicConfig(
@@ -16,6 +21,7 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
+from pydantic_core import to_json
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -27,9 +33,37 @@ from services.realtime_stt_service import (
     STTConnectionError,
     STTConfigurationError,
     ConnectionState,
+    AudioOverflowPolicy,
+)
+from services.llm_client import close_llm_client
+from services.metrics import (
+    REGISTRY,
+    ACTIVE_MEETINGS,
+    WEBSOCKET_SLOW_CONSUMERS,
+    WEBSOCKET_SUBSCRIBERS,
+    AUDIO_CHUNKS_DROPPED,
+    AUDIO_CHUNKS_IN,
+    INTERVENTIONS,
+    WEBSOCKET_SEND_LATENCY,
+)
+from services.diarization_service import DiarizationResult, SpeakerDiarizer
+from services.silence_suppressor import SilenceSuppressor
+from services.track_mixer import TrackMixer
+from services.speaker_service import (
+    DEFAULT_SPEAKER_ID_MODE,
+    SPEAKER_ID_MODE_ASYNC,
+    SPEAKER_ID_MODE_SYNC,
+    SpeakerService,
+)
+from services.meeting_store import create_meeting_store
+from services.storage_service import (
+    StorageService,
+    close_all_journals,
+    intervention_record,
+    speaker_update_record,
+    speaking_time_record,
+    transcript_record,
 )
-from services.speaker_service import SpeakerService
-from services.storage_service import StorageService
 from services.principles_service import (
     PrinciplesService,
     Principle,
@@ -40,7 +74,21 @@ from services.principles_service import (
 )
 from agents.triage_agent import TriageAgent
 
-app = FastAPI(title="MeetingMod API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Relay client messages published by other workers to our subscribers
+    meetings.on_message(manager.deliver_local)
+    await meetings.start()
+    yield
+    await meetings.close()
+    # Release pooled LLM connections shared by all meetings
+    await close_llm_client()
+    # Make sure buffered journal records reach disk
+    await close_all_journals()
+
+
+app = FastAPI(title="MeetingMod API", lifespan=lifespan)
 
 # Get CORS origins from environment variable, default to localhost:3000
 cors_origins_str = os.getenv("CORS_ORIGINS", "http://localhost:3000")
@@ -54,8 +102,12 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# In-memory state store
-meetings: Dict[str, MeetingState] = {}
+# Meeting state store: in-memory per process (rehydrated lazily from snapshot +
+# journal) or SQLite shared across uvicorn workers (MEETING_STORE=sqlite)
+meetings = create_meeting_store()
+
+# Log only every Nth audio chunk at INFO; per-chunk detail stays at DEBUG
+AUDIO_LOG_SAMPLE_EVERY = int(os.getenv("AUDIO_LOG_SAMPLE_EVERY", "100"))
 
 
 class CreateMeetingRequest(BaseModel):
@@ -123,6 +175,13 @@ class SpeakerStatsEntry(BaseModel):
     percentage: float
     speakingTime: float
     count: int
+    recentCount: int = 0
+    recentPercentage: float = 0.0
+
+
+class SpeakerUpdateResponse(BaseModel):
+    id: str
+    speaker: str
 
 
 class MeetingResponse(BaseModel):
@@ -138,6 +197,8 @@ class MeetingResponse(BaseModel):
     speakerStats: dict[str, SpeakerStatsEntry]
     startedAt: str | None
     endedAt: str | None
+    speakerUpdates: list[SpeakerUpdateResponse] = []
+    cursor: str | None = None
 
 
 class MeetingStartResponse(BaseModel):
@@ -155,6 +216,14 @@ async def health_check():
     return {"status": "ok"}
 
 
+@app.get("/api/v1/metrics", response_class=PlainTextResponse)
+async def metrics():
+    """Prometheus text exposition of the live meeting pipeline metrics."""
+    return PlainTextResponse(
+        REGISTRY.render(), media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
 from fastapi.responses import HTMLResponse
 
 @app.get("/test", response_class=HTMLResponse)
@@ -169,20 +238,19 @@ async def test_page():
 
 @app.post("/api/v1/meetings")
 async def create_meeting(request: CreateMeetingRequest):
-    meeting_id = f"{datetime.now().strftime('%Y-%m-%d')}-{request.title.lower().replace(' ', '-')}"
+    storage = StorageService()
+    # 같은 날 같은 제목의 회의는 새 ID로 (이전 회의의 journal에 이어 쓰지 않도록)
+    meeting_id = storage.create_meeting_dir(
+        f"{datetime.now().strftime('%Y-%m-%d')}-{request.title.lower().replace(' ', '-')}"
+    )
 
     participants = [
         Participant(id=p.get("id", str(uuid.uuid4())), name=p["name"], role=p["role"])
         for p in request.participants
     ]
 
-    # 원칙 로드 (간단히 하드코딩)
-    principles = []
-    if "agile" in request.principleIds:
-        principles.append({"id": "agile", "name": "수평적 의사결정"})
-        principles.append({"id": "agile", "name": "타임박스"})
-    if "aws-leadership" in request.principleIds:
-        principles.append({"id": "aws", "name": "Disagree and Commit"})
+    # 선택한 원칙 문서의 규칙 목록 (캐시된 인덱스에서 조회)
+    principles = principles_service.get_meeting_principles(request.principleIds)
 
     state = MeetingState(
         meeting_id=meeting_id,
@@ -192,97 +260,193 @@ async def create_meeting(request: CreateMeetingRequest):
         principles=principles,
     )
 
-    meetings[meeting_id] = state
+    await meetings.put(state)
 
-    storage = StorageService()
     await storage.save_preparation(state)
+    await storage.save_snapshot(state)
 
     return {"id": meeting_id, "status": "preparing"}
 
 
-def _build_speaker_stats(state: MeetingState) -> dict[str, SpeakerStatsEntry]:
-    """Build speaker statistics from meeting state."""
-    total = sum(p.speaking_count for p in state.participants)
-    stats = {}
-    for p in state.participants:
-        percentage = round(p.speaking_count / total * 100, 1) if total > 0 else 0.0
-        stats[p.name] = SpeakerStatsEntry(
-            percentage=percentage,
-            speakingTime=p.speaking_time,
-            count=p.speaking_count,
-        )
-    return stats
+def _meeting_cursor(state: MeetingState) -> str:
+    """Opaque position after the latest transcript entry, intervention and speaker update."""
+    return f"{len(state.transcript)}.{len(state.interventions)}.{len(state.speaker_updates)}"
 
 
-def _meeting_state_to_response(state: MeetingState) -> MeetingResponse:
-    """Convert MeetingState dataclass to MeetingResponse."""
-    participants = [
-        ParticipantResponse(
-            id=p.id,
-            name=p.name,
-            role=p.role,
-            speakingTime=p.speaking_time,
-            speakingCount=p.speaking_count,
-        )
-        for p in state.participants
-    ]
+def _parse_cursor(cursor: str) -> tuple[int, int, int]:
+    """Parse a cursor; two-part cursors from older responses replay every speaker update."""
+    try:
+        positions = [int(part) for part in cursor.split(".")]
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+    if len(positions) == 2:
+        positions.append(0)
+    if len(positions) != 3 or any(pos < 0 for pos in positions):
+        raise HTTPException(status_code=400, detail=f"Invalid cursor: {cursor}")
+    transcript_pos, intervention_pos, update_pos = positions
+    return transcript_pos, intervention_pos, update_pos
+
+
+def _speaker_updates_since(state: MeetingState, transcript_pos: int, update_pos: int) -> list[dict]:
+    """
+    Speaker corrections a client at the given cursor has not seen yet.
 
-    transcript = [
-        TranscriptEntryResponse(
-            id=t.id,
-            timestamp=t.timestamp,
-            speaker=t.speaker,
-            text=t.text,
-            duration=t.duration,
-            confidence=t.confidence,
-        )
-        for t in state.transcript
+    Only entries before ``transcript_pos`` are listed; later entries are sent
+    in full with their current speaker. Each entry appears once.
+    """
+    indices = dict.fromkeys(
+        index for index in state.speaker_updates[update_pos:] if index < transcript_pos
+    )
+    return [
+        {"id": state.transcript[index].id, "speaker": state.transcript[index].speaker}
+        for index in indices
     ]
 
-    interventions = [
-        InterventionResponse(
-            id=i.id,
-            timestamp=i.timestamp,
-            type=i.intervention_type.value,
-            message=i.message,
-            triggerContext=i.trigger_context,
-            violatedPrinciple=i.violated_principle,
-            parkingLotItem=i.parking_lot_item,
-            suggestedSpeaker=i.suggested_speaker,
-        )
-        for i in state.interventions
-    ]
 
-    return MeetingResponse(
-        id=state.meeting_id,
-        title=state.title,
-        status=state.status.value,
-        agenda=state.agenda,
-        principles=state.principles,
-        participants=participants,
-        transcript=transcript,
-        interventions=interventions,
-        parkingLot=state.parking_lot,
-        speakerStats=_build_speaker_stats(state),
-        startedAt=state.started_at.isoformat() if state.started_at else None,
-        endedAt=state.ended_at.isoformat() if state.ended_at else None,
+def _meeting_etag(state: MeetingState) -> str:
+    """
+    Weak ETag from values every worker sharing the store agrees on.
+
+    Metadata changes are covered by the store's shared metadata version and
+    the status; transcript entries, interventions and speaker corrections
+    only grow, so their counts cover the rest. Speaker stats also move with
+    time (recent window), so their per-participant snapshot is hashed in.
+    Nothing proportional to the meeting's length is serialized.
+    """
+    key = json.dumps(
+        [
+            state.meeting_id,
+            meetings.meta_version(state.meeting_id),
+            state.status.value,
+            len(state.transcript),
+            len(state.interventions),
+            len(state.speaker_updates),
+            state.speaker_stats.snapshot(),
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
     )
+    return f'W/"{hashlib.blake2b(key.encode("utf-8"), digest_size=12).hexdigest()}"'
+
+
+def _meeting_state_to_dict(
+    state: MeetingState,
+    transcript_pos: int = 0,
+    intervention_pos: int = 0,
+    update_pos: int = 0,
+) -> dict:
+    """Build the MeetingResponse payload as plain dicts, starting lists at the given positions."""
+    return {
+        "id": state.meeting_id,
+        "title": state.title,
+        "status": state.status.value,
+        "agenda": state.agenda,
+        "principles": state.principles,
+        "participants": [
+            {
+                "id": p.id,
+                "name": p.name,
+                "role": p.role,
+                "speakingTime": p.speaking_time,
+                "speakingCount": p.speaking_count,
+            }
+            for p in state.participants
+        ],
+        "transcript": [
+            {
+                "id": t.id,
+                "timestamp": t.timestamp,
+                "speaker": t.speaker,
+                "text": t.text,
+                "duration": t.duration,
+                "confidence": t.confidence,
+            }
+            for t in state.transcript[transcript_pos:]
+        ],
+        "interventions": [
+            {
+                "id": i.id,
+                "timestamp": i.timestamp,
+                "type": i.intervention_type.value,
+                "message": i.message,
+                "triggerContext": i.trigger_context,
+                "violatedPrinciple": i.violated_principle,
+                "parkingLotItem": i.parking_lot_item,
+                "suggestedSpeaker": i.suggested_speaker,
+            }
+            for i in state.interventions[intervention_pos:]
+        ],
+        "parkingLot": state.parking_lot,
+        "speakerStats": state.speaker_stats.snapshot(),
+        "startedAt": state.started_at.isoformat() if state.started_at else None,
+        "endedAt": state.ended_at.isoformat() if state.ended_at else None,
+        "speakerUpdates": _speaker_updates_since(state, transcript_pos, update_pos),
+        "cursor": _meeting_cursor(state),
+    }
+
+
+def _meeting_json(
+    state: MeetingState,
+    transcript_pos: int = 0,
+    intervention_pos: int = 0,
+    update_pos: int = 0,
+) -> bytes:
+    """
+    Serialized MeetingResponse.
+
+    The full response is cached on the state for its current revision, so
+    repeated GETs of an unchanged meeting are served without re-encoding.
+    Incremental (``since``) responses are small and encoded per request.
+    """
+    full = transcript_pos == 0 and intervention_pos == 0
+    if full:
+        cached = state.cached_json()
+        if cached is not None:
+            return cached
+
+    data = to_json(_meeting_state_to_dict(state, transcript_pos, intervention_pos, update_pos))
+    if full:
+        state.cache_json(data)
+    return data
 
 
 @app.get("/api/v1/meetings/{meeting_id}", response_model=MeetingResponse)
-async def get_meeting(meeting_id: str):
-    """Get meeting details by ID."""
-    state = meetings.get(meeting_id)
+async def get_meeting(
+    meeting_id: str,
+    request: Request,
+    since: str | None = None,
+):
+    """
+    Get meeting details by ID.
+
+    With ``since`` (the ``cursor`` of an earlier response) only transcript
+    entries and interventions added after it are returned, plus
+    ``speakerUpdates`` for earlier entries whose speaker was corrected since
+    then. Responses carry
+    an ETag; a matching If-None-Match returns 304 without a body.
+    """
+    state = await meetings.get(meeting_id)
     if not state:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
-    return _meeting_state_to_response(state)
+    transcript_pos, intervention_pos, update_pos = _parse_cursor(since) if since else (0, 0, 0)
+
+    etag = _meeting_etag(state)
+    if_none_match = request.headers.get("if-none-match", "")
+    if if_none_match == "*" or etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=_meeting_json(state, transcript_pos, intervention_pos, update_pos),
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @app.post("/api/v1/meetings/{meeting_id}/start", response_model=MeetingStartResponse)
 async def start_meeting(meeting_id: str):
     """Start a meeting - changes status to IN_PROGRESS and sets startedAt timestamp."""
-    state = meetings.get(meeting_id)
+    state = await meetings.get(meeting_id)
     if not state:
         raise HTTPException(status_code=404, detail="Meeting not found")
 
@@ -292,8 +456,9 @@ async def start_meeting(meeting_id: str):
     if state.status == MeetingStatus.COMPLETED:
         raise HTTPException(status_code=400, detail="Meeting has already completed")
 
-    state.status = MeetingStatus.IN_PROGRESS
-    state.started_at = datetime.utcnow()
+    state.set_status(MeetingStatus.IN_PROGRESS)
+    await meetings.save_meta(state)
+    await StorageService().save_snapshot(state)
 
     return MeetingStartResponse(
         id=state.meeting_id,
@@ -302,27 +467,54 @@ async def start_meeting(meeting_id: str):
     )
 
 
-@app.post("/api/v1/meetings/{meeting_id}/end")
-async def end_meeting(meeting_id: str):
-    state = meetings.get(meeting_id)
-    if not state:
-        return {"error": "Meeting not found"}
+async def _complete_meeting(state: MeetingState) -> None:
+    """Stop the meeting's live pipeline, mark it completed and write the final files."""
+    # 파이프라인이 journal에 더 쓰지 않게 된 뒤에 렌더링하고 닫음
+    await pipelines.shutdown(state.meeting_id)
 
-    state.status = MeetingStatus.COMPLETED
-    state.ended_at = datetime.utcnow()
+    state.set_status(MeetingStatus.COMPLETED)
+    await meetings.save_meta(state)
 
     storage = StorageService()
     await storage.save_transcript(state)
     await storage.save_interventions(state)
+    await storage.save_snapshot(state)
+    await storage.close_journal(state.meeting_id)
+    await meetings.enforce_limits()
+
+
+@app.post("/api/v1/meetings/{meeting_id}/end")
+async def end_meeting(meeting_id: str):
+    state = await meetings.get(meeting_id)
+    if not state:
+        return {"error": "Meeting not found"}
+
+    await _complete_meeting(state)
 
     return {"id": meeting_id, "status": "completed"}
 
 
 @app.post("/api/v1/meetings/{meeting_id}/save")
 async def save_meeting(meeting_id: str, request: SaveMeetingRequest):
-    """데모 모드에서 프론트엔드 데이터를 저장"""
+    """
+    회의 종료 시 저장.
+
+    서버가 기록 중인 회의(실행 중인 파이프라인이나 기록된 발화가 있음)는 서버 기록으로
+    종료하고, 그렇지 않은 데모 회의만 프론트엔드 데이터로 저장합니다.
+    """
     from models.meeting import Intervention, InterventionType
 
+    files = {"id": meeting_id, "status": "saved", "files": [
+        f"meetings/{meeting_id}/preparation.md",
+        f"meetings/{meeting_id}/transcript.md",
+        f"meetings/{meeting_id}/interventions.md",
+    ]}
+
+    live = await meetings.get(meeting_id)
+    if live is not None and (pipelines.get(meeting_id) is not None or live.transcript):
+        await _complete_meeting(live)
+        return files
+
     participants = [
         Participant(id=p.get("id", str(uuid.uuid4())), name=p["name"], role=p["role"])
         for p in request.participants
@@ -357,21 +549,28 @@ async def save_meeting(meeting_id: str, request: SaveMeetingRequest):
         participants=participants,
         transcript=transcript,
         interventions=interventions,
+        principles=live.principles if live is not None else [],
         status=MeetingStatus.COMPLETED,
         started_at=datetime.utcnow(),
         ended_at=datetime.utcnow(),
     )
 
+    # 조회 API가 저장된 데모 회의를 보도록 저장소 항목부터 교체
+    # (기존 항목을 잡고 있는 WebSocket이 파이프라인을 다시 시작하지 않도록 완료 처리)
+    if live is not None:
+        live.set_status(MeetingStatus.COMPLETED)
+    await meetings.put(state)
+
     storage = StorageService()
     await storage.save_preparation(state)
+    await storage.journal_state(state)
     await storage.save_transcript(state)
     await storage.save_interventions(state)
+    await storage.save_snapshot(state)
+    await storage.close_journal(meeting_id)
+    await meetings.enforce_limits()
 
-    return {"id": meeting_id, "status": "saved", "files": [
-        f"meetings/{meeting_id}/preparation.md",
-        f"meetings/{meeting_id}/transcript.md",
-        f"meetings/{meeting_id}/interventions.md",
-    ]}
+    return files
 
 
 # ============================================================================
@@ -436,7 +635,7 @@ async def update_principle(principle_id: str, update: PrincipleUpdate):
         404: If the principle is not found.
         400: If the update failed.
     """
-    updated = principles_service.update_principle(principle_id, update)
+    updated = await asyncio.to_thread(principles_service.update_principle, principle_id, update)
     if not updated:
         # Check if the principle exists
         existing = principles_service.get_principle(principle_id)
@@ -466,7 +665,7 @@ async def create_principle(create: PrincipleCreate):
     Raises:
         400: If the principle creation failed.
     """
-    result = principles_service.create_principle(create)
+    result = await asyncio.to_thread(principles_service.create_principle, create)
     if not result:
         raise HTTPException(
             status_code=400,
@@ -480,116 +679,510 @@ async def create_principle(create: PrincipleCreate):
 # ============================================================================
 
 
+# WebSocket subprotocol for raw binary PCM16 audio frames.
+# Clients that do not offer it keep sending base64 audio inside JSON.
+AUDIO_SUBPROTOCOL = "meetingmod.pcm16"
+# Multi-track variant: each binary frame starts with a uint16 LE track id
+# registered beforehand with a {"type": "track"} control message.
+AUDIO_TRACKS_SUBPROTOCOL = "meetingmod.pcm16.tracks"
+TRACK_HEADER_BYTES = 2
+
+
+# Per-subscriber outbound queue bound and the longest a single send may take
+SUBSCRIBER_QUEUE_MAX = int(os.getenv("WS_SUBSCRIBER_QUEUE_MAX", "256"))
+SUBSCRIBER_SEND_TIMEOUT = float(os.getenv("WS_SUBSCRIBER_SEND_TIMEOUT", "5.0"))
+
+# Close code for subscribers that cannot keep up ("Try Again Later")
+SLOW_CONSUMER_CLOSE_CODE = 1013
+# Close code for a WebSocket opened on a meeting that does not exist
+MEETING_NOT_FOUND_CLOSE_CODE = 4404
+
+# Coalescing window for transcript/speaker_stats updates sent to clients
+OUTBOUND_TICK_SECONDS = float(os.getenv("WS_OUTBOUND_TICK_MS", "100")) / 1000
+
+
+class Subscriber:
+    """
+    One WebSocket viewing a meeting.
+
+    Outbound messages go through a bounded queue drained by a dedicated
+    writer task, so a slow client never blocks the meeting pipeline. A
+    client whose queue overflows or whose send stalls past the timeout is
+    disconnected.
+    """
+
+    def __init__(
+        self,
+        meeting_id: str,
+        websocket: WebSocket,
+        max_queue: int = SUBSCRIBER_QUEUE_MAX,
+        send_timeout: float = SUBSCRIBER_SEND_TIMEOUT,
+    ):
+        self.meeting_id = meeting_id
+        self.websocket = websocket
+        self.send_timeout = send_timeout
+        self.queue: asyncio.Queue[tuple[str, str]] = asyncio.Queue(maxsize=max_queue)
+        self.closed = False
+        self._writer = asyncio.create_task(self._run())
+        self._close_task: asyncio.Task | None = None
+
+    def offer(self, message_type: str, payload: str) -> bool:
+        """Queue an encoded message without waiting; overflow drops the subscriber."""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait((message_type, payload))
+            return True
+        except asyncio.QueueFull:
+            self._drop("queue_full")
+            return False
+
+    async def _run(self):
+        try:
+            while True:
+                message_type, payload = await self.queue.get()
+                with WEBSOCKET_SEND_LATENCY.time(type=message_type):
+                    await asyncio.wait_for(self.websocket.send_text(payload), self.send_timeout)
+        except asyncio.TimeoutError:
+            self._drop("send_timeout")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Socket already gone; the receive loop cleans up
+            logger.debug(f"[{self.meeting_id}] Subscriber writer stopped: {e}")
+            self.closed = True
+
+    def _drop(self, reason: str):
+        if self.closed:
+            return
+        self.closed = True
+        WEBSOCKET_SLOW_CONSUMERS.inc(reason=reason)
+        logger.warning(f"[{self.meeting_id}] Disconnecting slow WebSocket subscriber ({reason})")
+        self._close_task = asyncio.create_task(self._close())
+
+    async def _close(self):
+        self._writer.cancel()
+        try:
+            await self.websocket.close(code=SLOW_CONSUMER_CLOSE_CODE)
+        except Exception:
+            pass
+
+    def stop(self):
+        self.closed = True
+        self._writer.cancel()
+
+
+class OutboundScheduler:
+    """
+    Coalesces one meeting's outbound updates into at most one frame per tick.
+
+    Transcript entries queued within a tick are batched together and the
+    speaker stats snapshot is computed once, at flush time, so only the
+    latest stats are sent. ``send_now`` (interventions, errors) flushes any
+    pending updates first to keep ordering, then sends immediately.
+    """
+
+    def __init__(self, manager: "ConnectionManager", meeting_id: str, tick: float = OUTBOUND_TICK_SECONDS):
+        self.manager = manager
+        self.meeting_id = meeting_id
+        self.tick = tick
+        self._transcripts: list[dict] = []
+        self._stats_source: Callable[[], dict] | None = None
+        self._pending = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    def queue_transcript(self, data: dict):
+        self._transcripts.append(data)
+        self._pending.set()
+
+    def queue_stats(self, source: Callable[[], dict]):
+        """Mark stats dirty; ``source`` is only called when the tick flushes."""
+        self._stats_source = source
+        self._pending.set()
+
+    async def send_now(self, message: dict):
+        await self.flush()
+        await self.manager.broadcast(self.meeting_id, message)
+
+    async def flush(self):
+        self._pending.clear()
+        messages = [{"type": "transcript", "data": data} for data in self._transcripts]
+        self._transcripts = []
+        if self._stats_source is not None:
+            messages.append({"type": "speaker_stats", "data": {"stats": self._stats_source()}})
+            self._stats_source = None
+
+        if len(messages) == 1:
+            await self.manager.broadcast(self.meeting_id, messages[0])
+        elif messages:
+            await self.manager.broadcast(
+                self.meeting_id, {"type": "batch", "data": {"messages": messages}}
+            )
+
+    async def _run(self):
+        while True:
+            await self._pending.wait()
+            # Let updates arriving within the tick join this frame
+            await asyncio.sleep(self.tick)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"[{self.meeting_id}] Outbound flush failed: {e}", exc_info=True)
+
+    def stop(self):
+        self._task.cancel()
+
+
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
+        self.active_connections: Dict[str, set[Subscriber]] = {}
+        self.schedulers: Dict[str, OutboundScheduler] = {}
+
+    async def connect(
+        self, meeting_id: str, websocket: WebSocket, subprotocol: str | None = None
+    ) -> Subscriber:
+        await websocket.accept(subprotocol=subprotocol)
+        subscriber = Subscriber(meeting_id, websocket)
+        if meeting_id not in self.active_connections:
+            self.active_connections[meeting_id] = set()
+            self.schedulers[meeting_id] = OutboundScheduler(self, meeting_id)
+            ACTIVE_MEETINGS.inc()
+        self.active_connections[meeting_id].add(subscriber)
+        WEBSOCKET_SUBSCRIBERS.inc()
+        return subscriber
+
+    def disconnect(self, meeting_id: str, subscriber: Subscriber):
+        subscribers = self.active_connections.get(meeting_id)
+        if not subscribers or subscriber not in subscribers:
+            return
+        subscriber.stop()
+        subscribers.discard(subscriber)
+        WEBSOCKET_SUBSCRIBERS.dec()
+        if not subscribers:
+            del self.active_connections[meeting_id]
+            self.schedulers.pop(meeting_id).stop()
+            ACTIVE_MEETINGS.dec()
 
-    async def connect(self, meeting_id: str, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections[meeting_id] = websocket
+    def queue_transcript(self, meeting_id: str, data: dict):
+        """Send with the next coalesced frame."""
+        scheduler = self.schedulers.get(meeting_id)
+        if scheduler is not None:
+            scheduler.queue_transcript(data)
 
-    def disconnect(self, meeting_id: str):
-        if meeting_id in self.active_connections:
-            del self.active_connections[meeting_id]
+    def queue_speaker_stats(self, meeting_id: str, source: Callable[[], dict]):
+        """Send the latest stats with the next coalesced frame."""
+        scheduler = self.schedulers.get(meeting_id)
+        if scheduler is not None:
+            scheduler.queue_stats(source)
 
     async def send_message(self, meeting_id: str, message: dict):
-        if meeting_id in self.active_connections:
-            await self.active_connections[meeting_id].send_json(message)
+        """Send immediately, after any updates still pending for the current tick."""
+        scheduler = self.schedulers.get(meeting_id)
+        if scheduler is not None:
+            await scheduler.send_now(message)
+
+    async def broadcast(self, meeting_id: str, message: dict):
+        """Deliver to local subscribers and to subscribers on other workers."""
+        await self.deliver_local(meeting_id, message)
+        await meetings.publish(meeting_id, message)
+
+    async def deliver_local(self, meeting_id: str, message: dict):
+        """Encode once and queue for every local subscriber; never waits on sockets."""
+        subscribers = self.active_connections.get(meeting_id)
+        if not subscribers:
+            return
+        payload = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+        message_type = message.get("type", "")
+        for subscriber in list(subscribers):
+            subscriber.offer(message_type, payload)
 
 
 manager = ConnectionManager()
 
 
-@app.websocket("/ws/meetings/{meeting_id}")
-async def websocket_endpoint(websocket: WebSocket, meeting_id: str):
-    logger.info(f"WebSocket endpoint called for meeting: {meeting_id}")
-    try:
-        await manager.connect(meeting_id, websocket)
-        logger.info(f"WebSocket connected for meeting: {meeting_id}")
-    except Exception as e:
-        logger.error(f"Failed to accept WebSocket: {e}", exc_info=True)
-        return
-
-    state = meetings.get(meeting_id)
-    if not state:
-        # 새 회의 상태 생성 (데모용)
-        state = MeetingState(
-            meeting_id=meeting_id,
-            title=meeting_id,
-            participants=[],
-            principles=[],
-        )
-        meetings[meeting_id] = state
+class MeetingPipeline:
+    """
+    The single STT + analysis pipeline for one live meeting.
 
-    state.status = MeetingStatus.IN_PROGRESS
-    state.started_at = datetime.utcnow()
+    It is created by the first connection that sends audio (its owner), so
+    passive viewers such as a projector or dashboard never open another
+    paid STT session or analysis fan-out. Every subscriber still receives
+    the pipeline's output through the ConnectionManager.
 
-    stt_service = RealtimeSTTService()
-    speaker_service = SpeakerService()
-    speaker_service.set_participants(state.participants)
-    triage_agent = TriageAgent()
-    storage = StorageService()
+    Connections sending per-participant tracks all feed the one TrackMixer
+    as additional sources. When the owner leaves, ownership passes to a
+    remaining source; the pipeline stops when no source is left.
+    """
 
-    async def on_transcript(text: str):
+    def __init__(self, meeting_id: str, state: MeetingState, owner: Subscriber):
+        self.meeting_id = meeting_id
+        self.state = state
+        self.owner = owner
+        self.sources: set[Subscriber] = {owner}
+        self.track_senders: dict[int, Subscriber] = {}
+        self.storage = StorageService()
+
+        self.diarizer = (
+            SpeakerDiarizer()
+            if os.getenv("DIARIZATION", "true").lower() == "true"
+            else None
+        )
+        if self.diarizer is not None:
+            self.diarizer.set_participants(state.participants)
+        self.stt_service = RealtimeSTTService(
+            overflow_policy=AudioOverflowPolicy(os.getenv("STT_AUDIO_OVERFLOW_POLICY", "drop_oldest")),
+            silence_suppressor=(
+                SilenceSuppressor()
+                if os.getenv("SILENCE_SUPPRESSION", "true").lower() == "true"
+                else None
+            ),
+            diarizer=self.diarizer,
+        )
+        # 참석자별 오디오 트랙 (등록되면 트랙 에너지로 화자/발언 시간 산정)
+        self.mixer = TrackMixer()
+        self.speaker_service = SpeakerService()
+        self.speaker_service.set_participants(state.participants)
+        self.speaker_id_mode = DEFAULT_SPEAKER_ID_MODE
+        self.triage_agent = TriageAgent()
+        self.stt_connected = False
+        self.stopped = False
+
+    @property
+    def journal(self):
+        # 회의 종료 시 journal이 닫혀도 항상 저장소의 단일 writer로 기록
+        return self.storage.journal(self.meeting_id)
+
+    async def start(self):
+        state = self.state
+        # 이미 진행 중인 회의는 시작 시각을 유지
+        if state.status != MeetingStatus.IN_PROGRESS:
+            state.set_status(MeetingStatus.IN_PROGRESS)
+            await meetings.save_meta(state)
+        await self.storage.save_snapshot(state)
+
+        if self.speaker_id_mode == SPEAKER_ID_MODE_ASYNC:
+            self.speaker_service.start_batching(self.on_speaker_update)
+
+        meeting_id = self.meeting_id
+        try:
+            await self.stt_service.connect(
+                self.on_transcript,
+                self.on_speech_end,
+                on_error=self.on_stt_error,
+                on_connection_state_change=self.on_connection_state_change,
+            )
+            self.stt_connected = True
+            logger.info(f"STT service connected for meeting {meeting_id}")
+        except STTConfigurationError as e:
+            logger.error(f"STT configuration error: {e}")
+            await manager.send_message(
+                meeting_id,
+                {
+                    "type": "error",
+                    "data": {
+                        "code": "STT_CONFIGURATION_ERROR",
+                        "message": "Speech-to-text service is not properly configured",
+                        "recoverable": False,
+                    },
+                },
+            )
+        except STTConnectionError as e:
+            logger.error(f"STT connection error: {e}")
+            await manager.send_message(
+                meeting_id,
+                {
+                    "type": "error",
+                    "data": {
+                        "code": "STT_CONNECTION_ERROR",
+                        "message": "Failed to connect to speech-to-text service",
+                        "recoverable": True,
+                    },
+                },
+            )
+        except Exception as e:
+            logger.error(f"Unexpected STT error: {e}", exc_info=True)
+            # STT service connection failed, but WebSocket connection remains open
+
+    async def stop(self, persist: bool = True):
+        """Disconnect STT; with ``persist`` also render the meeting files (the meeting end does that itself)."""
+        logger.info(
+            f"Stopping pipeline for meeting {self.meeting_id} "
+            f"(audio send stats: {self.stt_service.send_stats()})"
+        )
+        self.stopped = True
+        await self.stt_service.disconnect()
+        await self.speaker_service.close()
+        await self.credit_track_time()
+        if not persist:
+            return
+        await self.storage.save_transcript(self.state)
+        await self.storage.save_interventions(self.state)
+        await self.storage.save_snapshot(self.state)
+
+    async def push_audio(self, pcm: bytes | memoryview, track_id: Optional[int], sampled: bool):
+        if self.mixer.tracks:
+            if track_id is None:
+                # 트랙 모드에서는 믹싱된 스트림만 STT로 전달
+                AUDIO_CHUNKS_DROPPED.inc(reason="untagged_with_tracks")
+                if sampled:
+                    logger.warning(f"[{self.meeting_id}] Untagged audio ignored while tracks are registered")
+                return
+            # 트랙 오디오는 믹싱된 만큼만 STT로 전달
+            pcm = self.mixer.push(track_id, pcm)
+            if not pcm:
+                return
+
+        if self.stt_connected and self.stt_service.is_connected:
+            # Queue for the STT sender task; never waits on the upstream socket
+            if not await self.stt_service.enqueue_audio(pcm):
+                logger.debug(f"[{self.meeting_id}] Failed to queue audio chunk")
+        else:
+            AUDIO_CHUNKS_DROPPED.inc(reason="stt_disconnected")
+            if sampled:
+                logger.warning(f"[{self.meeting_id}] STT not connected, audio chunks are being dropped")
+
+    def enroll_speaker(self, participant: str):
+        # 다음 새 목소리를 지정한 참석자로 등록
+        if self.diarizer is not None:
+            self.diarizer.enroll_next(participant)
+
+    def register_track(self, track_id: int, participant: str, sender: Subscriber):
+        self.mixer.register(track_id, participant)
+        self.track_senders[track_id] = sender
+        # 트랙이 있으면 음성 특징 대신 트랙 에너지로 화자 판정
+        self.stt_service.diarizer = self.mixer
+        logger.info(f"[{self.meeting_id}] Track {track_id} -> {participant}")
+
+    async def on_transcript(
+        self,
+        text: str,
+        duration: float = 0.0,
+        diarized: Optional[DiarizationResult] = None,
+    ):
+        state = self.state
         logger.info(f"=== TRANSCRIPT RECEIVED: '{text}' ===")
 
-        # 화자 식별 (간소화 - 첫 번째 참석자로 기본 설정)
-        if state.participants:
+        # 화자 식별: 로컬 음성 다이어라이제이션 결과, 없으면 첫 번째 참석자
+        # (sync 모드는 LLM 식별을 기다리고, async 모드는 전송 후 일괄 정정)
+        confidence = 1.0
+        if diarized is not None:
+            speaker, confidence = diarized.speaker, diarized.confidence
+        elif self.speaker_id_mode == SPEAKER_ID_MODE_SYNC and not self.mixer.tracks and state.participants:
+            try:
+                identified = await self.speaker_service.identify_speaker(text)
+                speaker = identified.get("speaker") or state.participants[0].name
+                confidence = float(identified.get("confidence", 0.0))
+            except Exception as e:
+                logger.warning(f"Speaker identification failed: {e}")
+                speaker = state.participants[0].name
+        elif state.participants:
             speaker = state.participants[0].name
         else:
             speaker = "Unknown"
 
         logger.info(f"Speaker: {speaker}")
 
-        # 참석자 통계 업데이트
-        for p in state.participants:
-            if p.name == speaker:
-                p.speaking_count += 1
-                break
+        entry_id = f"tr_{uuid.uuid4().hex[:8]}"
+
+        # 참석자 통계 업데이트 (O(1) 인덱스 조회 + VAD 발화 시간)
+        if self.mixer.tracks:
+            # 트랙별 실제 발언 시간은 발화와 무관하게 누적
+            state.speaker_stats.record_utterance(speaker, entry_id=entry_id)
+            await self.credit_track_time()
+        else:
+            state.speaker_stats.record_utterance(speaker, duration, entry_id=entry_id)
 
         entry = TranscriptEntry(
-            id=f"tr_{uuid.uuid4().hex[:8]}",
+            id=entry_id,
             timestamp=datetime.utcnow().isoformat(),
             speaker=speaker,
             text=text,
-            confidence=1.0,  # Default confidence since speaker identification is simplified
+            duration=duration,
+            confidence=confidence,
         )
-        state.transcript.append(entry)
+        state.add_transcript(entry)
+        self.journal.append_transcript(entry)
+        await meetings.append_record(state, transcript_record(entry))
+        self.storage.snapshot_if_due(state)
+
+        # 다음 tick에 다른 업데이트와 묶어서 전송 (통계는 최신 스냅샷만)
+        manager.queue_transcript(self.meeting_id, dict(entry.__dict__))
+        if state.speaker_stats.total_count > 0:
+            manager.queue_speaker_stats(self.meeting_id, state.speaker_stats.snapshot)
+
+        # 트랙/음성으로 화자가 정해지지 않은 발화만 배치 식별 대기열로 (전송 경로 밖)
+        if self.speaker_id_mode == SPEAKER_ID_MODE_ASYNC and diarized is None and not self.mixer.tracks:
+            self.speaker_service.submit(entry.id, text, speaker)
+
+    async def on_speaker_update(self, entry_id: str, speaker: str, confidence: float):
+        state = self.state
+        previous = state.reassign_speaker(entry_id, speaker)
+        if previous is None:
+            return
+        logger.info(f"Speaker corrected for {entry_id}: {previous} -> {speaker}")
+        self.journal.append_speaker_update(entry_id, speaker)
+        await meetings.append_record(state, speaker_update_record(entry_id, speaker))
+        self.storage.snapshot_if_due(state)
 
-        logger.info(f"Sending transcript to frontend for meeting: {meeting_id}")
-        try:
-            await manager.send_message(
-                meeting_id, {"type": "transcript", "data": entry.__dict__}
-            )
-            logger.info(f"Transcript sent successfully")
-        except Exception as e:
-            logger.error(f"Failed to send transcript: {e}")
-
-        # 발언 통계 전송
-        total = sum(p.speaking_count for p in state.participants)
-        if total > 0:
-            stats = {
-                p.name: {
-                    "percentage": round(p.speaking_count / total * 100),
-                    "speakingTime": p.speaking_time,
-                    "count": p.speaking_count,
-                }
-                for p in state.participants
-            }
-            await manager.send_message(
-                meeting_id, {"type": "speaker_stats", "data": {"stats": stats}}
-            )
-
-    async def on_speech_end():
+        await manager.send_message(
+            self.meeting_id,
+            {
+                "type": "speaker_update",
+                "data": {
+                    "id": entry_id,
+                    "speaker": speaker,
+                    "previousSpeaker": previous,
+                    "confidence": confidence,
+                },
+            },
+        )
+        manager.queue_speaker_stats(self.meeting_id, state.speaker_stats.snapshot)
+
+    async def remove_source(self, subscriber: Subscriber):
+        """Drop a leaving connection's tracks and hand ownership to a remaining source."""
+        self.sources.discard(subscriber)
+        # 트랙을 지우기 전에 발언 시간을 정산 (기록 저장은 트랙 정리 후)
+        records = self._drain_track_time()
+        for track_id, sender in list(self.track_senders.items()):
+            if sender is subscriber:
+                del self.track_senders[track_id]
+                self.mixer.unregister(track_id)
+        if not self.mixer.tracks and self.stt_service.diarizer is self.mixer:
+            self.stt_service.diarizer = self.diarizer
+        if self.owner is subscriber and self.sources:
+            self.owner = next(iter(self.sources))
+        await self._record_track_time(records)
+
+    async def credit_track_time(self):
+        await self._record_track_time(self._drain_track_time())
+
+    def _drain_track_time(self) -> list[dict]:
+        records = []
+        for name, seconds in self.mixer.drain_speaking_time().items():
+            if self.state.speaker_stats.add_speaking_time(name, seconds) is not None:
+                records.append(speaking_time_record(name, seconds))
+        return records
+
+    async def _record_track_time(self, records: list[dict]):
+        # 트랙 발언 시간도 기록으로 남겨 재로딩/다른 워커에서 같은 통계가 되도록 함
+        for record in records:
+            self.journal.append(record)
+            await meetings.append_record(self.state, record)
+
+    async def on_speech_end(self):
+        state = self.state
         # 멀티에이전트 병렬 분석 (TriageAgent)
-        intervention = await triage_agent.analyze(state, state.transcript[-10:])
-        if intervention:
-            state.interventions.append(intervention)
-            if intervention.parking_lot_item:
-                state.parking_lot.append(intervention.parking_lot_item)
+        intervention = await self.triage_agent.analyze(state, state.transcript[-10:])
+        # 분석 중에 회의가 끝났으면 기록하지 않음
+        if intervention and not self.stopped:
+            INTERVENTIONS.inc(type=intervention.intervention_type.value)
+            state.add_intervention(intervention)
+            self.journal.append_intervention(intervention)
+            await meetings.append_record(state, intervention_record(intervention))
+            self.storage.snapshot_if_due(state)
 
             await manager.send_message(
-                meeting_id,
+                self.meeting_id,
                 {
                     "type": "intervention",
                     "data": {
@@ -604,11 +1197,11 @@ async def websocket_endpoint(websocket: WebSocket, meeting_id: str):
             )
 
     # Error callback for STT service
-    async def on_stt_error(error: Exception):
+    async def on_stt_error(self, error: Exception):
         logger.error(f"STT service error: {error}")
         # Notify client about STT error but don't crash the meeting
         await manager.send_message(
-            meeting_id,
+            self.meeting_id,
             {
                 "type": "error",
                 "data": {
@@ -620,103 +1213,217 @@ async def websocket_endpoint(websocket: WebSocket, meeting_id: str):
         )
 
     # Connection state change callback
-    def on_connection_state_change(old_state: ConnectionState, new_state: ConnectionState):
+    def on_connection_state_change(self, old_state: ConnectionState, new_state: ConnectionState):
         logger.info(f"STT connection state: {old_state.value} -> {new_state.value}")
-        if new_state == ConnectionState.RECONNECTING:
-            asyncio.create_task(manager.send_message(
-                meeting_id,
-                {
-                    "type": "stt_status",
-                    "data": {"status": "reconnecting"},
-                },
-            ))
-        elif new_state == ConnectionState.CONNECTED:
+        status = {
+            ConnectionState.RECONNECTING: "reconnecting",
+            ConnectionState.CONNECTED: "connected",
+            ConnectionState.FAILED: "failed",
+        }.get(new_state)
+        if status is not None:
             asyncio.create_task(manager.send_message(
-                meeting_id,
+                self.meeting_id,
                 {
                     "type": "stt_status",
-                    "data": {"status": "connected"},
-                },
-            ))
-        elif new_state == ConnectionState.FAILED:
-            asyncio.create_task(manager.send_message(
-                meeting_id,
-                {
-                    "type": "stt_status",
-                    "data": {"status": "failed"},
+                    "data": {"status": status},
                 },
             ))
 
-    stt_connected = False
+
+class PipelineRegistry:
+    """
+    At most one MeetingPipeline per meeting.
+
+    Within this process the registry holds it; across workers sharing the
+    meeting store, a pipeline only starts after this worker takes the
+    meeting's pipeline lease in the store.
+    """
+
+    def __init__(self):
+        self._pipelines: Dict[str, MeetingPipeline] = {}
+
+    def get(self, meeting_id: str) -> Optional[MeetingPipeline]:
+        return self._pipelines.get(meeting_id)
+
+    async def claim(
+        self, meeting_id: str, state: MeetingState, subscriber: Subscriber
+    ) -> Optional[MeetingPipeline]:
+        """The meeting's pipeline if ``subscriber`` owns it, starting one if none runs; else None."""
+        pipeline = self._pipelines.get(meeting_id)
+        if pipeline is None:
+            if state.status == MeetingStatus.COMPLETED:
+                return None
+            # 다른 워커가 이 회의의 파이프라인을 돌리고 있으면 시작하지 않음
+            if not await meetings.claim_pipeline(meeting_id):
+                return None
+            pipeline = self._pipelines.get(meeting_id)
+        if pipeline is None:
+            # Register before starting so a concurrent claim sees the owner
+            pipeline = self._pipelines[meeting_id] = MeetingPipeline(meeting_id, state, subscriber)
+            await pipeline.start()
+        return pipeline if pipeline.owner is subscriber else None
+
+    async def join(
+        self, meeting_id: str, state: MeetingState, subscriber: Subscriber
+    ) -> Optional[MeetingPipeline]:
+        """The meeting's pipeline for a per-participant track sender, starting one if none runs."""
+        pipeline = await self.claim(meeting_id, state, subscriber)
+        if pipeline is None:
+            pipeline = self._pipelines.get(meeting_id)
+            if pipeline is not None:
+                pipeline.sources.add(subscriber)
+        return pipeline
+
+    async def release(self, meeting_id: str, subscriber: Subscriber):
+        """Detach ``subscriber`` as an audio source; stop the pipeline once none is left."""
+        pipeline = self._pipelines.get(meeting_id)
+        if pipeline is None or subscriber not in pipeline.sources:
+            return
+        await pipeline.remove_source(subscriber)
+        if pipeline.sources:
+            return
+        del self._pipelines[meeting_id]
+        try:
+            await pipeline.stop()
+        finally:
+            await meetings.release_pipeline(meeting_id)
+
+    async def shutdown(self, meeting_id: str):
+        """Stop the meeting's pipeline whoever is still connected (the meeting ended)."""
+        pipeline = self._pipelines.pop(meeting_id, None)
+        if pipeline is None:
+            return
+        try:
+            await pipeline.stop(persist=False)
+        finally:
+            await meetings.release_pipeline(meeting_id)
+
+
+pipelines = PipelineRegistry()
+
+
+@app.websocket("/ws/meetings/{meeting_id}")
+async def websocket_endpoint(websocket: WebSocket, meeting_id: str):
+    logger.info(f"WebSocket endpoint called for meeting: {meeting_id}")
+
+    # Negotiate binary audio ingress via subprotocol at connect time
+    offered = websocket.scope.get("subprotocols", [])
+    tagged_audio = AUDIO_TRACKS_SUBPROTOCOL in offered
+    binary_audio = tagged_audio or AUDIO_SUBPROTOCOL in offered
+    subprotocol = (
+        AUDIO_TRACKS_SUBPROTOCOL if tagged_audio
+        else AUDIO_SUBPROTOCOL if binary_audio
+        else None
+    )
+
+    # 회의는 REST API로 먼저 생성되어야 함
+    state = await meetings.get(meeting_id)
+    if not state:
+        logger.warning(f"WebSocket rejected for unknown meeting: {meeting_id}")
+        await websocket.accept(subprotocol=subprotocol)
+        await websocket.close(code=MEETING_NOT_FOUND_CLOSE_CODE)
+        return
+
     try:
-        await stt_service.connect(
-            on_transcript,
-            on_speech_end,
-            on_error=on_stt_error,
-            on_connection_state_change=on_connection_state_change,
-        )
-        stt_connected = True
-        logger.info(f"STT service connected for meeting {meeting_id}")
-    except STTConfigurationError as e:
-        logger.error(f"STT configuration error: {e}")
-        await manager.send_message(
-            meeting_id,
-            {
-                "type": "error",
-                "data": {
-                    "code": "STT_CONFIGURATION_ERROR",
-                    "message": "Speech-to-text service is not properly configured",
-                    "recoverable": False,
-                },
-            },
-        )
-    except STTConnectionError as e:
-        logger.error(f"STT connection error: {e}")
-        await manager.send_message(
-            meeting_id,
-            {
-                "type": "error",
-                "data": {
-                    "code": "STT_CONNECTION_ERROR",
-                    "message": "Failed to connect to speech-to-text service",
-                    "recoverable": True,
-                },
-            },
+        subscriber = await manager.connect(meeting_id, websocket, subprotocol=subprotocol)
+        logger.info(
+            f"WebSocket connected for meeting: {meeting_id} "
+            f"(audio: {subprotocol or 'json'})"
         )
     except Exception as e:
-        logger.error(f"Unexpected STT error: {e}", exc_info=True)
-        # STT service connection failed, but WebSocket connection remains open
+        logger.error(f"Failed to accept WebSocket: {e}", exc_info=True)
+        return
+    # 연결이 유지되는 동안 회의를 메모리에서 내보내지 않음
+    meetings.acquire(meeting_id)
 
+    # 오디오를 처음 보낸 연결이 회의 파이프라인(STT + 분석)을 소유하고, 나머지는 구독만 함
     audio_chunk_count = 0
-    logger.info(f"[{meeting_id}] Entering receive loop, waiting for audio...")
+    logger.info(f"[{meeting_id}] Entering receive loop")
     try:
         while True:
-            data = await websocket.receive_json()
-            if data["type"] == "audio":
-                audio_chunk_count += 1
-                audio_size = len(data.get("data", ""))
-                logger.info(f"[{meeting_id}] Audio chunk #{audio_chunk_count} received, size: {audio_size} bytes")
-
-                if stt_connected and stt_service.is_connected:
-                    success = await stt_service.send_audio(data["data"])
-                    if success:
-                        logger.debug(f"[{meeting_id}] Audio chunk #{audio_chunk_count} sent to OpenAI")
-                    else:
-                        logger.warning(f"[{meeting_id}] Failed to send audio chunk #{audio_chunk_count}")
-                else:
-                    logger.warning(f"[{meeting_id}] STT not connected, audio chunk dropped")
+            message = await websocket.receive()
+            if message["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(message.get("code", 1000))
+
+            # Binary frames carry raw PCM16 audio; text frames carry JSON control messages
+            if message.get("bytes") is not None:
+                if not binary_audio:
+                    logger.warning(f"[{meeting_id}] Binary frame without negotiated subprotocol, ignored")
+                    continue
+                # PCM16 frames must be sample-aligned; slice without copying
+                pcm = memoryview(message["bytes"])
+                track_id = None
+                if tagged_audio:
+                    if len(pcm) < TRACK_HEADER_BYTES:
+                        continue
+                    track_id = int.from_bytes(pcm[:TRACK_HEADER_BYTES], "little")
+                    pcm = pcm[TRACK_HEADER_BYTES:]
+                if len(pcm) % 2:
+                    pcm = pcm[:-1]
+            elif message.get("text") is not None:
+                data = json.loads(message["text"])
+                if data.get("type") == "speaker_enroll":
+                    participant = (data.get("data") or {}).get("participant")
+                    pipeline = await pipelines.claim(meeting_id, state, subscriber)
+                    if participant and pipeline is not None:
+                        pipeline.enroll_speaker(participant)
+                    continue
+                if data.get("type") == "track":
+                    track = data.get("data") or {}
+                    if isinstance(track.get("track"), int) and track.get("participant"):
+                        # 참석자별 트랙은 어느 연결에서 오든 회의의 믹서 하나로 모음
+                        pipeline = await pipelines.join(meeting_id, state, subscriber)
+                        if pipeline is not None:
+                            pipeline.register_track(track["track"], track["participant"], subscriber)
+                    continue
+                if data.get("type") != "audio":
+                    continue
+                try:
+                    pcm = base64.b64decode(data.get("data", ""), validate=True)
+                except binascii.Error:
+                    logger.warning(f"[{meeting_id}] Invalid base64 audio chunk ignored")
+                    continue
+                track_id = data.get("track")
+            else:
+                continue
+
+            audio_chunk_count += 1
+            AUDIO_CHUNKS_IN.inc()
+            sampled = audio_chunk_count % AUDIO_LOG_SAMPLE_EVERY == 1
+            if track_id is not None:
+                pipeline = await pipelines.join(meeting_id, state, subscriber)
+            else:
+                pipeline = await pipelines.claim(meeting_id, state, subscriber)
+            if pipeline is None:
+                # 이미 끝난 회의이거나, 다른 연결이 이 회의의 오디오를 보내고 있음
+                completed = state.status == MeetingStatus.COMPLETED
+                AUDIO_CHUNKS_DROPPED.inc(reason="meeting_completed" if completed else "not_pipeline_owner")
+                if sampled:
+                    logger.warning(
+                        f"[{meeting_id}] Audio ignored "
+                        f"({'meeting completed' if completed else 'non-owner connection'})"
+                    )
+                continue
+            if sampled:
+                logger.info(
+                    f"[{meeting_id}] Audio chunk #{audio_chunk_count} received, size: {len(pcm)} bytes "
+                    f"(send stats: {pipeline.stt_service.send_stats()})"
+                )
+            else:
+                logger.debug(f"[{meeting_id}] Audio chunk #{audio_chunk_count} received, size: {len(pcm)} bytes")
+
+            await pipeline.push_audio(pcm, track_id, sampled)
     except WebSocketDisconnect:
         logger.info(f"WebSocket disconnected for meeting {meeting_id}")
-        manager.disconnect(meeting_id)
-        await stt_service.disconnect()
-        await storage.save_transcript(state)
-        await storage.save_interventions(state)
     except Exception as e:
         logger.error(f"Error in WebSocket handler: {e}", exc_info=True)
-        manager.disconnect(meeting_id)
-        await stt_service.disconnect()
-        await storage.save_transcript(state)
-        await storage.save_interventions(state)
+    finally:
+        manager.disconnect(meeting_id, subscriber)
+        try:
+            # 소유자가 나가면 파이프라인을 멈추고 회의록을 저장
+            await pipelines.release(meeting_id, subscriber)
+        finally:
+            meetings.release(meeting_id)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,104 @@
+"""Process-wide LRU + TTL cache for LLM analysis verdicts."""
+import hashlib
+import json
+import os
+import re
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from models.meeting import MeetingState, TranscriptEntry
+from services.metrics import ANALYSIS_CACHE_HITS, ANALYSIS_CACHE_MISSES
+
+DEFAULT_CACHE_MAX_ENTRIES = int(os.getenv("ANALYSIS_CACHE_MAX_ENTRIES", "1024"))
+DEFAULT_CACHE_TTL = float(os.getenv("ANALYSIS_CACHE_TTL", "300.0"))  # seconds
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def _normalize(text: str) -> str:
+    """Collapse whitespace and case so cosmetic differences share a key."""
+    return _WHITESPACE_RE.sub(" ", text).strip().lower()
+
+
+class AnalysisCache:
+    """
+    Memoizes agent verdicts keyed on the meeting context and utterance window.
+
+    Entries expire after ``ttl`` seconds and the least recently used entry
+    is evicted once ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        ttl: float = DEFAULT_CACHE_TTL,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def make_key(
+        self,
+        agent_name: str,
+        state: MeetingState,
+        window: list[TranscriptEntry],
+        extra: Any = None,
+    ) -> str:
+        """Hash the agenda, principles and normalized utterance window."""
+        payload = json.dumps(
+            {
+                "agent": agent_name,
+                "agenda": _normalize(state.agenda or ""),
+                "principles": [p.get("name", "") for p in state.principles],
+                "window": [[t.speaker, _normalize(t.text)] for t in window],
+                "extra": extra,
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a cached value, or None on miss or expiry."""
+        entry = self._entries.get(key)
+        if entry is None:
+            ANALYSIS_CACHE_MISSES.inc()
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            ANALYSIS_CACHE_MISSES.inc()
+            return None
+
+        self._entries.move_to_end(key)
+        ANALYSIS_CACHE_HITS.inc()
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store a value and evict the least recently used entries."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+_cache: Optional[AnalysisCache] = None
+
+
+def get_analysis_cache() -> AnalysisCache:
+    """Return the shared analysis cache, creating it on first use."""
+    global _cache
+    if _cache is None:
+        _cache = AnalysisCache()
+    return _cache
+
+
+def set_analysis_cache(cache: Optional[AnalysisCache]) -> None:
+    """Replace the shared cache (None resets it)."""
+    global _cache
+    _cache = cache
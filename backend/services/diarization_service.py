@@ -0,0 +1,260 @@
+"""On-box speaker diarization from the PCM16 stream sent to the Realtime API."""
+import logging
+import os
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from models.meeting import Participant
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_RATE = 24000
+DEFAULT_BUFFER_SECONDS = 30.0  # audio kept for segments still awaiting VAD stop
+DEFAULT_MAX_SEGMENT_SECONDS = 10.0  # longer segments are embedded from their tail
+DEFAULT_MIN_SEGMENT_SECONDS = 0.5
+DEFAULT_MATCH_THRESHOLD = float(os.getenv("DIARIZATION_MATCH_THRESHOLD", "0.3"))
+DEFAULT_ENROLL_MIN_SECONDS = 1.0
+
+FRAME_MS = 25
+HOP_MS = 10
+N_FFT = 1024
+N_MELS = 26
+N_MFCC = 13
+
+
+def _mel(hz: np.ndarray) -> np.ndarray:
+    return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+
+def _hz(mel: np.ndarray) -> np.ndarray:
+    return 700.0 * (10 ** (mel / 2595.0) - 1.0)
+
+
+def mel_filterbank(sample_rate: int, n_fft: int = N_FFT, n_mels: int = N_MELS,
+                   f_min: float = 60.0, f_max: float = 7600.0) -> np.ndarray:
+    """Triangular mel filters as a (n_mels, n_fft // 2 + 1) matrix."""
+    bins = np.fft.rfftfreq(n_fft, 1.0 / sample_rate)
+    edges = _hz(np.linspace(_mel(np.array(f_min)), _mel(np.array(min(f_max, sample_rate / 2))), n_mels + 2))
+    lower, center, upper = edges[:-2, None], edges[1:-1, None], edges[2:, None]
+    rising = (bins - lower) / (center - lower)
+    falling = (upper - bins) / (upper - center)
+    return np.maximum(0.0, np.minimum(rising, falling)).astype(np.float32)
+
+
+def dct_matrix(n_in: int = N_MELS, n_out: int = N_MFCC) -> np.ndarray:
+    """Orthonormal DCT-II basis as a (n_out, n_in) matrix."""
+    k = np.arange(n_out)[:, None]
+    n = np.arange(n_in)[None, :]
+    basis = np.cos(np.pi / n_in * (n + 0.5) * k) * np.sqrt(2.0 / n_in)
+    basis[0] /= np.sqrt(2.0)
+    return basis.astype(np.float32)
+
+
+class VoiceFeatureExtractor:
+    """
+    MFCC-style voice embeddings computed with NumPy only.
+
+    Frames, window, mel filterbank and DCT basis are precomputed once; a
+    segment is embedded with one strided view, one batched rFFT and two
+    matrix products. The embedding is the mean and standard deviation of
+    MFCCs 1..12 over voiced frames (c0, the loudness term, is dropped so
+    microphone gain does not dominate).
+    """
+
+    def __init__(self, sample_rate: int = DEFAULT_SAMPLE_RATE):
+        self.sample_rate = sample_rate
+        self.frame_len = sample_rate * FRAME_MS // 1000
+        self.hop = sample_rate * HOP_MS // 1000
+        self.window = np.hamming(self.frame_len).astype(np.float32)
+        self.filters = mel_filterbank(sample_rate)
+        self.dct = dct_matrix()
+
+    def embed(self, samples: np.ndarray) -> Optional[np.ndarray]:
+        """Embed int16 samples; None when there are too few voiced frames."""
+        if samples.size < self.frame_len:
+            return None
+        n_frames = 1 + (samples.size - self.frame_len) // self.hop
+        frames = np.lib.stride_tricks.sliding_window_view(samples, self.frame_len)[::self.hop][:n_frames]
+        frames = frames.astype(np.float32) * self.window
+
+        power = np.abs(np.fft.rfft(frames, n=N_FFT, axis=1)) ** 2
+        energy = power.sum(axis=1)
+        # Keep frames within 30 dB of the loudest one (drops pauses inside the segment)
+        voiced = energy > energy.max() * 1e-3
+        if np.count_nonzero(voiced) < 10:
+            return None
+
+        log_mel = np.log(power[voiced] @ self.filters.T + 1e-6)
+        mfcc = log_mel @ self.dct.T
+        coeffs = mfcc[:, 1:]
+        return np.concatenate([coeffs.mean(axis=0), coeffs.std(axis=0)])
+
+
+@dataclass
+class DiarizationResult:
+    speaker: str
+    confidence: float
+    enrolled: bool = False
+
+
+@dataclass
+class _VoiceProfile:
+    name: str
+    centroid: np.ndarray
+    count: int = 1
+
+
+class SpeakerDiarizer:
+    """
+    Attributes VAD speech segments to meeting participants by voice.
+
+    The STT sender feeds every frame it sends upstream, so byte offsets here
+    line up with the Realtime API's ``audio_start_ms``/``audio_end_ms``. When
+    VAD stops, the segment is embedded and matched against per-participant
+    voice profiles. A voice that matches no profile is enrolled as the next
+    participant without one (participants in list order, or the one named by
+    ``enroll_next``). Profiles keep adapting on confident matches.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        buffer_seconds: float = DEFAULT_BUFFER_SECONDS,
+        max_segment_seconds: float = DEFAULT_MAX_SEGMENT_SECONDS,
+        min_segment_seconds: float = DEFAULT_MIN_SEGMENT_SECONDS,
+        match_threshold: float = DEFAULT_MATCH_THRESHOLD,
+        enroll_min_seconds: float = DEFAULT_ENROLL_MIN_SECONDS,
+    ):
+        self.sample_rate = sample_rate
+        self.extractor = VoiceFeatureExtractor(sample_rate)
+        self.buffer_samples = int(buffer_seconds * sample_rate)
+        self.max_segment_samples = int(max_segment_seconds * sample_rate)
+        self.min_segment_samples = int(min_segment_seconds * sample_rate)
+        self.match_threshold = match_threshold
+        self.enroll_min_samples = int(enroll_min_seconds * sample_rate)
+
+        self.participants: list["Participant"] = []
+        self.profiles: dict[str, _VoiceProfile] = {}
+        self._pending_enrollment: Optional[str] = None
+
+        # Ring of the most recent upstream audio; _base is the absolute sample index of _buffer[0]
+        self._buffer = bytearray()
+        self._base = 0
+        self._remainder = b""
+
+        self._results: dict[str, DiarizationResult] = {}
+        self.segments = 0
+        self.unresolved = 0
+
+    def set_participants(self, participants: list["Participant"]) -> None:
+        self.participants = participants
+
+    def enroll_next(self, name: str) -> None:
+        """Label the next unmatched voice as ``name`` (re-enrolls an existing profile)."""
+        self._pending_enrollment = name
+        self.profiles.pop(name, None)
+
+    def feed(self, pcm: bytes | memoryview) -> None:
+        """Append PCM16 audio exactly as it was sent upstream."""
+        if self._remainder:
+            pcm = self._remainder + bytes(pcm)
+            self._remainder = b""
+        if len(pcm) % 2:
+            self._remainder = bytes(pcm[-1:])
+            pcm = pcm[:-1]
+        self._buffer += pcm
+        overflow = len(self._buffer) // 2 - self.buffer_samples
+        if overflow > 0:
+            del self._buffer[:overflow * 2]
+            self._base += overflow
+
+    def reset_timeline(self) -> None:
+        """Forget buffered audio; a new upstream session restarts its audio clock at 0."""
+        self._buffer.clear()
+        self._base = 0
+        self._remainder = b""
+        self._results.clear()
+
+    def _segment(self, start_ms: int, end_ms: int) -> np.ndarray:
+        start = max(start_ms * self.sample_rate // 1000, self._base)
+        end = min(end_ms * self.sample_rate // 1000, self._base + len(self._buffer) // 2)
+        start = max(start, end - self.max_segment_samples)
+        if end <= start:
+            return np.empty(0, dtype=np.int16)
+        view = np.frombuffer(self._buffer, dtype=np.int16)
+        return view[start - self._base:end - self._base].copy()
+
+    @staticmethod
+    def similarity(a: np.ndarray, b: np.ndarray) -> float:
+        """
+        exp(-d) where d is the mean MFCC distance in units of pooled frame std.
+
+        Scale-free, so it needs no background model and works from the very
+        first enrolled profile.
+        """
+        half = a.size // 2
+        pooled = np.sqrt((a[half:] ** 2 + b[half:] ** 2) / 2) + 1e-3
+        distance = float(np.mean(np.abs(a[:half] - b[:half]) / pooled))
+        return float(np.exp(-distance))
+
+    def _score(self, embedding: np.ndarray) -> tuple[Optional[_VoiceProfile], float]:
+        best, best_score = None, -1.0
+        for profile in self.profiles.values():
+            score = self.similarity(embedding, profile.centroid)
+            if score > best_score:
+                best, best_score = profile, score
+        return best, best_score
+
+    def _next_unenrolled(self) -> Optional[str]:
+        if self._pending_enrollment:
+            name, self._pending_enrollment = self._pending_enrollment, None
+            return name
+        for participant in self.participants:
+            if participant.name not in self.profiles:
+                return participant.name
+        return None
+
+    def end_segment(self, item_id: str, start_ms: int, end_ms: int) -> Optional[DiarizationResult]:
+        """Embed and attribute the segment VAD just closed; kept until ``take``."""
+        samples = self._segment(start_ms, end_ms)
+        self.segments += 1
+        if samples.size < self.min_segment_samples or not self.participants:
+            self.unresolved += 1
+            return None
+        embedding = self.extractor.embed(samples)
+        if embedding is None:
+            self.unresolved += 1
+            return None
+
+        profile, score = self._score(embedding)
+        if profile is not None and score >= self.match_threshold:
+            profile.count += 1
+            profile.centroid += (embedding - profile.centroid) / min(profile.count, 20)
+            result = DiarizationResult(profile.name, round(score, 3))
+        else:
+            name = self._next_unenrolled() if samples.size >= self.enroll_min_samples else None
+            if name is not None:
+                self.profiles[name] = _VoiceProfile(name, embedding.copy())
+                result = DiarizationResult(name, 0.5, enrolled=True)
+                logger.info(f"Enrolled voice profile for {name}")
+            elif profile is not None:
+                result = DiarizationResult(profile.name, round(max(score, 0.0), 3))
+            else:
+                self.unresolved += 1
+                return None
+
+        self._results[item_id] = result
+        return result
+
+    def take(self, item_id: str) -> Optional[DiarizationResult]:
+        return self._results.pop(item_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "voiceProfiles": len(self.profiles),
+            "diarizedSegments": self.segments - self.unresolved,
+            "undiarizedSegments": self.unresolved,
+        }
@@ -0,0 +1,67 @@
+"""Process-wide async OpenAI client shared by all agents and services."""
+import logging
+import os
+from typing import Optional
+
+import httpx
+from openai import AsyncOpenAI, DefaultAsyncHttpxClient
+
+logger = logging.getLogger(__name__)
+
+# Per-call timeout applied to every chat completion (seconds)
+DEFAULT_LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "10.0"))
+DEFAULT_LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "1"))
+
+# Connection pool configuration (shared by every meeting)
+DEFAULT_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "50"))
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv("LLM_MAX_KEEPALIVE_CONNECTIONS", "20"))
+DEFAULT_KEEPALIVE_EXPIRY = 30.0  # seconds
+
+_client: Optional[AsyncOpenAI] = None
+
+
+def _create_client() -> AsyncOpenAI:
+    """Create an AsyncOpenAI client backed by a pooled keep-alive HTTP client."""
+    http_client = DefaultAsyncHttpxClient(
+        limits=httpx.Limits(
+            max_connections=DEFAULT_MAX_CONNECTIONS,
+            max_keepalive_connections=DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=DEFAULT_KEEPALIVE_EXPIRY,
+        ),
+    )
+    return AsyncOpenAI(
+        http_client=http_client,
+        timeout=DEFAULT_LLM_TIMEOUT,
+        max_retries=DEFAULT_LLM_MAX_RETRIES,
+    )
+
+
+def get_llm_client() -> AsyncOpenAI:
+    """Return the shared async client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = _create_client()
+        logger.info("Shared LLM client created")
+    return _client
+
+
+def set_llm_client(client: Optional[AsyncOpenAI]) -> None:
+    """
+    Replace the shared client.
+
+    Tests can inject a local fake exposing ``chat.completions.create``.
+    Passing None resets the client so the next call creates a fresh one.
+    """
+    global _client
+    _client = client
+
+
+async def close_llm_client() -> None:
+    """Close the shared client and release pooled connections."""
+    global _client
+    if _client is not None:
+        close = getattr(_client, "close", None)
+        if close is not None:
+            await close()
+        _client = None
+        logger.info("Shared LLM client closed")
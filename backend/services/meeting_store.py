@@ -0,0 +1,763 @@
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, Optional
+
+from models.meeting import (
+    Intervention,
+    InterventionType,
+    MeetingState,
+    MeetingStatus,
+    TranscriptEntry,
+)
+from services.metrics import (
+    MEETING_MEMORY_MAX_BYTES,
+    MEETINGS_CACHE_BYTES,
+    MEETINGS_CACHED,
+    MEETINGS_EVICTED,
+    MEETINGS_LOADED,
+)
+from services.storage_service import (
+    RECORD_INTERVENTION,
+    RECORD_SPEAKER_UPDATE,
+    RECORD_SPEAKING_TIME,
+    RECORD_TRANSCRIPT,
+    StorageService,
+    intervention_record,
+    state_from_snapshot,
+    state_to_snapshot,
+    transcript_record,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_MEETINGS = int(os.getenv("MEETING_CACHE_MAX_MEETINGS", "256"))
+DEFAULT_MAX_BYTES = int(float(os.getenv("MEETING_CACHE_MAX_MB", "256")) * 1024 * 1024)
+# Meetings nobody is connected to are evicted after this long without access, whatever their status
+DEFAULT_IDLE_TTL = float(os.getenv("MEETING_IDLE_TTL", "1800"))
+DEFAULT_SWEEP_INTERVAL = 60.0
+
+MEETING_STORE_MEMORY = "memory"
+MEETING_STORE_SQLITE = "sqlite"
+DEFAULT_MEETING_STORE = os.getenv("MEETING_STORE", MEETING_STORE_MEMORY)
+DEFAULT_SQLITE_PATH = os.getenv("MEETING_STORE_PATH", "")
+# How often each worker polls the shared event table
+DEFAULT_POLL_INTERVAL = float(os.getenv("MEETING_STORE_POLL_MS", "100")) / 1000
+EVENT_RETENTION_SECONDS = 60.0
+# A worker's claim on running a meeting's pipeline lapses if not renewed within this long
+DEFAULT_PIPELINE_LEASE_TTL = float(os.getenv("PIPELINE_LEASE_TTL", "15"))
+
+EVENT_STATE = "state"
+EVENT_MESSAGE = "message"
+
+MessageListener = Callable[[str, dict], Awaitable[None]]
+
+
+def _object_bytes(obj) -> int:
+    """Shallow size of a dataclass instance plus its field values."""
+    return sys.getsizeof(obj) + sum(sys.getsizeof(v) for v in vars(obj).values())
+
+
+class _MeetingSize:
+    """Incremental memory estimate; transcript and interventions are append-only."""
+
+    __slots__ = ("transcript_count", "intervention_count", "bytes")
+
+    def __init__(self):
+        self.transcript_count = 0
+        self.intervention_count = 0
+        self.bytes = 0
+
+    def update(self, state: MeetingState) -> int:
+        if self.bytes == 0:
+            self.bytes = (
+                _object_bytes(state)
+                + sum(_object_bytes(p) for p in state.participants)
+                + sum(sys.getsizeof(p) for p in state.principles)
+            )
+        for entry in state.transcript[self.transcript_count:]:
+            self.bytes += _object_bytes(entry)
+        for intervention in state.interventions[self.intervention_count:]:
+            self.bytes += _object_bytes(intervention)
+        self.transcript_count = len(state.transcript)
+        self.intervention_count = len(state.interventions)
+        return self.bytes
+
+
+class MeetingStore(ABC):
+    """
+    Live meetings keyed by id, bounded in count and estimated memory.
+
+    Subclasses decide where a meeting comes from when it is not in memory
+    (``_load``), how mutations are shared (``save_meta``, ``append_record``,
+    ``publish``) and what happens to an evicted meeting (``_persist_evicted``).
+
+    When either bound is exceeded, least recently used ``COMPLETED`` meetings
+    are dropped from memory. In addition, a periodic sweep drops any meeting
+    that no WebSocket holds (``acquire``/``release``) and nobody has accessed
+    for ``idle_ttl`` seconds, so abandoned meetings do not pin memory or
+    journal writers. Evicted meetings reload transparently. Concurrent first
+    accesses to a meeting share one load.
+    """
+
+    def __init__(
+        self,
+        storage: Optional[StorageService] = None,
+        max_meetings: int = DEFAULT_MAX_MEETINGS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        idle_ttl: float = DEFAULT_IDLE_TTL,
+        sweep_interval: float = DEFAULT_SWEEP_INTERVAL,
+    ):
+        self.storage = storage or StorageService()
+        self.max_meetings = max_meetings
+        self.max_bytes = max_bytes
+        self.idle_ttl = idle_ttl
+        self.sweep_interval = sweep_interval
+
+        self._meetings: OrderedDict[str, MeetingState] = OrderedDict()
+        self._sizes: dict[str, _MeetingSize] = {}
+        self._last_used: dict[str, float] = {}
+        self._holders: dict[str, int] = {}
+        self._loading: dict[str, asyncio.Task] = {}
+        self._listeners: list[MessageListener] = []
+        self._sweeper: Optional[asyncio.Task] = None
+
+    def __contains__(self, meeting_id: str) -> bool:
+        return meeting_id in self._meetings
+
+    def __len__(self) -> int:
+        return len(self._meetings)
+
+    async def start(self) -> None:
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def close(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            try:
+                await self._sweeper
+            except asyncio.CancelledError:
+                pass
+            self._sweeper = None
+
+    def acquire(self, meeting_id: str) -> None:
+        """Mark a meeting as held by a live connection; held meetings are never evicted."""
+        self._holders[meeting_id] = self._holders.get(meeting_id, 0) + 1
+
+    def release(self, meeting_id: str) -> None:
+        """Drop one hold; the idle clock starts when the last holder leaves."""
+        remaining = self._holders.get(meeting_id, 0) - 1
+        if remaining > 0:
+            self._holders[meeting_id] = remaining
+        else:
+            self._holders.pop(meeting_id, None)
+        self._last_used[meeting_id] = time.monotonic()
+
+    # Cross-process hooks; no-ops when a single process owns every meeting
+
+    def on_message(self, listener: MessageListener) -> None:
+        """Register a callback for client messages published by other processes."""
+        self._listeners.append(listener)
+
+    async def publish(self, meeting_id: str, message: dict) -> None:
+        """Share an outbound client message with other processes."""
+
+    async def save_meta(self, state: MeetingState) -> None:
+        """Persist a metadata change (status, timestamps)."""
+
+    def meta_version(self, meeting_id: str) -> int:
+        """Version of the meeting's metadata shared by every process (0 when not tracked)."""
+        return 0
+
+    async def append_record(self, state: MeetingState, record: dict) -> None:
+        """Persist a transcript entry, intervention, speaker correction or track speaking time already applied to ``state``."""
+
+    async def claim_pipeline(self, meeting_id: str) -> bool:
+        """Take (or keep) the right to run the meeting's pipeline; False if another process holds it."""
+        return True
+
+    async def release_pipeline(self, meeting_id: str) -> None:
+        """Give up the right to run the meeting's pipeline."""
+
+    @abstractmethod
+    async def _load(self, meeting_id: str) -> Optional[MeetingState]:
+        """Rebuild a meeting that is not in memory (None if it does not exist)."""
+
+    async def _refresh(self, state: MeetingState) -> None:
+        """Bring a cached meeting up to date with changes made elsewhere."""
+
+    async def _persist_evicted(self, state: MeetingState) -> None:
+        pass
+
+    async def put(self, state: MeetingState) -> None:
+        """Register a new (or replaced) meeting."""
+        await self._cache(state)
+
+    async def _cache(self, state: MeetingState) -> None:
+        self._meetings[state.meeting_id] = state
+        self._meetings.move_to_end(state.meeting_id)
+        self._sizes[state.meeting_id] = _MeetingSize()
+        self._last_used[state.meeting_id] = time.monotonic()
+        await self.enforce_limits(keep=state.meeting_id)
+
+    async def get(self, meeting_id: str) -> Optional[MeetingState]:
+        state = self._meetings.get(meeting_id)
+        if state is not None:
+            self._meetings.move_to_end(meeting_id)
+            self._last_used[meeting_id] = time.monotonic()
+            await self._refresh(state)
+            return state
+
+        task = self._loading.get(meeting_id)
+        if task is None:
+            task = self._loading[meeting_id] = asyncio.create_task(self._load(meeting_id))
+        try:
+            state = await task
+        finally:
+            self._loading.pop(meeting_id, None)
+
+        # A meeting created while the load was in flight wins over the loaded copy
+        if meeting_id in self._meetings:
+            return self._meetings[meeting_id]
+        if state is None:
+            return None
+
+        MEETINGS_LOADED.inc()
+        await self._cache(state)
+        return state
+
+    def memory_usage(self) -> dict[str, int]:
+        """Estimated bytes per in-memory meeting (updated incrementally)."""
+        usage = {}
+        for meeting_id, state in self._meetings.items():
+            size = self._sizes.setdefault(meeting_id, _MeetingSize())
+            usage[meeting_id] = size.update(state)
+        MEETINGS_CACHED.set(len(self._meetings))
+        MEETINGS_CACHE_BYTES.set(sum(usage.values()))
+        MEETING_MEMORY_MAX_BYTES.set(max(usage.values(), default=0))
+        return usage
+
+    async def enforce_limits(self, keep: Optional[str] = None) -> None:
+        """Evict least recently used completed meetings until both bounds hold."""
+        usage = self.memory_usage()
+        total = sum(usage.values())
+        if len(self._meetings) <= self.max_meetings and total <= self.max_bytes:
+            return
+
+        for meeting_id in list(self._meetings):
+            if len(self._meetings) <= self.max_meetings and total <= self.max_bytes:
+                break
+            state = self._meetings.get(meeting_id)
+            if (
+                state is None
+                or meeting_id == keep
+                or meeting_id in self._holders
+                or state.status != MeetingStatus.COMPLETED
+            ):
+                continue
+            total -= usage[meeting_id]
+            await self._evict(meeting_id, state, usage[meeting_id])
+        MEETINGS_CACHED.set(len(self._meetings))
+        MEETINGS_CACHE_BYTES.set(total)
+
+    async def evict_idle(self, now: Optional[float] = None) -> int:
+        """Evict meetings no connection holds that have not been accessed within ``idle_ttl``."""
+        now = time.monotonic() if now is None else now
+        usage = self.memory_usage()
+        evicted = 0
+        for meeting_id in list(self._meetings):
+            if meeting_id in self._holders or meeting_id in self._loading:
+                continue
+            if now - self._last_used.get(meeting_id, now) < self.idle_ttl:
+                continue
+            await self._evict(meeting_id, self._meetings[meeting_id], usage.get(meeting_id, 0))
+            evicted += 1
+        if evicted:
+            self.memory_usage()
+        return evicted
+
+    async def _sweep(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            try:
+                await self.evict_idle()
+            except Exception as e:
+                logger.error(f"Idle meeting sweep failed: {e}", exc_info=True)
+
+    async def _evict(self, meeting_id: str, state: MeetingState, size: int) -> None:
+        # Persist before dropping so a concurrent reload never reads a stale copy
+        await self._persist_evicted(state)
+        if self._meetings.get(meeting_id) is not state or meeting_id in self._holders:
+            return
+
+        del self._meetings[meeting_id]
+        self._sizes.pop(meeting_id, None)
+        self._last_used.pop(meeting_id, None)
+        MEETINGS_EVICTED.inc()
+        logger.info(f"Evicted {state.status.value} meeting {meeting_id} from memory (~{size} bytes)")
+
+
+class InMemoryMeetingStore(MeetingStore):
+    """
+    Single-process store.
+
+    Nothing is loaded at startup; the first ``get`` for a meeting that is not
+    in memory rebuilds it from its snapshot plus journal replay on a worker
+    thread. Evicted meetings are snapshotted to disk first.
+    """
+
+    async def _load(self, meeting_id: str) -> Optional[MeetingState]:
+        return await self.storage.load_meeting(meeting_id)
+
+    async def _persist_evicted(self, state: MeetingState) -> None:
+        await self.storage.save_snapshot(state)
+        await self.storage.close_journal(state.meeting_id)
+
+
+def _meta_snapshot(state: MeetingState) -> dict:
+    """
+    Snapshot without transcript/interventions.
+
+    Participant counters are rebuilt from records: utterances from transcript
+    records, track-measured speaking time from speaking_time records.
+    """
+    meta = state_to_snapshot(state)
+    meta["transcript"] = []
+    meta["interventions"] = []
+    meta["parking_lot"] = []
+    for participant in meta["participants"]:
+        participant["speaking_time"] = 0.0
+        participant["speaking_count"] = 0
+    return meta
+
+
+class _SQLiteBackend:
+    """Blocking SQLite access for one process; call through ``asyncio.to_thread``."""
+
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+        self._conn.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS meetings (
+                meeting_id TEXT PRIMARY KEY,
+                meta_version INTEGER NOT NULL,
+                meta TEXT NOT NULL,
+                updated_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meeting_records (
+                seq INTEGER PRIMARY KEY AUTOINCREMENT,
+                meeting_id TEXT NOT NULL,
+                record TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_meeting_records ON meeting_records (meeting_id, seq);
+            CREATE TABLE IF NOT EXISTS meeting_pipelines (
+                meeting_id TEXT PRIMARY KEY,
+                owner TEXT NOT NULL,
+                expires_at REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS meeting_events (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                meeting_id TEXT NOT NULL,
+                origin TEXT NOT NULL,
+                kind TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at REAL NOT NULL
+            );
+            """
+        )
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _event(self, meeting_id: str, origin: str, kind: str, payload: str) -> None:
+        self._conn.execute(
+            "INSERT INTO meeting_events (meeting_id, origin, kind, payload, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            (meeting_id, origin, kind, payload, time.time()),
+        )
+
+    def save_meta(self, meeting_id: str, meta: str, origin: str, replace: bool) -> int:
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                if replace:
+                    self._conn.execute(
+                        "DELETE FROM meeting_records WHERE meeting_id = ?", (meeting_id,)
+                    )
+                version = self._conn.execute(
+                    "INSERT INTO meetings (meeting_id, meta_version, meta, updated_at) "
+                    "VALUES (?, 1, ?, ?) "
+                    "ON CONFLICT (meeting_id) DO UPDATE SET meta_version = meta_version + 1, "
+                    "meta = excluded.meta, updated_at = excluded.updated_at "
+                    "RETURNING meta_version",
+                    (meeting_id, meta, time.time()),
+                ).fetchone()[0]
+                self._event(meeting_id, origin, EVENT_STATE, "")
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return version
+
+    def append_records(
+        self, meeting_id: str, records: list[str], origin: str, after_seq: int
+    ) -> tuple[list[int], list[tuple[int, str]]]:
+        """Insert records; also return records other processes added after ``after_seq``."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                seqs = [
+                    self._conn.execute(
+                        "INSERT INTO meeting_records (meeting_id, record) VALUES (?, ?)",
+                        (meeting_id, record),
+                    ).lastrowid
+                    for record in records
+                ]
+                mine = set(seqs)
+                others = [
+                    row
+                    for row in self._conn.execute(
+                        "SELECT seq, record FROM meeting_records "
+                        "WHERE meeting_id = ? AND seq > ? ORDER BY seq",
+                        (meeting_id, after_seq),
+                    ).fetchall()
+                    if row[0] not in mine
+                ]
+                self._event(meeting_id, origin, EVENT_STATE, "")
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            return seqs, others
+
+    def load(self, meeting_id: str) -> Optional[tuple[int, str, list[tuple[int, str]]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT meta_version, meta FROM meetings WHERE meeting_id = ?", (meeting_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            records = self._conn.execute(
+                "SELECT seq, record FROM meeting_records WHERE meeting_id = ? ORDER BY seq",
+                (meeting_id,),
+            ).fetchall()
+            return row[0], row[1], records
+
+    def changes(
+        self, meeting_id: str, meta_version: int, after_seq: int
+    ) -> tuple[Optional[tuple[int, str]], list[tuple[int, str]]]:
+        """New metadata (if its version moved) and records after ``after_seq``."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT meta_version, meta FROM meetings WHERE meeting_id = ?", (meeting_id,)
+            ).fetchone()
+            meta = row if row is not None and row[0] != meta_version else None
+            records = self._conn.execute(
+                "SELECT seq, record FROM meeting_records WHERE meeting_id = ? AND seq > ? ORDER BY seq",
+                (meeting_id, after_seq),
+            ).fetchall()
+            return meta, records
+
+    def claim_lease(self, meeting_id: str, origin: str, ttl: float) -> bool:
+        """Take the meeting's pipeline lease if it is free, expired or already ours."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO meeting_pipelines (meeting_id, owner, expires_at) VALUES (?, ?, ?) "
+                "ON CONFLICT (meeting_id) DO UPDATE SET owner = excluded.owner, "
+                "expires_at = excluded.expires_at "
+                "WHERE meeting_pipelines.owner = excluded.owner OR meeting_pipelines.expires_at < ?",
+                (meeting_id, origin, now + ttl, now),
+            )
+            row = self._conn.execute(
+                "SELECT owner FROM meeting_pipelines WHERE meeting_id = ?", (meeting_id,)
+            ).fetchone()
+            return row is not None and row[0] == origin
+
+    def release_lease(self, meeting_id: str, origin: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM meeting_pipelines WHERE meeting_id = ? AND owner = ?",
+                (meeting_id, origin),
+            )
+
+    def publish(self, meeting_id: str, origin: str, payload: str) -> None:
+        with self._lock:
+            self._event(meeting_id, origin, EVENT_MESSAGE, payload)
+
+    def last_event_id(self) -> int:
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COALESCE(MAX(id), 0) FROM meeting_events"
+            ).fetchone()[0]
+
+    def events_after(self, event_id: int, origin: str) -> tuple[int, list[tuple[str, str, str]]]:
+        """Events from other processes after ``event_id``, and the new high-water mark."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, meeting_id, origin, kind, payload FROM meeting_events "
+                "WHERE id > ? ORDER BY id LIMIT 500",
+                (event_id,),
+            ).fetchall()
+        last_id = rows[-1][0] if rows else event_id
+        return last_id, [(m, k, p) for _, m, o, k, p in rows if o != origin]
+
+    def prune_events(self, older_than: float) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM meeting_events WHERE created_at < ?", (older_than,))
+
+
+class SQLiteMeetingStore(MeetingStore):
+    """
+    Store shared by several worker processes through one SQLite file (WAL mode).
+
+    Metadata lives in one row per meeting; transcript entries and
+    interventions are appended as individual records, so a worker brings its
+    cached copy up to date by applying only the records it has not seen.
+    Cached states are updated in place, never replaced, because WebSocket
+    pipelines hold references to them.
+
+    A small event table is the cross-process channel: every write emits a
+    ``state`` event and outbound client messages are published as
+    ``message`` events. Each worker polls it, refreshes meetings it has
+    cached, and relays messages to its own subscribers.
+
+    A lease row per meeting records which worker runs its pipeline, so only
+    one worker opens an STT session and analysis fan-out for a meeting. The
+    owner renews it while polling; a crashed owner's lease expires after
+    ``lease_ttl``.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        storage: Optional[StorageService] = None,
+        max_meetings: int = DEFAULT_MAX_MEETINGS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        lease_ttl: float = DEFAULT_PIPELINE_LEASE_TTL,
+    ):
+        super().__init__(storage, max_meetings, max_bytes)
+        self.path = path
+        self.poll_interval = poll_interval
+        self.lease_ttl = lease_ttl
+        self.origin = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._db = _SQLiteBackend(path)
+        # meeting_id -> [meta_version, last applied record seq]
+        self._markers: dict[str, list[int]] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
+        self._leases: set[str] = set()
+        self._poller: Optional[asyncio.Task] = None
+
+    def _lock_for(self, meeting_id: str) -> asyncio.Lock:
+        lock = self._locks.get(meeting_id)
+        if lock is None:
+            lock = self._locks[meeting_id] = asyncio.Lock()
+        return lock
+
+    async def start(self) -> None:
+        await super().start()
+        if self._poller is None:
+            last_id = await asyncio.to_thread(self._db.last_event_id)
+            self._poller = asyncio.create_task(self._poll(last_id))
+
+    async def close(self) -> None:
+        await super().close()
+        if self._poller is not None:
+            self._poller.cancel()
+            try:
+                await self._poller
+            except asyncio.CancelledError:
+                pass
+            self._poller = None
+        for meeting_id in list(self._leases):
+            await self.release_pipeline(meeting_id)
+        await asyncio.to_thread(self._db.close)
+
+    async def put(self, state: MeetingState) -> None:
+        meta = json.dumps(_meta_snapshot(state), ensure_ascii=False)
+        records = [transcript_record(t) for t in state.transcript]
+        records += [intervention_record(i) for i in state.interventions]
+        async with self._lock_for(state.meeting_id):
+            version = await asyncio.to_thread(
+                self._db.save_meta, state.meeting_id, meta, self.origin, True
+            )
+            last_seq = 0
+            if records:
+                seqs, _ = await asyncio.to_thread(
+                    self._db.append_records,
+                    state.meeting_id,
+                    [json.dumps(r, ensure_ascii=False) for r in records],
+                    self.origin,
+                    0,
+                )
+                last_seq = seqs[-1]
+            self._markers[state.meeting_id] = [version, last_seq]
+        await self._cache(state)
+
+    async def save_meta(self, state: MeetingState) -> None:
+        meta = json.dumps(_meta_snapshot(state), ensure_ascii=False)
+        async with self._lock_for(state.meeting_id):
+            version = await asyncio.to_thread(
+                self._db.save_meta, state.meeting_id, meta, self.origin, False
+            )
+            self._markers.setdefault(state.meeting_id, [0, 0])[0] = version
+
+    def meta_version(self, meeting_id: str) -> int:
+        marker = self._markers.get(meeting_id)
+        return marker[0] if marker is not None else 0
+
+    async def append_record(self, state: MeetingState, record: dict) -> None:
+        payload = json.dumps(record, ensure_ascii=False)
+        async with self._lock_for(state.meeting_id):
+            marker = self._markers.setdefault(state.meeting_id, [0, 0])
+            seqs, others = await asyncio.to_thread(
+                self._db.append_records, state.meeting_id, [payload], self.origin, marker[1]
+            )
+            # Records written by other workers since our last look
+            self._apply_records(state, others)
+            marker[1] = max(seqs + [seq for seq, _ in others])
+
+    async def claim_pipeline(self, meeting_id: str) -> bool:
+        claimed = await asyncio.to_thread(
+            self._db.claim_lease, meeting_id, self.origin, self.lease_ttl
+        )
+        if claimed:
+            self._leases.add(meeting_id)
+        return claimed
+
+    async def release_pipeline(self, meeting_id: str) -> None:
+        self._leases.discard(meeting_id)
+        await asyncio.to_thread(self._db.release_lease, meeting_id, self.origin)
+
+    async def _renew_leases(self) -> None:
+        for meeting_id in list(self._leases):
+            if not await asyncio.to_thread(
+                self._db.claim_lease, meeting_id, self.origin, self.lease_ttl
+            ):
+                self._leases.discard(meeting_id)
+                logger.error(f"Lost the pipeline lease for meeting {meeting_id} to another worker")
+
+    async def publish(self, meeting_id: str, message: dict) -> None:
+        payload = json.dumps(message, ensure_ascii=False, separators=(",", ":"))
+        await asyncio.to_thread(self._db.publish, meeting_id, self.origin, payload)
+
+    async def _load(self, meeting_id: str) -> Optional[MeetingState]:
+        loaded = await asyncio.to_thread(self._db.load, meeting_id)
+        if loaded is None:
+            # Meetings persisted before the shared store was enabled
+            state = await self.storage.load_meeting(meeting_id)
+            if state is not None:
+                await self.put(state)
+            return state
+
+        meta_version, meta, rows = loaded
+        records = [json.loads(record) for _, record in rows]
+        state = state_from_snapshot(meeting_id, json.loads(meta), records)
+        self._markers[meeting_id] = [meta_version, rows[-1][0] if rows else 0]
+        return state
+
+    async def _refresh(self, state: MeetingState) -> None:
+        async with self._lock_for(state.meeting_id):
+            marker = self._markers.setdefault(state.meeting_id, [0, 0])
+            meta, rows = await asyncio.to_thread(
+                self._db.changes, state.meeting_id, marker[0], marker[1]
+            )
+            if meta is not None:
+                self._apply_meta(state, json.loads(meta[1]))
+                marker[0] = meta[0]
+            if rows:
+                self._apply_records(state, rows)
+                marker[1] = rows[-1][0]
+
+    @staticmethod
+    def _apply_meta(state: MeetingState, meta: dict) -> None:
+        fresh = state_from_snapshot(state.meeting_id, meta, [])
+        state.title = fresh.title
+        state.agenda = fresh.agenda
+        state.principles = fresh.principles
+        state.status = fresh.status
+        state.started_at = fresh.started_at
+        state.ended_at = fresh.ended_at
+        state.touch()
+
+    @staticmethod
+    def _apply_records(state: MeetingState, rows: list[tuple[int, str]]) -> None:
+        for _, payload in rows:
+            record = json.loads(payload)
+            data = record.get("data") or {}
+            if record.get("kind") == RECORD_TRANSCRIPT:
+                entry = TranscriptEntry(**data)
+                state.speaker_stats.record_utterance(entry.speaker, entry.duration, entry_id=entry.id)
+                state.add_transcript(entry)
+            elif record.get("kind") == RECORD_SPEAKER_UPDATE:
+                state.reassign_speaker(data["entry_id"], data["speaker"])
+            elif record.get("kind") == RECORD_SPEAKING_TIME:
+                state.speaker_stats.add_speaking_time(data["speaker"], data["seconds"])
+            elif record.get("kind") == RECORD_INTERVENTION:
+                state.add_intervention(Intervention(
+                    **{**data, "intervention_type": InterventionType(data["intervention_type"])}
+                ))
+
+    async def _persist_evicted(self, state: MeetingState) -> None:
+        # Everything is already in the database; only release the journal
+        await self.storage.close_journal(state.meeting_id)
+        self._markers.pop(state.meeting_id, None)
+        self._locks.pop(state.meeting_id, None)
+
+    async def _poll(self, last_id: int) -> None:
+        last_prune = time.monotonic()
+        last_renew = time.monotonic()
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                last_id, events = await asyncio.to_thread(
+                    self._db.events_after, last_id, self.origin
+                )
+                for meeting_id, kind, payload in events:
+                    if kind == EVENT_MESSAGE:
+                        message = json.loads(payload)
+                        for listener in self._listeners:
+                            await listener(meeting_id, message)
+                    elif kind == EVENT_STATE and meeting_id in self._meetings:
+                        # Keep live pipelines on this worker in sync with writes elsewhere
+                        await self._refresh(self._meetings[meeting_id])
+
+                if time.monotonic() - last_renew >= self.lease_ttl / 3:
+                    last_renew = time.monotonic()
+                    await self._renew_leases()
+
+                if time.monotonic() - last_prune >= EVENT_RETENTION_SECONDS:
+                    last_prune = time.monotonic()
+                    await asyncio.to_thread(
+                        self._db.prune_events, time.time() - EVENT_RETENTION_SECONDS
+                    )
+            except Exception as e:
+                logger.error(f"Meeting store event poll failed: {e}", exc_info=True)
+
+
+def create_meeting_store(kind: str = DEFAULT_MEETING_STORE) -> MeetingStore:
+    """Build the configured store (MEETING_STORE=memory|sqlite)."""
+    storage = StorageService()
+    if kind == MEETING_STORE_SQLITE:
+        path = Path(DEFAULT_SQLITE_PATH) if DEFAULT_SQLITE_PATH else storage.base_path / "meetings.db"
+        return SQLiteMeetingStore(path, storage)
+    if kind != MEETING_STORE_MEMORY:
+        raise ValueError(f"Unknown MEETING_STORE: {kind}")
+    return InMemoryMeetingStore(storage)
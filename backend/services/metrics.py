@@ -0,0 +1,267 @@
+"""In-process metrics with Prometheus text exposition."""
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _format_labels(labelnames: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric(ABC):
+    kind = ""
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.labelnames = labelnames
+
+    def _key(self, labels: dict) -> tuple[str, ...]:
+        return tuple(str(labels.get(name, "")) for name in self.labelnames)
+
+    def _header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        pass
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for key, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()):
+        super().__init__(name, help_text, labelnames)
+        self._values: dict[tuple[str, ...], float] = {}
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+    def inc(self, amount: float = 1.0, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for key, value in self._values.items():
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # per label set: [bucket counts..., +Inf count], sum
+        self._counts: dict[tuple[str, ...], list[int]] = {}
+        self._sums: dict[tuple[str, ...], float] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        counts = self._counts.get(key)
+        if counts is None:
+            counts = self._counts[key] = [0] * (len(self.buckets) + 1)
+            self._sums[key] = 0.0
+        counts[bisect_left(self.buckets, value)] += 1
+        self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the wall-clock duration of the enclosed block."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels) -> int:
+        return sum(self._counts.get(self._key(labels), []))
+
+    def render(self) -> list[str]:
+        lines = self._header()
+        for key, counts in self._counts.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}"
+                )
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(self._sums[key])}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric already registered: {metric.name}")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, help_text, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        help_text: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, help_text, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+# Live meeting pipeline metrics
+AUDIO_CHUNKS_IN = REGISTRY.counter(
+    "meetingmod_audio_chunks_received_total",
+    "Audio chunks received from browser clients",
+)
+AUDIO_FRAMES_OUT = REGISTRY.counter(
+    "meetingmod_audio_frames_sent_total",
+    "Coalesced audio frames sent to the Realtime API",
+)
+AUDIO_CHUNKS_DROPPED = REGISTRY.counter(
+    "meetingmod_audio_chunks_dropped_total",
+    "Audio chunks dropped before reaching the Realtime API",
+    ("reason",),
+)
+AUDIO_BYTES = REGISTRY.counter(
+    "meetingmod_audio_bytes_total",
+    "Audio bytes forwarded upstream or suppressed as silence",
+    ("outcome",),
+)
+STT_TRANSCRIPTION_LATENCY = REGISTRY.histogram(
+    "meetingmod_stt_transcription_latency_seconds",
+    "Time from VAD speech end to completed transcription",
+)
+AGENT_ANALYSIS_LATENCY = REGISTRY.histogram(
+    "meetingmod_agent_analysis_latency_seconds",
+    "Per-agent analysis latency",
+    ("agent",),
+)
+PREFILTER_SKIPPED_CALLS = REGISTRY.counter(
+    "meetingmod_prefilter_skipped_calls_total",
+    "LLM agent calls skipped by the lexical pre-filter",
+)
+TRIGGER_INDEX_SKIPPED_CALLS = REGISTRY.counter(
+    "meetingmod_principle_trigger_skipped_calls_total",
+    "PrincipleAgent LLM calls skipped because no principle trigger matched",
+)
+INTERVENTIONS = REGISTRY.counter(
+    "meetingmod_interventions_total",
+    "Interventions emitted by type",
+    ("type",),
+)
+WEBSOCKET_SEND_LATENCY = REGISTRY.histogram(
+    "meetingmod_websocket_send_latency_seconds",
+    "Latency of server-to-client WebSocket sends",
+    ("type",),
+)
+WEBSOCKET_SUBSCRIBERS = REGISTRY.gauge(
+    "meetingmod_websocket_subscribers",
+    "Connected WebSocket subscribers across all meetings",
+)
+WEBSOCKET_SLOW_CONSUMERS = REGISTRY.counter(
+    "meetingmod_websocket_slow_consumer_disconnects_total",
+    "WebSocket subscribers disconnected for not keeping up",
+    ("reason",),
+)
+ACTIVE_MEETINGS = REGISTRY.gauge(
+    "meetingmod_active_meetings",
+    "Meetings with a connected WebSocket",
+)
+ANALYSIS_CACHE_HITS = REGISTRY.counter(
+    "meetingmod_analysis_cache_hits_total",
+    "Analysis cache hits",
+)
+ANALYSIS_CACHE_MISSES = REGISTRY.counter(
+    "meetingmod_analysis_cache_misses_total",
+    "Analysis cache misses (including expired entries)",
+)
+MEETINGS_CACHED = REGISTRY.gauge(
+    "meetingmod_meetings_cached",
+    "Meetings held in memory",
+)
+MEETINGS_CACHE_BYTES = REGISTRY.gauge(
+    "meetingmod_meetings_cache_bytes",
+    "Estimated memory used by in-memory meetings",
+)
+MEETING_MEMORY_MAX_BYTES = REGISTRY.gauge(
+    "meetingmod_meeting_memory_max_bytes",
+    "Estimated memory used by the largest in-memory meeting",
+)
+MEETINGS_EVICTED = REGISTRY.counter(
+    "meetingmod_meetings_evicted_total",
+    "Completed or idle meetings evicted from memory to disk",
+)
+MEETINGS_LOADED = REGISTRY.counter(
+    "meetingmod_meetings_loaded_total",
+    "Meetings rehydrated from disk",
+)
@@ -1,23 +1,41 @@
 import os
 import re
+import threading
+import time
 import uuid
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
 from pydantic import BaseModel
 
+# Minimum seconds between mtime checks of the principles directory
+PRINCIPLES_RECHECK_INTERVAL = float(os.getenv("PRINCIPLES_RECHECK_INTERVAL", "1.0"))
+
+# "1. **Name**", "- **Name**: description", "2. Name"
+_RULE_ITEM_RE = re.compile(r"^\s*(?:\d+[.)]|[-*])\s+(?:\*\*(?P<bold>.+?)\*\*)?(?P<rest>.*)$")
+_TRIGGER_LINE_RE = re.compile(r"^\s*(?:트리거|triggers?)\s*:\s*(?P<phrases>.+)$", re.IGNORECASE)
+
+
+class PrincipleRule(BaseModel):
+    name: str
+    description: str = ""
+    triggers: list[str] = []
+
 
 class Principle(BaseModel):
     id: str
     name: str
     filePath: str
     content: str
+    rules: list[PrincipleRule] = []
 
 
 class PrincipleDetail(BaseModel):
     id: str
     name: str
     content: str
+    rules: list[PrincipleRule] = []
 
 
 class PrincipleCreate(BaseModel):
@@ -36,8 +54,61 @@ class PrincipleCreateResponse(BaseModel):
     filePath: str
 
 
+def parse_rules(content: str) -> list[PrincipleRule]:
+    """Parse the numbered/bulleted rule list of a principle markdown file.
+
+    A ``트리거:`` / ``Triggers:`` line under a rule lists comma-separated
+    phrases used to pre-screen utterances before any LLM call.
+    """
+    rules: list[PrincipleRule] = []
+    name: Optional[str] = None
+    description: list[str] = []
+    triggers: list[str] = []
+
+    def flush():
+        if name:
+            rules.append(PrincipleRule(name=name, description=" ".join(description), triggers=triggers))
+
+    for line in content.split("\n"):
+        if line.lstrip().startswith("#"):
+            continue
+        match = _RULE_ITEM_RE.match(line)
+        if match:
+            flush()
+            rest = match.group("rest").strip().lstrip(":-– ").strip()
+            if match.group("bold"):
+                name, description = match.group("bold").strip(), [rest] if rest else []
+            else:
+                name, description = rest, []
+            triggers = []
+        elif name and (trigger := _TRIGGER_LINE_RE.match(line)):
+            triggers = [p.strip() for p in trigger.group("phrases").split(",") if p.strip()]
+        elif name and line.strip():
+            description.append(line.strip())
+        elif name and not line.strip() and description:
+            flush()
+            name, description, triggers = None, [], []
+    flush()
+    return rules
+
+
+@dataclass
+class _IndexEntry:
+    mtime_ns: int
+    principle: Principle
+
+
 class PrinciplesService:
-    def __init__(self, base_path: str | None = None):
+    """
+    Principle markdown files with a parsed in-memory index.
+
+    Reads are served from the index. It is refreshed only when the
+    directory's or a file's mtime changes (checked at most every
+    ``recheck_interval`` seconds), and create/update/delete update it in
+    place.
+    """
+
+    def __init__(self, base_path: str | None = None, recheck_interval: float = PRINCIPLES_RECHECK_INTERVAL):
         if base_path:
             self.base_path = Path(base_path)
         else:
@@ -48,6 +119,75 @@ class PrinciplesService:
                 self.base_path = Path(__file__).parent.parent.parent / "principles"
         self.base_path.mkdir(parents=True, exist_ok=True)
 
+        self.recheck_interval = recheck_interval
+        self._index: dict[str, _IndexEntry] = {}
+        self._dir_mtime_ns: Optional[int] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def _build(self, md_file: Path) -> Optional[_IndexEntry]:
+        try:
+            mtime_ns = md_file.stat().st_mtime_ns
+            content = md_file.read_text(encoding="utf-8")
+        except OSError:
+            # Skip files that can't be read
+            return None
+        principle_id = md_file.stem
+        return _IndexEntry(
+            mtime_ns=mtime_ns,
+            principle=Principle(
+                id=principle_id,
+                name=self._extract_name_from_content(content, principle_id),
+                filePath=f"principles/{md_file.name}",
+                content=content,
+                rules=parse_rules(content),
+            ),
+        )
+
+    def _refresh(self, force: bool = False) -> None:
+        """Re-read only files whose mtime changed since the last check."""
+        now = time.monotonic()
+        if not force and now - self._checked_at < self.recheck_interval:
+            return
+        with self._lock:
+            self._checked_at = now
+            if not self.base_path.exists():
+                self._index.clear()
+                return
+
+            dir_mtime_ns = self.base_path.stat().st_mtime_ns
+            if dir_mtime_ns != self._dir_mtime_ns:
+                # Files were added, removed or renamed
+                self._dir_mtime_ns = dir_mtime_ns
+                current = {f.stem: f for f in self.base_path.glob("*.md")}
+                for principle_id in set(self._index) - set(current):
+                    del self._index[principle_id]
+            else:
+                current = {pid: self.base_path / f"{pid}.md" for pid in self._index}
+
+            for principle_id, md_file in current.items():
+                entry = self._index.get(principle_id)
+                try:
+                    mtime_ns = md_file.stat().st_mtime_ns
+                except OSError:
+                    self._index.pop(principle_id, None)
+                    continue
+                if entry is None or entry.mtime_ns != mtime_ns:
+                    built = self._build(md_file)
+                    if built is None:
+                        self._index.pop(principle_id, None)
+                    else:
+                        self._index[principle_id] = built
+
+    def _store(self, md_file: Path) -> Optional[Principle]:
+        """Index a file just written by this service."""
+        entry = self._build(md_file)
+        if entry is None:
+            return None
+        with self._lock:
+            self._index[md_file.stem] = entry
+        return entry.principle
+
     def _extract_name_from_content(self, content: str, fallback_id: str) -> str:
         """Extract principle name from markdown heading or return fallback."""
         lines = content.strip().split("\n")
@@ -77,59 +217,52 @@ class PrinciplesService:
 
     def list_principles(self) -> list[Principle]:
         """List all principles from the principles directory."""
-        principles = []
-
-        if not self.base_path.exists():
-            return principles
-
-        for md_file in sorted(self.base_path.glob("*.md")):
-            principle_id = md_file.stem
-            try:
-                content = md_file.read_text(encoding="utf-8")
-                name = self._extract_name_from_content(content, principle_id)
-                file_path = f"principles/{md_file.name}"
-
-                principles.append(Principle(
-                    id=principle_id,
-                    name=name,
-                    filePath=file_path,
-                    content=content
-                ))
-            except Exception:
-                # Skip files that can't be read
-                continue
-
-        return principles
+        self._refresh()
+        return [self._index[pid].principle for pid in sorted(self._index)]
 
     def get_principle(self, principle_id: str) -> Optional[PrincipleDetail]:
         """Get a single principle by ID."""
-        file_path = self.base_path / f"{principle_id}.md"
-
-        if not file_path.exists():
-            return None
-
-        try:
-            content = file_path.read_text(encoding="utf-8")
-            name = self._extract_name_from_content(content, principle_id)
-
-            return PrincipleDetail(
-                id=principle_id,
-                name=name,
-                content=content
-            )
-        except Exception:
+        self._refresh()
+        entry = self._index.get(principle_id)
+        if entry is None:
             return None
+        principle = entry.principle
+        return PrincipleDetail(
+            id=principle.id,
+            name=principle.name,
+            content=principle.content,
+            rules=principle.rules,
+        )
+
+    def get_meeting_principles(self, principle_ids: list[str]) -> list[dict]:
+        """Flatten the rules of the selected principles for a meeting."""
+        self._refresh()
+        principles = []
+        for principle_id in principle_ids:
+            entry = self._index.get(principle_id)
+            if entry is None:
+                continue
+            for rule in entry.principle.rules:
+                principles.append({
+                    "id": principle_id,
+                    "name": rule.name,
+                    "description": rule.description,
+                    "triggers": rule.triggers,
+                })
+        return principles
 
     def update_principle(self, principle_id: str, update: PrincipleUpdate) -> Optional[PrincipleDetail]:
         """Update an existing principle."""
         file_path = self.base_path / f"{principle_id}.md"
 
-        if not file_path.exists():
+        self._refresh()
+        entry = self._index.get(principle_id)
+        if entry is None:
             return None
 
         try:
-            # Read current content if we need to preserve it
-            current_content = file_path.read_text(encoding="utf-8")
+            # Current content comes from the index
+            current_content = entry.principle.content
 
             # Determine new content
             new_content = update.content if update.content is not None else current_content
@@ -149,11 +282,14 @@ class PrinciplesService:
             file_path.write_text(new_content, encoding="utf-8")
 
             # Return updated principle
-            name = self._extract_name_from_content(new_content, principle_id)
+            principle = self._store(file_path)
+            if principle is None:
+                return None
             return PrincipleDetail(
-                id=principle_id,
-                name=name,
-                content=new_content
+                id=principle.id,
+                name=principle.name,
+                content=principle.content,
+                rules=principle.rules,
             )
         except Exception:
             return None
@@ -172,6 +308,7 @@ class PrinciplesService:
 
             # Write the file
             file_path.write_text(content, encoding="utf-8")
+            self._store(file_path)
 
             return PrincipleCreateResponse(
                 id=principle_id,
@@ -190,6 +327,8 @@ class PrinciplesService:
 
         try:
             file_path.unlink()
+            with self._lock:
+                self._index.pop(principle_id, None)
             return True
         except Exception:
             return False
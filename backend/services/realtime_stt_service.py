@@ -1,7 +1,10 @@
 import asyncio
+import base64
 import json
 import logging
 import os
+import time
+from collections import deque
 from enum import Enum
 from typing import Callable, Optional
 
@@ -14,6 +17,16 @@ from websockets.exceptions import (
     WebSocketException,
 )
 
+from services.metrics import (
+    AUDIO_BYTES,
+    AUDIO_CHUNKS_DROPPED,
+    AUDIO_FRAMES_OUT,
+    STT_TRANSCRIPTION_LATENCY,
+)
+from services.diarization_service import SpeakerDiarizer
+from services.silence_suppressor import SilenceSuppressor
+from services.track_mixer import TrackMixer
+
 # Configure module logger
 logger = logging.getLogger(__name__)
 
@@ -27,6 +40,11 @@ DEFAULT_PING_TIMEOUT = 10.0  # seconds
 MAX_RECONNECT_ATTEMPTS = 3
 RECONNECT_DELAY_BASE = 1.0  # seconds (exponential backoff base)
 
+# Audio send queue configuration
+DEFAULT_SEND_QUEUE_MAX_CHUNKS = 64
+DEFAULT_COALESCE_MAX_BYTES = 48000  # 1s of PCM16 mono @ 24kHz
+DEFAULT_COALESCE_MAX_DELAY = 0.05  # seconds to wait for adjacent chunks
+
 
 class ConnectionState(Enum):
     """Connection state for the STT service."""
@@ -37,6 +55,12 @@ class ConnectionState(Enum):
     FAILED = "failed"
 
 
+class AudioOverflowPolicy(Enum):
+    """What to do when the audio send queue is full."""
+    DROP_OLDEST = "drop_oldest"
+    BLOCK = "block"
+
+
 class STTError(Exception):
     """Base exception for STT service errors."""
     pass
@@ -69,6 +93,12 @@ class RealtimeSTTService:
         api_key: Optional[str] = None,
         auto_reconnect: bool = True,
         max_reconnect_attempts: int = MAX_RECONNECT_ATTEMPTS,
+        send_queue_max_chunks: int = DEFAULT_SEND_QUEUE_MAX_CHUNKS,
+        overflow_policy: AudioOverflowPolicy = AudioOverflowPolicy.DROP_OLDEST,
+        coalesce_max_bytes: int = DEFAULT_COALESCE_MAX_BYTES,
+        coalesce_max_delay: float = DEFAULT_COALESCE_MAX_DELAY,
+        silence_suppressor: Optional[SilenceSuppressor] = None,
+        diarizer: Optional[SpeakerDiarizer | TrackMixer] = None,
     ):
         """
         Initialize the Realtime STT service.
@@ -77,11 +107,36 @@ class RealtimeSTTService:
             api_key: OpenAI API key. If not provided, reads from OPENAI_API_KEY env var.
             auto_reconnect: Whether to automatically reconnect on connection loss.
             max_reconnect_attempts: Maximum number of reconnection attempts.
+            send_queue_max_chunks: Capacity of the outbound audio queue.
+            overflow_policy: Drop the oldest chunk or block the producer when full.
+            coalesce_max_bytes: Upper bound on a merged upstream audio frame.
+            coalesce_max_delay: Time budget for adjacent chunks to accumulate.
+            silence_suppressor: Optional stage that drops silent frames before queueing.
+            diarizer: Optional stage that attributes VAD segments to speakers, either by
+                voice (SpeakerDiarizer) or by per-participant track energy (TrackMixer).
         """
         self.api_key = api_key or os.getenv("OPENAI_API_KEY")
         self.auto_reconnect = auto_reconnect
         self.max_reconnect_attempts = max_reconnect_attempts
 
+        # Outbound audio queue drained by a dedicated sender task
+        self.send_queue_max_chunks = send_queue_max_chunks
+        self.overflow_policy = overflow_policy
+        self.coalesce_max_bytes = coalesce_max_bytes
+        self.coalesce_max_delay = coalesce_max_delay
+        self.silence_suppressor = silence_suppressor
+        self.diarizer = diarizer
+        self._send_queue: deque[bytes | memoryview] = deque()
+        self._queued_bytes = 0
+        self._queue_not_empty = asyncio.Event()
+        self._queue_not_full = asyncio.Event()
+        self._queue_not_full.set()
+        self._send_task: Optional[asyncio.Task] = None
+        self.dropped_chunks = 0
+        self.failed_sends = 0
+        self.sent_frames = 0
+        self.sent_chunks = 0
+
         self._ws: Optional[websockets.WebSocketClientProtocol] = None
         self._receive_task: Optional[asyncio.Task] = None
         self._state = ConnectionState.DISCONNECTED
@@ -95,6 +150,11 @@ class RealtimeSTTService:
         self._on_error: Optional[Callable] = None
         self._on_connection_state_change: Optional[Callable] = None
 
+        # VAD speech offsets (ms) keyed by conversation item id
+        self._speech_start_ms: Optional[int] = None
+        self._speech_durations: dict[str, float] = {}
+        self._speech_stopped_at: dict[str, float] = {}
+
     @property
     def state(self) -> ConnectionState:
         """Get the current connection state."""
@@ -139,7 +199,10 @@ class RealtimeSTTService:
         Connect to the OpenAI Realtime API.
 
         Args:
-            on_transcript: Async callback called with transcript text when speech is recognized.
+            on_transcript: Async callback called with the transcript text, the utterance
+                duration in seconds (from VAD offsets, 0.0 if unknown) and the diarization
+                result (None without a diarizer or when the segment was too short) when
+                speech is recognized.
             on_speech_end: Optional async callback called when speech ends (VAD detected silence).
             on_error: Optional async callback called when an error occurs.
             on_connection_state_change: Optional callback for connection state changes.
@@ -164,6 +227,12 @@ class RealtimeSTTService:
 
             await self._establish_connection()
 
+            if self._send_task is None or self._send_task.done():
+                self._send_task = asyncio.create_task(
+                    self._send_loop(),
+                    name="realtime_stt_send_loop"
+                )
+
     async def _establish_connection(self) -> None:
         """Establish WebSocket connection to the Realtime API."""
         self._set_state(ConnectionState.CONNECTING)
@@ -209,6 +278,9 @@ class RealtimeSTTService:
 
             self._set_state(ConnectionState.CONNECTED)
             self._reconnect_count = 0
+            if self.diarizer is not None:
+                # Audio offsets restart at 0 for every new session
+                self.diarizer.reset_timeline()
 
             # Start the receive loop
             self._receive_task = asyncio.create_task(
@@ -288,11 +360,11 @@ class RealtimeSTTService:
         """Process a message received from the API."""
         event_type = data.get("type", "")
 
-        # Log ALL events for debugging
+        # Log error events in full; everything else only at debug level
         if "error" in event_type or "failed" in event_type:
             logger.error(f"OpenAI Event: {event_type} | FULL Data: {json.dumps(data, ensure_ascii=False)}")
-        else:
-            logger.info(f"OpenAI Event: {event_type} | Data: {str(data)[:200]}")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"OpenAI Event: {event_type} | Data: {str(data)[:200]}")
 
         if event_type == "error":
             error_info = data.get("error", {})
@@ -312,15 +384,25 @@ class RealtimeSTTService:
 
         if event_type == "conversation.item.input_audio_transcription.completed":
             transcript = data.get("transcript", "").strip()
+            item_id = data.get("item_id", "")
+            duration = self._speech_durations.pop(item_id, 0.0)
+            stopped_at = self._speech_stopped_at.pop(item_id, None)
+            diarized = self.diarizer.take(item_id) if self.diarizer is not None else None
+            if stopped_at is not None:
+                STT_TRANSCRIPTION_LATENCY.observe(time.monotonic() - stopped_at)
             logger.info(f"Transcription completed: '{transcript}'")
             if transcript and self._on_transcript:
                 try:
-                    await self._on_transcript(transcript)
+                    await self._on_transcript(transcript, duration, diarized)
                 except Exception as e:
                     logger.error(f"Error in transcript callback: {e}", exc_info=True)
             return
 
         if event_type == "conversation.item.input_audio_transcription.failed":
+            self._speech_durations.pop(data.get("item_id", ""), None)
+            self._speech_stopped_at.pop(data.get("item_id", ""), None)
+            if self.diarizer is not None:
+                self.diarizer.take(data.get("item_id", ""))
             error_info = data.get("error", {})
             logger.error(f"=== TRANSCRIPTION FAILED ===")
             logger.error(f"Error Type: {error_info.get('type', 'unknown')}")
@@ -331,10 +413,21 @@ class RealtimeSTTService:
 
         if event_type == "input_audio_buffer.speech_started":
             logger.debug("Speech started")
+            self._speech_start_ms = data.get("audio_start_ms")
             return
 
         if event_type == "input_audio_buffer.speech_stopped":
             logger.debug("Speech stopped")
+            self._speech_stopped_at[data.get("item_id", "")] = time.monotonic()
+            end_ms = data.get("audio_end_ms")
+            if self._speech_start_ms is not None and end_ms is not None:
+                self._speech_durations[data.get("item_id", "")] = max(
+                    0.0, (end_ms - self._speech_start_ms) / 1000
+                )
+                if self.diarizer is not None:
+                    # Embed now, while the transcription is still in flight
+                    self.diarizer.end_segment(data.get("item_id", ""), self._speech_start_ms, end_ms)
+            self._speech_start_ms = None
             if self._on_speech_end:
                 try:
                     await self._on_speech_end()
@@ -393,6 +486,112 @@ class RealtimeSTTService:
             # The _establish_connection method will call _handle_connection_loss again
             # via the receive loop if needed
 
+    def send_stats(self) -> dict:
+        """Snapshot of the outbound audio queue counters."""
+        stats = {
+            "queueDepth": len(self._send_queue),
+            "queuedBytes": self._queued_bytes,
+            "droppedChunks": self.dropped_chunks,
+            "failedSends": self.failed_sends,
+            "sentFrames": self.sent_frames,
+            "sentChunks": self.sent_chunks,
+        }
+        if self.silence_suppressor is not None:
+            stats.update(self.silence_suppressor.stats())
+        if self.diarizer is not None:
+            stats.update(self.diarizer.stats())
+        return stats
+
+    async def enqueue_audio(self, pcm: bytes | memoryview) -> bool:
+        """
+        Queue raw PCM16 audio for the sender task (after silence suppression).
+
+        Never waits on the upstream socket. When the queue is full the
+        overflow policy either drops the oldest chunk or blocks until the
+        sender catches up.
+
+        Returns:
+            True if the chunk was queued, False otherwise.
+        """
+        if not self.is_connected:
+            logger.debug("Cannot queue audio: not connected")
+            return False
+
+        if not pcm:
+            return False
+
+        # Skip or thin out silent frames (padding around speech is kept)
+        if self.silence_suppressor is not None:
+            suppressed_before = self.silence_suppressor.bytes_suppressed
+            pcm = self.silence_suppressor.process(pcm)
+            AUDIO_BYTES.inc(
+                self.silence_suppressor.bytes_suppressed - suppressed_before,
+                outcome="suppressed",
+            )
+            if not pcm:
+                return True
+        AUDIO_BYTES.inc(len(pcm), outcome="forwarded")
+
+        while len(self._send_queue) >= self.send_queue_max_chunks:
+            if self.overflow_policy == AudioOverflowPolicy.BLOCK:
+                self._queue_not_full.clear()
+                await self._queue_not_full.wait()
+                continue
+            dropped = self._send_queue.popleft()
+            self._queued_bytes -= len(dropped)
+            self.dropped_chunks += 1
+            AUDIO_CHUNKS_DROPPED.inc(reason="queue_full")
+            logger.debug(f"Audio send queue full, dropped oldest chunk ({self.dropped_chunks} total)")
+
+        self._send_queue.append(pcm)
+        self._queued_bytes += len(pcm)
+        self._queue_not_empty.set()
+        return True
+
+    async def _send_loop(self) -> None:
+        """Drain the audio queue, merging adjacent chunks into larger frames."""
+        try:
+            while True:
+                if not self._send_queue:
+                    self._queue_not_empty.clear()
+                    await self._queue_not_empty.wait()
+                    continue
+
+                # Give adjacent chunks a short time budget to accumulate
+                if self.coalesce_max_delay > 0 and self._queued_bytes < self.coalesce_max_bytes:
+                    await asyncio.sleep(self.coalesce_max_delay)
+
+                chunks = [self._send_queue.popleft()]
+                frame_bytes = len(chunks[0])
+                while (
+                    self._send_queue
+                    and frame_bytes + len(self._send_queue[0]) <= self.coalesce_max_bytes
+                ):
+                    chunk = self._send_queue.popleft()
+                    chunks.append(chunk)
+                    frame_bytes += len(chunk)
+                self._queued_bytes -= frame_bytes
+                self._queue_not_full.set()
+
+                frame = chunks[0] if len(chunks) == 1 else b"".join(chunks)
+                if await self.send_audio_pcm(frame):
+                    if self.diarizer is not None:
+                        self.diarizer.feed(frame)
+                    self.sent_frames += 1
+                    self.sent_chunks += len(chunks)
+                    AUDIO_FRAMES_OUT.inc()
+                else:
+                    self.failed_sends += 1
+                    self.dropped_chunks += len(chunks)
+                    AUDIO_CHUNKS_DROPPED.inc(len(chunks), reason="send_failed")
+                    logger.warning(
+                        f"Failed to send {len(chunks)} audio chunk(s) upstream "
+                        f"({self.dropped_chunks} dropped total)"
+                    )
+        except asyncio.CancelledError:
+            logger.debug("Send loop cancelled")
+            raise
+
     async def send_audio(self, audio_base64: str) -> bool:
         """
         Send audio data to the Realtime API.
@@ -426,6 +625,41 @@ class RealtimeSTTService:
             logger.error(f"Error sending audio: {e}", exc_info=True)
             return False
 
+    async def send_audio_pcm(self, pcm: bytes | bytearray | memoryview) -> bool:
+        """
+        Send raw PCM16 audio to the Realtime API.
+
+        The bytes are base64-encoded exactly once and spliced into the event
+        frame directly; base64 output needs no JSON escaping, so the frame is
+        not passed through json.dumps.
+
+        Args:
+            pcm: Little-endian PCM16 mono audio at 24kHz.
+
+        Returns:
+            True if audio was sent successfully, False otherwise.
+        """
+        if not self.is_connected:
+            logger.warning("Cannot send audio: not connected")
+            return False
+
+        if not pcm:
+            logger.warning("Cannot send empty audio data")
+            return False
+
+        try:
+            audio_base64 = base64.b64encode(pcm).decode("ascii")
+            await self._ws.send(
+                '{"type":"input_audio_buffer.append","audio":"' + audio_base64 + '"}'
+            )
+            return True
+        except ConnectionClosed:
+            logger.warning("Cannot send audio: connection closed")
+            return False
+        except Exception as e:
+            logger.error(f"Error sending audio: {e}", exc_info=True)
+            return False
+
     async def commit_audio(self) -> bool:
         """
         Commit the current audio buffer, triggering transcription.
@@ -481,6 +715,20 @@ class RealtimeSTTService:
         async with self._lock:
             self._should_reconnect = False  # Prevent reconnection attempts
 
+            # Stop the sender task and discard queued audio
+            if self._send_task and not self._send_task.done():
+                self._send_task.cancel()
+                try:
+                    await self._send_task
+                except asyncio.CancelledError:
+                    pass  # Expected
+                except Exception as e:
+                    logger.error(f"Error waiting for send task: {e}")
+            self._send_task = None
+            self._send_queue.clear()
+            self._queued_bytes = 0
+            self._queue_not_full.set()
+
             # Cancel the receive task
             if self._receive_task and not self._receive_task.done():
                 logger.debug("Cancelling receive loop task")
@@ -0,0 +1,141 @@
+"""Energy / zero-crossing silence suppression for PCM16 audio."""
+import os
+from collections import deque
+
+import numpy as np
+
+DEFAULT_SAMPLE_RATE = 24000
+DEFAULT_FRAME_MS = 20
+DEFAULT_ENERGY_THRESHOLD = float(os.getenv("SILENCE_ENERGY_THRESHOLD", "300.0"))  # int16 RMS
+DEFAULT_NOISE_RATIO = 3.0  # speech must be this much louder than the noise floor
+DEFAULT_MAX_ZCR = 0.35  # quiet frames above this crossing rate are treated as noise
+# Padding must exceed the server VAD's prefix_padding_ms (300) and
+# silence_duration_ms (1500) so it still sees speech onsets and ends.
+DEFAULT_PREFIX_PADDING_MS = 500
+DEFAULT_HANGOVER_MS = 2000
+
+
+class SilenceSuppressor:
+    """
+    Drops silent PCM16 frames before they are forwarded upstream.
+
+    Each chunk is split into fixed frames and classified in one vectorized
+    pass (RMS energy against an adaptive noise floor, plus zero-crossing
+    rate). Silent frames are held in a short pre-roll buffer that is
+    flushed on speech onset, and forwarding continues for a hangover period
+    after the last speech frame so the server VAD sees the trailing silence.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        frame_ms: int = DEFAULT_FRAME_MS,
+        energy_threshold: float = DEFAULT_ENERGY_THRESHOLD,
+        noise_ratio: float = DEFAULT_NOISE_RATIO,
+        max_zcr: float = DEFAULT_MAX_ZCR,
+        prefix_padding_ms: int = DEFAULT_PREFIX_PADDING_MS,
+        hangover_ms: int = DEFAULT_HANGOVER_MS,
+    ):
+        self.frame_samples = sample_rate * frame_ms // 1000
+        self.frame_bytes = self.frame_samples * 2
+        self.energy_threshold = energy_threshold
+        self.noise_ratio = noise_ratio
+        self.max_zcr = max_zcr
+        self.hangover_frames = hangover_ms // frame_ms
+
+        self._remainder = b""
+        self._preroll: deque = deque(maxlen=max(1, prefix_padding_ms // frame_ms))
+        self._hangover_left = 0
+        self._noise_floor = 0.0
+
+        self.bytes_in = 0
+        self.bytes_forwarded = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._hangover_left > 0
+
+    @property
+    def bytes_suppressed(self) -> int:
+        pending = len(self._remainder) + sum(len(f) for f in self._preroll)
+        return self.bytes_in - self.bytes_forwarded - pending
+
+    def _classify(self, data, n_frames: int) -> np.ndarray:
+        """Return a boolean speech mask with one entry per frame."""
+        samples = np.frombuffer(
+            data, dtype=np.int16, count=n_frames * self.frame_samples
+        ).reshape(n_frames, self.frame_samples).astype(np.float32)
+
+        rms = np.sqrt(np.mean(samples * samples, axis=1))
+        signs = np.signbit(samples)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (self.frame_samples - 1)
+
+        threshold = max(self.energy_threshold, self._noise_floor * self.noise_ratio)
+        speech = (rms >= threshold) & ((zcr <= self.max_zcr) | (rms >= 2 * threshold))
+
+        # Track the noise floor from frames classified as silence
+        quiet = rms[~speech]
+        if quiet.size:
+            self._noise_floor = 0.9 * self._noise_floor + 0.1 * float(np.median(quiet))
+        return speech
+
+    def process(self, pcm: bytes | memoryview) -> bytes | memoryview:
+        """
+        Filter one chunk of PCM16 audio.
+
+        Returns the bytes to forward (possibly empty). When every frame is
+        forwarded the input buffer is returned as-is without copying.
+        """
+        self.bytes_in += len(pcm)
+        data = self._remainder + bytes(pcm) if self._remainder else pcm
+
+        n_frames = len(data) // self.frame_bytes
+        usable = n_frames * self.frame_bytes
+        self._remainder = bytes(data[usable:])
+        if n_frames == 0:
+            return b""
+
+        speech = self._classify(data, n_frames)
+
+        # Fast path: silence outside any speech segment
+        if not speech.any() and self._hangover_left == 0:
+            view = memoryview(data)
+            for i in range(n_frames):
+                self._preroll.append(view[i * self.frame_bytes:(i + 1) * self.frame_bytes])
+            return b""
+
+        view = memoryview(data)
+        pieces = []
+        kept = 0
+        flushed = False
+        for i in range(n_frames):
+            frame = view[i * self.frame_bytes:(i + 1) * self.frame_bytes]
+            if speech[i]:
+                if self._hangover_left == 0 and self._preroll:
+                    # Speech onset: forward the buffered padding first
+                    pieces.extend(self._preroll)
+                    self._preroll.clear()
+                    flushed = True
+                self._hangover_left = self.hangover_frames
+                pieces.append(frame)
+                kept += 1
+            elif self._hangover_left > 0:
+                self._hangover_left -= 1
+                pieces.append(frame)
+                kept += 1
+            else:
+                self._preroll.append(frame)
+
+        if kept == n_frames and not flushed and data is pcm and usable == len(pcm):
+            out = pcm
+        else:
+            out = b"".join(pieces)
+        self.bytes_forwarded += len(out)
+        return out
+
+    def stats(self) -> dict:
+        return {
+            "bytesIn": self.bytes_in,
+            "bytesForwarded": self.bytes_forwarded,
+            "bytesSuppressed": self.bytes_suppressed,
+        }
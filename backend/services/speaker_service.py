@@ -1,18 +1,73 @@
+import asyncio
 import json
-from openai import OpenAI
+import logging
+import os
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional
+
+from openai import AsyncOpenAI
 
 from models.meeting import Participant
+from services.llm_client import DEFAULT_LLM_TIMEOUT, get_llm_client
+
+logger = logging.getLogger(__name__)
+
+# Speaker identification: off, sync (blocks each transcript) or async (batched corrections)
+SPEAKER_ID_MODE_OFF = "off"
+SPEAKER_ID_MODE_SYNC = "sync"
+SPEAKER_ID_MODE_ASYNC = "async"
+DEFAULT_SPEAKER_ID_MODE = os.getenv("SPEAKER_ID_MODE", SPEAKER_ID_MODE_OFF)
+
+# Async mode: utterances collected per request window, batch cap, and minimum
+# confidence for a correction to be applied
+DEFAULT_BATCH_WINDOW = float(os.getenv("SPEAKER_ID_BATCH_WINDOW_MS", "1500")) / 1000
+DEFAULT_MAX_BATCH = int(os.getenv("SPEAKER_ID_MAX_BATCH", "8"))
+DEFAULT_MIN_CONFIDENCE = float(os.getenv("SPEAKER_ID_MIN_CONFIDENCE", "0.6"))
+
+
+@dataclass
+class PendingUtterance:
+    entry_id: str
+    text: str
+    speaker: str  # provisional speaker the transcript was emitted with
+
+
+SpeakerUpdateCallback = Callable[[str, str, float], Awaitable[None]]
 
 
 class SpeakerService:
-    def __init__(self):
-        self.client = OpenAI()
+    def __init__(
+        self,
+        client: AsyncOpenAI | None = None,
+        timeout: float = DEFAULT_LLM_TIMEOUT,
+        batch_window: float = DEFAULT_BATCH_WINDOW,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        min_confidence: float = DEFAULT_MIN_CONFIDENCE,
+    ):
+        self.client = client or get_llm_client()
+        self.timeout = timeout
         self.participants: list[Participant] = []
         self.recent_context: list[dict] = []
 
+        # Async batched identification
+        self.batch_window = batch_window
+        self.max_batch = max_batch
+        self.min_confidence = min_confidence
+        self._pending: list[PendingUtterance] = []
+        self._wakeup = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._on_update: Optional[SpeakerUpdateCallback] = None
+        self.batches = 0
+        self.corrections = 0
+
     def set_participants(self, participants: list[Participant]):
         self.participants = participants
 
+    def _remember(self, speaker: str, text: str) -> None:
+        self.recent_context.append({"speaker": speaker, "text": text})
+        if len(self.recent_context) > 10:
+            self.recent_context.pop(0)
+
     async def identify_speaker(self, text: str) -> dict:
         if not self.participants:
             return {"speaker": "Unknown", "confidence": 0.0}
@@ -39,16 +94,124 @@ JSON으로 응답:
 {{"speaker": "화자 이름", "confidence": 0.0-1.0}}
 """
 
-        response = self.client.chat.completions.create(
+        response = await self.client.chat.completions.create(
             model="gpt-4o-mini",
             messages=[{"role": "user", "content": prompt}],
             response_format={"type": "json_object"},
+            timeout=self.timeout,
         )
 
         result = json.loads(response.choices[0].message.content)
 
-        self.recent_context.append({"speaker": result["speaker"], "text": text})
-        if len(self.recent_context) > 10:
-            self.recent_context.pop(0)
+        self._remember(result["speaker"], text)
 
         return result
+
+    def start_batching(self, on_update: SpeakerUpdateCallback) -> None:
+        """
+        Identify speakers off the transcript path.
+
+        Utterances passed to ``submit`` are grouped into one request per
+        ``batch_window``; ``on_update(entry_id, speaker, confidence)`` is
+        awaited for every utterance whose provisional speaker was wrong.
+        """
+        self._on_update = on_update
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="speaker_id_batcher")
+
+    def submit(self, entry_id: str, text: str, speaker: str) -> None:
+        """Queue an already-emitted utterance for identification; never blocks."""
+        if not self.participants:
+            return
+        self._pending.append(PendingUtterance(entry_id, text, speaker))
+        self._wakeup.set()
+
+    async def _run(self) -> None:
+        while True:
+            await self._wakeup.wait()
+            # Let the rest of the window's utterances arrive
+            if len(self._pending) < self.max_batch:
+                await asyncio.sleep(self.batch_window)
+            self._wakeup.clear()
+            while self._pending:
+                batch = self._pending[:self.max_batch]
+                del self._pending[:self.max_batch]
+                await self._process(batch)
+
+    async def _process(self, batch: list[PendingUtterance]) -> None:
+        try:
+            results = await self.identify_batch(batch)
+        except Exception as e:
+            logger.warning(f"Batched speaker identification failed ({len(batch)} utterances): {e}")
+            return
+        self.batches += 1
+
+        names = {p.name for p in self.participants}
+        for utterance in batch:
+            result = results.get(utterance.entry_id) or {}
+            speaker = result.get("speaker")
+            confidence = float(result.get("confidence", 0.0))
+            if speaker in names and confidence >= self.min_confidence:
+                self._remember(speaker, utterance.text)
+            else:
+                self._remember(utterance.speaker, utterance.text)
+                continue
+            if speaker != utterance.speaker and self._on_update is not None:
+                self.corrections += 1
+                try:
+                    await self._on_update(utterance.entry_id, speaker, confidence)
+                except Exception as e:
+                    logger.error(f"Error in speaker update callback: {e}", exc_info=True)
+
+    async def identify_batch(self, batch: list[PendingUtterance]) -> dict[str, dict]:
+        """One model call for several utterances; returns results keyed by entry id."""
+        participant_info = json.dumps(
+            [{"name": p.name, "role": p.role} for p in self.participants],
+            ensure_ascii=False,
+        )
+        context_str = json.dumps(self.recent_context[-5:], ensure_ascii=False)
+        utterances = json.dumps(
+            [{"id": u.entry_id, "text": u.text} for u in batch],
+            ensure_ascii=False,
+        )
+
+        prompt = f"""참석자 목록과 최근 대화 컨텍스트를 기반으로 각 발화의 화자를 식별하세요.
+발화는 시간 순서이며, 앞 발화와의 대화 흐름(질문-답변, 호명 등)을 함께 고려하세요.
+
+참석자:
+{participant_info}
+
+최근 대화:
+{context_str}
+
+새 발화:
+{utterances}
+
+JSON으로 응답:
+{{"results": [{{"id": "발화 id", "speaker": "화자 이름", "confidence": 0.0-1.0}}]}}
+"""
+
+        response = await self.client.chat.completions.create(
+            model="gpt-4o-mini",
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            timeout=self.timeout,
+        )
+
+        result = json.loads(response.choices[0].message.content)
+        return {
+            item.get("id"): item
+            for item in result.get("results", [])
+            if isinstance(item, dict)
+        }
+
+    async def close(self) -> None:
+        """Stop batching; utterances still pending keep their provisional speaker."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+        self._pending.clear()
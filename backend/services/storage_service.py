@@ -1,6 +1,339 @@
+import asyncio
+import json
+import logging
+import os
+import time
+import uuid
+from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
-from models.meeting import MeetingState
+from typing import Optional
+
+from models.meeting import (
+    Intervention,
+    InterventionType,
+    MeetingState,
+    MeetingStatus,
+    Participant,
+    TranscriptEntry,
+)
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "journal.jsonl"
+# Upper bound on how long an appended record may sit in the page cache unsynced
+JOURNAL_FSYNC_INTERVAL = float(os.getenv("JOURNAL_FSYNC_INTERVAL", "1.0"))
+
+SNAPSHOT_FILENAME = "snapshot.json"
+# Snapshot after this many journal records or seconds, whichever comes first
+SNAPSHOT_EVERY_RECORDS = int(os.getenv("SNAPSHOT_EVERY_RECORDS", "100"))
+SNAPSHOT_INTERVAL = float(os.getenv("SNAPSHOT_INTERVAL", "30.0"))
+
+RECORD_TRANSCRIPT = "transcript"
+RECORD_INTERVENTION = "intervention"
+RECORD_SPEAKER_UPDATE = "speaker_update"
+RECORD_SPEAKING_TIME = "speaking_time"
+
+
+def transcript_record(entry: TranscriptEntry) -> dict:
+    return {"kind": RECORD_TRANSCRIPT, "data": asdict(entry)}
+
+
+def intervention_record(intervention: Intervention) -> dict:
+    data = asdict(intervention)
+    data["intervention_type"] = intervention.intervention_type.value
+    return {"kind": RECORD_INTERVENTION, "data": data}
+
+
+def speaker_update_record(entry_id: str, speaker: str) -> dict:
+    """Correction of an earlier transcript entry's speaker (applied on replay)."""
+    return {
+        "kind": RECORD_SPEAKER_UPDATE,
+        "data": {"id": f"su_{uuid.uuid4().hex[:8]}", "entry_id": entry_id, "speaker": speaker},
+    }
+
+
+def speaking_time_record(speaker: str, seconds: float) -> dict:
+    """Speaking time measured outside utterances (per-participant audio tracks)."""
+    return {
+        "kind": RECORD_SPEAKING_TIME,
+        "data": {"id": f"st_{uuid.uuid4().hex[:8]}", "speaker": speaker, "seconds": seconds},
+    }
+
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    return datetime.fromisoformat(value) if value else None
+
+
+def state_to_snapshot(state: MeetingState, journal_offset: int = 0) -> dict:
+    """
+    Compact snapshot of a meeting.
+
+    ``journal_offset`` is a journal byte offset whose preceding records are all
+    contained in the snapshot; replay starts there.
+    """
+    return {
+        "meeting_id": state.meeting_id,
+        "title": state.title,
+        "status": state.status.value,
+        "agenda": state.agenda,
+        "principles": [dict(p) for p in state.principles],
+        "participants": [asdict(p) for p in state.participants],
+        "transcript": [asdict(t) for t in state.transcript],
+        "interventions": [intervention_record(i)["data"] for i in state.interventions],
+        "parking_lot": list(state.parking_lot),
+        "started_at": state.started_at.isoformat() if state.started_at else None,
+        "ended_at": state.ended_at.isoformat() if state.ended_at else None,
+        "journal_offset": journal_offset,
+    }
+
+
+def state_from_snapshot(meeting_id: str, snapshot: Optional[dict], records: list[dict]) -> MeetingState:
+    """Rebuild a meeting from its snapshot (if any) plus the journal records after it."""
+    snapshot = snapshot or {"meeting_id": meeting_id, "title": meeting_id}
+    participants = [Participant(**p) for p in snapshot.get("participants", [])]
+    transcript = [TranscriptEntry(**t) for t in snapshot.get("transcript", [])]
+    interventions = [
+        Intervention(**{**i, "intervention_type": InterventionType(i["intervention_type"])})
+        for i in snapshot.get("interventions", [])
+    ]
+    parking_lot = list(snapshot.get("parking_lot", []))
+
+    # Replayed records may overlap the snapshot; ids make replay idempotent
+    seen = {t.id for t in transcript} | {i.id for i in interventions}
+    by_name = {p.name: p for p in participants}
+    by_id = {t.id: t for t in transcript}
+    positions = {t.id: index for index, t in enumerate(transcript)}
+    speaker_updates: list[int] = []
+    for record in records:
+        data = record.get("data") or {}
+        if data.get("id") in seen:
+            continue
+        seen.add(data.get("id"))
+        if record.get("kind") == RECORD_TRANSCRIPT:
+            entry = TranscriptEntry(**data)
+            positions[entry.id] = len(transcript)
+            transcript.append(entry)
+            by_id[entry.id] = entry
+            participant = by_name.get(entry.speaker)
+            if participant is not None:
+                participant.speaking_count += 1
+                participant.speaking_time += entry.duration
+        elif record.get("kind") == RECORD_SPEAKER_UPDATE:
+            entry = by_id.get(data.get("entry_id"))
+            if entry is None or entry.speaker == data["speaker"]:
+                continue
+            previous, current = by_name.get(entry.speaker), by_name.get(data["speaker"])
+            if previous is not None:
+                previous.speaking_count = max(0, previous.speaking_count - 1)
+                previous.speaking_time = max(0.0, previous.speaking_time - entry.duration)
+            if current is not None:
+                current.speaking_count += 1
+                current.speaking_time += entry.duration
+            entry.speaker = data["speaker"]
+            speaker_updates.append(positions[entry.id])
+        elif record.get("kind") == RECORD_SPEAKING_TIME:
+            participant = by_name.get(data.get("speaker"))
+            if participant is not None:
+                participant.speaking_time += data.get("seconds", 0.0)
+        elif record.get("kind") == RECORD_INTERVENTION:
+            intervention = Intervention(
+                **{**data, "intervention_type": InterventionType(data["intervention_type"])}
+            )
+            interventions.append(intervention)
+            if intervention.parking_lot_item:
+                parking_lot.append(intervention.parking_lot_item)
+
+    # Participant counters are folded into the stats engine at construction
+    state = MeetingState(
+        meeting_id=snapshot.get("meeting_id", meeting_id),
+        title=snapshot.get("title", meeting_id),
+        status=MeetingStatus(snapshot.get("status", MeetingStatus.PREPARING.value)),
+        agenda=snapshot.get("agenda", ""),
+        principles=snapshot.get("principles", []),
+        participants=participants,
+        transcript=transcript,
+        interventions=interventions,
+        parking_lot=parking_lot,
+        started_at=_parse_datetime(snapshot.get("started_at")),
+        ended_at=_parse_datetime(snapshot.get("ended_at")),
+    )
+    # Replayed corrections keep since-cursors consistent with workers that applied them live
+    state.speaker_updates = speaker_updates
+    return state
+
+
+def read_journal(path: Path, offset: int = 0) -> list[dict]:
+    """Read journal records starting at byte ``offset`` (blocking)."""
+    if not path.exists():
+        return []
+    records = []
+    with open(path, "rb") as f:
+        f.seek(offset)
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                # A crash can leave a torn final line; everything before it is intact
+                logger.warning(f"Skipping malformed journal line in {path}")
+    return records
+
+
+class MeetingJournal:
+    """
+    Append-only JSONL journal for one meeting.
+
+    ``append`` only buffers the record, so callers on the event loop never
+    touch the disk. A background writer task drains everything buffered
+    since its last pass in a single write (group commit) on a worker thread,
+    and fsyncs at most once per ``fsync_interval`` or on ``flush``.
+    """
+
+    def __init__(self, path: Path, fsync_interval: float = JOURNAL_FSYNC_INTERVAL):
+        self.path = path
+        self.fsync_interval = fsync_interval
+
+        self._pending: list[dict] = []
+        self._wakeup = asyncio.Event()
+        self._flush_waiters: list[asyncio.Future] = []
+        self._writer: Optional[asyncio.Task] = None
+        self._file = None
+        self._dirty = False
+        self._writing = False
+        self._last_fsync = time.monotonic()
+
+        # Byte offset of the end of written records; None until the file is opened
+        self.offset: Optional[int] = None
+        self.records_appended = 0
+        self.snapshot_lock = asyncio.Lock()
+        self.snapshot_marker = 0  # records_appended at the last snapshot
+        self.snapshot_at = time.monotonic()
+        self.snapshot_task: Optional[asyncio.Task] = None
+
+    def append(self, record: dict) -> None:
+        """Buffer one record; never blocks."""
+        self._pending.append(record)
+        self.records_appended += 1
+        self._ensure_writer()
+        self._wakeup.set()
+
+    def append_transcript(self, entry: TranscriptEntry) -> None:
+        self.append(transcript_record(entry))
+
+    def append_intervention(self, intervention: Intervention) -> None:
+        self.append(intervention_record(intervention))
+
+    def append_speaker_update(self, entry_id: str, speaker: str) -> None:
+        self.append(speaker_update_record(entry_id, speaker))
+
+    async def flush(self) -> None:
+        """Wait until every buffered record is written and fsynced."""
+        if not self._pending and not self._dirty and not self._writing:
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._flush_waiters.append(future)
+        self._ensure_writer()
+        self._wakeup.set()
+        await future
+
+    async def close(self) -> None:
+        await self.flush()
+        if self._writer is not None:
+            self._writer.cancel()
+            try:
+                await self._writer
+            except asyncio.CancelledError:
+                pass
+            self._writer = None
+        if self._file is not None:
+            await asyncio.to_thread(self._file.close)
+            self._file = None
+
+    @property
+    def snapshot_due(self) -> bool:
+        if self.records_appended == self.snapshot_marker:
+            return False
+        return (
+            self.records_appended - self.snapshot_marker >= SNAPSHOT_EVERY_RECORDS
+            or time.monotonic() - self.snapshot_at >= SNAPSHOT_INTERVAL
+        )
+
+    def read(self, offset: int = 0) -> list[dict]:
+        """Read durable records from ``offset`` (blocking; call via ``asyncio.to_thread``)."""
+        return read_journal(self.path, offset)
+
+    def _ensure_writer(self) -> None:
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        while True:
+            if self._dirty:
+                # Data is written but not yet durable: wait for more records or the fsync deadline
+                remaining = self.fsync_interval - (time.monotonic() - self._last_fsync)
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=max(0.0, remaining))
+                except asyncio.TimeoutError:
+                    pass
+            else:
+                await self._wakeup.wait()
+            self._wakeup.clear()
+
+            batch, self._pending = self._pending, []
+            waiters, self._flush_waiters = self._flush_waiters, []
+            fsync = bool(waiters) or time.monotonic() - self._last_fsync >= self.fsync_interval
+
+            self._writing = True
+            try:
+                if batch or (fsync and self._dirty):
+                    await asyncio.to_thread(self._write_batch, batch, fsync)
+            except Exception as e:
+                logger.error(f"Journal write failed for {self.path}: {e}", exc_info=True)
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_exception(e)
+                continue
+            finally:
+                self._writing = False
+
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_result(None)
+
+    def _write_batch(self, batch: list[dict], fsync: bool) -> None:
+        if self._file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "ab")
+            self.offset = self._file.tell()
+
+        if batch:
+            data = "".join(
+                json.dumps(record, ensure_ascii=False) + "\n" for record in batch
+            ).encode("utf-8")
+            self._file.write(data)
+            self._file.flush()
+            self.offset += len(data)
+            self._dirty = True
+
+        if fsync and self._dirty:
+            os.fsync(self._file.fileno())
+            self._dirty = False
+            self._last_fsync = time.monotonic()
+
+
+# Journals are shared across StorageService instances so each meeting has one writer
+_journals: dict[Path, MeetingJournal] = {}
+
+
+async def close_all_journals() -> None:
+    """Flush and close every open journal (application shutdown)."""
+    for path in list(_journals):
+        journal = _journals.pop(path, None)
+        if journal is not None:
+            await journal.close()
 
 
 class StorageService:
@@ -9,7 +342,6 @@ class StorageService:
             self.base_path = Path(base_path)
         else:
             # Docker 환경: /app/meetings, 로컬 환경: 프로젝트 루트/meetings
-            import os
             if os.path.exists("/app/meetings"):
                 self.base_path = Path("/app/meetings")
             else:
@@ -21,63 +353,187 @@ class StorageService:
         meeting_dir.mkdir(exist_ok=True)
         return meeting_dir
 
-    async def save_preparation(self, state: MeetingState):
-        meeting_dir = self.get_meeting_dir(state.meeting_id)
-        content = f"""# 회의 준비 자료
+    def create_meeting_dir(self, meeting_id: str) -> str:
+        """
+        Create the directory of a new meeting and return its id.
+
+        Ids are derived from the date and title, so a taken id gets a numeric
+        suffix instead of reusing (and appending to) another meeting's journal.
+        """
+        candidate, suffix = meeting_id, 1
+        while True:
+            try:
+                (self.base_path / candidate).mkdir()
+                return candidate
+            except FileExistsError:
+                suffix += 1
+                candidate = f"{meeting_id}-{suffix}"
 
-## 회의 정보
-- **제목**: {state.title}
-- **일시**: {datetime.now().strftime('%Y-%m-%d %H:%M')}
+    def journal(self, meeting_id: str) -> MeetingJournal:
+        """Return the meeting's journal, creating its writer on first use."""
+        # The writer creates the directory on its first write
+        path = self.base_path / meeting_id / JOURNAL_FILENAME
+        journal = _journals.get(path)
+        if journal is None:
+            journal = _journals[path] = MeetingJournal(path)
+        return journal
 
-## 참석자
-| 이름 | 역할 |
-|------|------|
-"""
-        for p in state.participants:
-            content += f"| {p.name} | {p.role} |\n"
+    async def close_journal(self, meeting_id: str) -> None:
+        path = self.base_path / meeting_id / JOURNAL_FILENAME
+        journal = _journals.pop(path, None)
+        if journal is not None:
+            await journal.close()
 
-        content += f"\n## 아젠다\n{state.agenda}\n"
+    async def journal_state(self, state: MeetingState) -> None:
+        """
+        Replace the journal with a complete state built outside a pipeline (demo save).
 
-        with open(meeting_dir / "preparation.md", "w", encoding="utf-8") as f:
+        Callers must stop the meeting's pipeline first; the journal is rewritten
+        from scratch.
+        """
+        await self.close_journal(state.meeting_id)
+        path = self.get_meeting_dir(state.meeting_id) / JOURNAL_FILENAME
+        await asyncio.to_thread(path.unlink, missing_ok=True)
+
+        journal = self.journal(state.meeting_id)
+        for entry in state.transcript:
+            journal.append_transcript(entry)
+        for intervention in state.interventions:
+            journal.append_intervention(intervention)
+        await journal.flush()
+
+    async def save_snapshot(self, state: MeetingState) -> None:
+        """Write a compact snapshot of the meeting (atomic replace)."""
+        journal = self.journal(state.meeting_id)
+        async with journal.snapshot_lock:
+            # Every record before the writer's current offset is already in ``state``
+            snapshot = state_to_snapshot(state, journal.offset or 0)
+            journal.snapshot_marker = journal.records_appended
+            journal.snapshot_at = time.monotonic()
+            path = self.get_meeting_dir(state.meeting_id) / SNAPSHOT_FILENAME
+            await asyncio.to_thread(self._write_snapshot, path, snapshot)
+
+    def snapshot_if_due(self, state: MeetingState) -> None:
+        """Schedule a background snapshot once enough journal records have accumulated."""
+        journal = self.journal(state.meeting_id)
+        if not journal.snapshot_due:
+            return
+        if journal.snapshot_task is not None and not journal.snapshot_task.done():
+            return
+        journal.snapshot_marker = journal.records_appended
+        journal.snapshot_task = asyncio.create_task(self.save_snapshot(state))
+
+    @staticmethod
+    def _write_snapshot(path: Path, snapshot: dict) -> None:
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f, ensure_ascii=False, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    async def load_meeting(self, meeting_id: str) -> Optional[MeetingState]:
+        """Rehydrate a meeting from its snapshot plus journal replay, or None if unknown."""
+        return await asyncio.to_thread(self._load_meeting, meeting_id)
+
+    def _load_meeting(self, meeting_id: str) -> Optional[MeetingState]:
+        meeting_dir = self.base_path / meeting_id
+        snapshot_path = meeting_dir / SNAPSHOT_FILENAME
+        journal_path = meeting_dir / JOURNAL_FILENAME
+        if not snapshot_path.exists() and not journal_path.exists():
+            return None
+
+        snapshot = None
+        if snapshot_path.exists():
+            with open(snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+        offset = snapshot.get("journal_offset", 0) if snapshot else 0
+        records = read_journal(journal_path, offset)
+        logger.info(
+            f"Rehydrated meeting {meeting_id} "
+            f"(snapshot: {snapshot is not None}, replayed records: {len(records)})"
+        )
+        return state_from_snapshot(meeting_id, snapshot, records)
+
+    async def _read_journal(self, meeting_id: str) -> list[dict]:
+        journal = self.journal(meeting_id)
+        await journal.flush()
+        return await asyncio.to_thread(journal.read)
+
+    @staticmethod
+    def _write_file(path: Path, content: str) -> None:
+        with open(path, "w", encoding="utf-8") as f:
             f.write(content)
 
-    async def save_transcript(self, state: MeetingState):
+    async def save_preparation(self, state: MeetingState):
         meeting_dir = self.get_meeting_dir(state.meeting_id)
-        content = f"""# 회의 녹취록
+        lines = [
+            "# 회의 준비 자료\n",
+            "\n## 회의 정보\n",
+            f"- **제목**: {state.title}\n",
+            f"- **일시**: {datetime.now().strftime('%Y-%m-%d %H:%M')}\n",
+            "\n## 참석자\n",
+            "| 이름 | 역할 |\n",
+            "|------|------|\n",
+        ]
+        lines.extend(f"| {p.name} | {p.role} |\n" for p in state.participants)
+        lines.append(f"\n## 아젠다\n{state.agenda}\n")
 
-회의: {state.title}
-일시: {state.started_at.strftime('%Y-%m-%d %H:%M') if state.started_at else 'N/A'}
+        await asyncio.to_thread(self._write_file, meeting_dir / "preparation.md", "".join(lines))
 
----
+    async def save_transcript(self, state: MeetingState):
+        """Render transcript.md from the meeting journal."""
+        meeting_dir = self.get_meeting_dir(state.meeting_id)
+        records = await self._read_journal(state.meeting_id)
 
-"""
-        for entry in state.transcript:
-            time_str = entry.timestamp[:19].replace("T", " ")
-            content += f"[{time_str}] **{entry.speaker}**: {entry.text}\n\n"
+        lines = [
+            "# 회의 녹취록\n",
+            "\n",
+            f"회의: {state.title}\n",
+            f"일시: {state.started_at.strftime('%Y-%m-%d %H:%M') if state.started_at else 'N/A'}\n",
+            "\n---\n\n",
+        ]
+        # Speaker corrections arrive after the entry they refer to
+        speakers = {
+            record["data"]["entry_id"]: record["data"]["speaker"]
+            for record in records
+            if record.get("kind") == RECORD_SPEAKER_UPDATE
+        }
+        for record in records:
+            if record.get("kind") != RECORD_TRANSCRIPT:
+                continue
+            entry = record["data"]
+            time_str = entry["timestamp"][:19].replace("T", " ")
+            speaker = speakers.get(entry["id"], entry["speaker"])
+            lines.append(f"[{time_str}] **{speaker}**: {entry['text']}\n\n")
 
-        with open(meeting_dir / "transcript.md", "w", encoding="utf-8") as f:
-            f.write(content)
+        await asyncio.to_thread(self._write_file, meeting_dir / "transcript.md", "".join(lines))
 
     async def save_interventions(self, state: MeetingState):
+        """Render interventions.md from the meeting journal."""
         meeting_dir = self.get_meeting_dir(state.meeting_id)
-        content = f"""# Agent 개입 기록
-
-회의: {state.title}
-
----
-
-"""
-        for idx, inv in enumerate(state.interventions, 1):
-            content += f"""## 개입 #{idx}
-- **시간**: {inv.timestamp[:19].replace("T", " ")}
-- **유형**: {inv.intervention_type.value}
-- **메시지**: {inv.message}
-"""
-            if inv.violated_principle:
-                content += f"- **위반 원칙**: {inv.violated_principle}\n"
-            if inv.parking_lot_item:
-                content += f"- **Parking Lot**: {inv.parking_lot_item}\n"
-            content += "\n"
-
-        with open(meeting_dir / "interventions.md", "w", encoding="utf-8") as f:
-            f.write(content)
+        records = await self._read_journal(state.meeting_id)
+
+        lines = [
+            "# Agent 개입 기록\n",
+            "\n",
+            f"회의: {state.title}\n",
+            "\n---\n\n",
+        ]
+        idx = 0
+        for record in records:
+            if record.get("kind") != RECORD_INTERVENTION:
+                continue
+            inv = record["data"]
+            idx += 1
+            lines.append(f"## 개입 #{idx}\n")
+            lines.append(f"- **시간**: {inv['timestamp'][:19].replace('T', ' ')}\n")
+            lines.append(f"- **유형**: {inv['intervention_type']}\n")
+            lines.append(f"- **메시지**: {inv['message']}\n")
+            if inv.get("violated_principle"):
+                lines.append(f"- **위반 원칙**: {inv['violated_principle']}\n")
+            if inv.get("parking_lot_item"):
+                lines.append(f"- **Parking Lot**: {inv['parking_lot_item']}\n")
+            lines.append("\n")
+
+        await asyncio.to_thread(self._write_file, meeting_dir / "interventions.md", "".join(lines))
@@ -0,0 +1,229 @@
+"""Per-participant audio tracks: RMS speaker attribution and mixing to one PCM16 stream."""
+import os
+import time
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+from services.diarization_service import DiarizationResult
+
+DEFAULT_SAMPLE_RATE = 24000
+DEFAULT_FRAME_MS = 20
+DEFAULT_MAX_LATENCY_MS = 200  # mix without a lagging track once another is this far ahead
+DEFAULT_STALE_TRACK_SECONDS = 0.5  # tracks silent on the wire this long stop holding the mix back
+DEFAULT_ENERGY_THRESHOLD = float(os.getenv("TRACK_ENERGY_THRESHOLD", "300.0"))  # int16 RMS
+DEFAULT_NOISE_RATIO = 3.0
+DEFAULT_BLEED_RATIO = 0.5  # a track must be within ~6 dB of the loudest to count as speaking
+DEFAULT_HISTORY_SECONDS = 60.0
+# The Realtime API reports speech_stopped after this much trailing silence
+DEFAULT_VAD_TRAILING_SILENCE = 1.5
+DEFAULT_WINDOW_MARGIN = 0.25
+
+
+class _Track:
+    __slots__ = ("track_id", "participant", "buffer", "last_seen", "noise_floor", "speech_frames")
+
+    def __init__(self, track_id: int, participant: str):
+        self.track_id = track_id
+        self.participant = participant
+        self.buffer = bytearray()
+        self.last_seen = 0.0
+        self.noise_floor = 0.0
+        self.speech_frames = 0
+
+
+class TrackMixer:
+    """
+    Mixes one PCM16 track per participant into a single stream for STT.
+
+    Tracks are mixed in fixed frames once every live track has buffered
+    audio (or once one track is ``max_latency_ms`` ahead, padding the rest
+    with silence). The same pass computes per-track, per-frame RMS in one
+    vectorized reshape. A track counts as speaking in a frame when it clears
+    its adaptive noise floor and is close to the loudest track, which
+    rejects bleed from neighbouring mics.
+
+    Tracks may come from several connections (one mic or browser tab per
+    participant); track ids are shared across the meeting.
+
+    It also serves as the STT service's speaker-attribution stage. When VAD
+    closes a segment, the speaker is the track with the most speaking frames
+    in the matching wall-clock window. Upstream offsets cannot be used
+    because silence suppression removes audio.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        frame_ms: int = DEFAULT_FRAME_MS,
+        max_latency_ms: int = DEFAULT_MAX_LATENCY_MS,
+        stale_track_seconds: float = DEFAULT_STALE_TRACK_SECONDS,
+        energy_threshold: float = DEFAULT_ENERGY_THRESHOLD,
+        noise_ratio: float = DEFAULT_NOISE_RATIO,
+        bleed_ratio: float = DEFAULT_BLEED_RATIO,
+        history_seconds: float = DEFAULT_HISTORY_SECONDS,
+        vad_trailing_silence: float = DEFAULT_VAD_TRAILING_SILENCE,
+    ):
+        self.sample_rate = sample_rate
+        self.frame_samples = sample_rate * frame_ms // 1000
+        self.frame_seconds = frame_ms / 1000
+        self.max_latency_samples = sample_rate * max_latency_ms // 1000
+        self.stale_track_seconds = stale_track_seconds
+        self.energy_threshold = energy_threshold
+        self.noise_ratio = noise_ratio
+        self.bleed_ratio = bleed_ratio
+        self.vad_trailing_silence = vad_trailing_silence
+
+        self.tracks: dict[int, _Track] = {}
+        # (monotonic end time of mixed frame, names of participants speaking in it)
+        self._history: deque[tuple[float, tuple[str, ...]]] = deque(
+            maxlen=int(history_seconds / self.frame_seconds)
+        )
+        self._drained: dict[str, int] = {}
+        self._results: dict[str, DiarizationResult] = {}
+        self.mixed_frames = 0
+        self.padded_frames = 0
+
+    def register(self, track_id: int, participant: str) -> None:
+        """Bind a track id to a participant (re-binding keeps buffered audio)."""
+        track = self.tracks.get(track_id)
+        if track is None:
+            self.tracks[track_id] = _Track(track_id, participant)
+        else:
+            track.participant = participant
+
+    def unregister(self, track_id: int) -> None:
+        """Forget a track whose sender left; drain speaking time first or it is lost."""
+        track = self.tracks.pop(track_id, None)
+        if track is not None:
+            self._drained[track.participant] = max(
+                0, self._drained.get(track.participant, 0) - track.speech_frames
+            )
+
+    def push(self, track_id: int, pcm: bytes | memoryview, now: Optional[float] = None) -> bytes:
+        """
+        Buffer audio for one track and return any newly mixed PCM16 (may be empty).
+
+        Audio for an unregistered track is ignored.
+        """
+        track = self.tracks.get(track_id)
+        if track is None:
+            return b""
+        now = time.monotonic() if now is None else now
+        track.buffer += pcm[:len(pcm) - len(pcm) % 2]
+        track.last_seen = now
+        return self._mix(now)
+
+    def _mix(self, now: float) -> bytes:
+        live = [
+            t for t in self.tracks.values()
+            if t.buffer or now - t.last_seen < self.stale_track_seconds
+        ]
+        if not live:
+            return b""
+        buffered = [len(t.buffer) // 2 for t in live]
+        ready = min(buffered)
+        if max(buffered) >= ready + self.max_latency_samples:
+            # A lagging track would stall the mix; pad it with silence
+            ready = max(buffered)
+        n_frames = ready // self.frame_samples
+        if n_frames == 0:
+            return b""
+        n_samples = n_frames * self.frame_samples
+
+        block = np.zeros((len(live), n_samples), dtype=np.int16)
+        padded = False
+        for row, track in enumerate(live):
+            take = min(len(track.buffer) // 2, n_samples)
+            padded |= take < n_samples
+            block[row, :take] = np.frombuffer(track.buffer, dtype=np.int16, count=take)
+            del track.buffer[:take * 2]
+        if padded:
+            self.padded_frames += n_frames
+
+        self._attribute(live, block, n_frames, now)
+        self.mixed_frames += n_frames
+
+        mixed = block.astype(np.int32).sum(axis=0)
+        np.clip(mixed, -32768, 32767, out=mixed)
+        return mixed.astype(np.int16).tobytes()
+
+    def _attribute(self, live: list[_Track], block: np.ndarray, n_frames: int, now: float) -> None:
+        """Per-track speech flags for every frame, from one vectorized RMS pass."""
+        frames = block.reshape(len(live), n_frames, self.frame_samples).astype(np.float32)
+        rms = np.sqrt(np.mean(frames * frames, axis=2))  # (tracks, frames)
+
+        floors = np.array([t.noise_floor for t in live], dtype=np.float32)[:, None]
+        threshold = np.maximum(self.energy_threshold, floors * self.noise_ratio)
+        speaking = (rms >= threshold) & (rms >= self.bleed_ratio * rms.max(axis=0, keepdims=True))
+
+        for row, track in enumerate(live):
+            quiet = rms[row][~speaking[row]]
+            if quiet.size:
+                track.noise_floor = 0.9 * track.noise_floor + 0.1 * float(np.median(quiet))
+            track.speech_frames += int(np.count_nonzero(speaking[row]))
+
+        # Frames were just mixed; stamp them as ending now, spaced one frame apart
+        names = [t.participant for t in live]
+        start = now - n_frames * self.frame_seconds
+        for i in range(n_frames):
+            active = tuple(names[row] for row in np.flatnonzero(speaking[:, i]))
+            self._history.append((start + (i + 1) * self.frame_seconds, active))
+
+    def drain_speaking_time(self) -> dict[str, float]:
+        """Speaking seconds per participant since the previous drain."""
+        totals: dict[str, int] = {}
+        for track in self.tracks.values():
+            totals[track.participant] = totals.get(track.participant, 0) + track.speech_frames
+        delta = {
+            name: (frames - self._drained.get(name, 0)) * self.frame_seconds
+            for name, frames in totals.items()
+            if frames > self._drained.get(name, 0)
+        }
+        self._drained = totals
+        return delta
+
+    # Speaker-attribution stage interface used by RealtimeSTTService
+
+    def feed(self, pcm: bytes | memoryview) -> None:
+        """Attribution comes from the tracks; upstream audio is not needed."""
+
+    def reset_timeline(self) -> None:
+        self._results.clear()
+
+    def end_segment(self, item_id: str, start_ms: int, end_ms: int,
+                    now: Optional[float] = None) -> Optional[DiarizationResult]:
+        """Attribute the VAD segment that just closed to the most active track."""
+        now = time.monotonic() if now is None else now
+        duration = max(0.0, (end_ms - start_ms) / 1000)
+        window_end = now - self.vad_trailing_silence + DEFAULT_WINDOW_MARGIN
+        window_start = window_end - duration - 2 * DEFAULT_WINDOW_MARGIN
+
+        counts: dict[str, int] = {}
+        total = 0
+        for stamp, active in reversed(self._history):
+            if stamp < window_start:
+                break
+            if stamp > window_end or not active:
+                continue
+            total += 1
+            for name in active:
+                counts[name] = counts.get(name, 0) + 1
+        if not counts:
+            return None
+
+        speaker = max(counts, key=counts.get)
+        result = DiarizationResult(speaker, round(counts[speaker] / total, 3))
+        self._results[item_id] = result
+        return result
+
+    def take(self, item_id: str) -> Optional[DiarizationResult]:
+        return self._results.pop(item_id, None)
+
+    def stats(self) -> dict:
+        return {
+            "tracks": len(self.tracks),
+            "mixedFrames": self.mixed_frames,
+            "paddedFrames": self.padded_frames,
+        }
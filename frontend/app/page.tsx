@@ -59,7 +59,9 @@ export default function MeetingPrepPage() {
       });
 
       if (response.ok) {
-        router.push(`/meeting/${meetingId}`);
+        // 서버가 생성한 ID로 접속해야 WebSocket이 회의를 찾을 수 있음
+        const created = await response.json();
+        router.push(`/meeting/${created.id ?? meetingId}`);
       }
     } catch {
       // 데모 모드에서 백엔드 없이도 동작
@@ -5,7 +5,7 @@ import { useCallback, useRef, useState, useEffect } from "react";
 /**
  * Audio capture hook that outputs PCM16 format for OpenAI Realtime API
  */
-export function useAudioCapture(onAudioData: (base64: string) => void) {
+export function useAudioCapture(onAudioData: (pcm16: Int16Array) => void) {
   const audioContextRef = useRef<AudioContext | null>(null);
   const workletNodeRef = useRef<AudioWorkletNode | null>(null);
   const streamRef = useRef<MediaStream | null>(null);
@@ -29,16 +29,6 @@ export function useAudioCapture(onAudioData: (base64: string) => void) {
     return int16Array;
   };
 
-  // Convert Int16Array to base64
-  const int16ToBase64 = (int16Array: Int16Array): string => {
-    const uint8Array = new Uint8Array(int16Array.buffer);
-    let binary = "";
-    for (let i = 0; i < uint8Array.length; i++) {
-      binary += String.fromCharCode(uint8Array[i]);
-    }
-    return btoa(binary);
-  };
-
   const start = useCallback(async () => {
     if (isRecording) {
       return;
@@ -88,9 +78,8 @@ export function useAudioCapture(onAudioData: (base64: string) => void) {
           }
           bufferRef.current = [];
 
-          // Convert to base64 and send
-          const base64 = int16ToBase64(combined);
-          onAudioDataRef.current(base64);
+          // Send raw PCM16 (the WebSocket layer picks binary or base64 transport)
+          onAudioDataRef.current(combined);
         }
       }, 250);
 
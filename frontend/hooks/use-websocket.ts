@@ -3,6 +3,19 @@
 import { useCallback, useRef, useState, useEffect } from "react";
 import { useMeetingStore } from "@/store/meeting-store";
 
+// Subprotocol for sending raw PCM16 audio as binary frames
+const AUDIO_SUBPROTOCOL = "meetingmod.pcm16";
+
+// Convert Int16Array to base64 (fallback for servers without binary audio)
+const int16ToBase64 = (int16Array: Int16Array): string => {
+  const uint8Array = new Uint8Array(int16Array.buffer, int16Array.byteOffset, int16Array.byteLength);
+  let binary = "";
+  for (let i = 0; i < uint8Array.length; i++) {
+    binary += String.fromCharCode(uint8Array[i]);
+  }
+  return btoa(binary);
+};
+
 export function useWebSocket(meetingId: string) {
   const wsRef = useRef<WebSocket | null>(null);
   const [isConnected, setIsConnected] = useState(false);
@@ -38,7 +51,7 @@ export function useWebSocket(meetingId: string) {
     console.log("Connecting to WebSocket:", fullUrl);
 
     try {
-      const ws = new WebSocket(fullUrl);
+      const ws = new WebSocket(fullUrl, [AUDIO_SUBPROTOCOL]);
 
       ws.onopen = () => {
         console.log("WebSocket connected successfully, readyState:", ws.readyState);
@@ -46,30 +59,41 @@ export function useWebSocket(meetingId: string) {
         isConnectingRef.current = false;
       };
 
+      const handleMessage = (message: { type: string; data: any }) => {
+        const store = storeRef.current;
+
+        switch (message.type) {
+          case "batch":
+            // Updates coalesced by the server within one tick, in order
+            message.data.messages.forEach(handleMessage);
+            break;
+          case "transcript":
+            store.addTranscript(message.data);
+            break;
+          case "speaker_update":
+            // Later speaker correction for an already-shown transcript entry
+            store.updateTranscriptSpeaker(message.data.id, message.data.speaker);
+            break;
+          case "intervention":
+            store.addIntervention(message.data);
+            break;
+          case "speaker_stats":
+            store.updateSpeakerStats(message.data.stats);
+            break;
+          case "stt_status":
+            console.log("STT Status:", message.data.status);
+            break;
+          case "error":
+            console.error("Server error:", message.data);
+            break;
+          default:
+            console.log("Unknown message type:", message.type, message);
+        }
+      };
+
       ws.onmessage = (event) => {
         try {
-          const message = JSON.parse(event.data);
-          const store = storeRef.current;
-
-          switch (message.type) {
-            case "transcript":
-              store.addTranscript(message.data);
-              break;
-            case "intervention":
-              store.addIntervention(message.data);
-              break;
-            case "speaker_stats":
-              store.updateSpeakerStats(message.data.stats);
-              break;
-            case "stt_status":
-              console.log("STT Status:", message.data.status);
-              break;
-            case "error":
-              console.error("Server error:", message.data);
-              break;
-            default:
-              console.log("Unknown message type:", message.type, message);
-          }
+          handleMessage(JSON.parse(event.data));
         } catch (error) {
           console.error("Failed to parse WebSocket message:", error);
         }
@@ -105,16 +129,22 @@ export function useWebSocket(meetingId: string) {
     isConnectingRef.current = false;
   }, []);
 
-  const sendAudio = useCallback((audioBase64: string) => {
-    const state = wsRef.current?.readyState;
+  const sendAudio = useCallback((pcm16: Int16Array) => {
+    const ws = wsRef.current;
+    const state = ws?.readyState;
     if (state === WebSocket.OPEN) {
-      wsRef.current!.send(
-        JSON.stringify({
-          type: "audio",
-          data: audioBase64,
-          timestamp: Date.now(),
-        })
-      );
+      if (ws!.protocol === AUDIO_SUBPROTOCOL) {
+        // Binary frame: raw PCM16 bytes, no base64/JSON overhead
+        ws!.send(pcm16);
+      } else {
+        ws!.send(
+          JSON.stringify({
+            type: "audio",
+            data: int16ToBase64(pcm16),
+            timestamp: Date.now(),
+          })
+        );
+      }
     } else {
       // Log when audio can't be sent (only occasionally to avoid spam)
       if (Math.random() < 0.1) {
@@ -15,7 +15,7 @@ interface TranscriptEntry {
 
 interface Intervention {
   id: string;
-  type: "TOPIC_DRIFT" | "PRINCIPLE_VIOLATION" | "PARTICIPATION_IMBALANCE" | "DECISION_STYLE";
+  type: "TOPIC_DRIFT" | "PRINCIPLE_VIOLATION" | "PARTICIPATION_IMBALANCE" | "DECISION_STYLE" | "SENTIMENT";
   message: string;
   timestamp: string;
   violatedPrinciple?: string;
@@ -55,6 +55,7 @@ interface MeetingState {
   setSelectedPrinciples: (principles: string[]) => void;
   startMeeting: (meetingId: string) => void;
   addTranscript: (entry: TranscriptEntry) => void;
+  updateTranscriptSpeaker: (id: string, speaker: string) => void;
   addIntervention: (intervention: Intervention) => void;
   dismissIntervention: () => void;
   updateSpeakerStats: (stats: SpeakerStats) => void;
@@ -86,6 +87,12 @@ export const useMeetingStore = create<MeetingState>((set) => ({
   startMeeting: (meetingId) => set({ meetingId, status: "in_progress" }),
   addTranscript: (entry) =>
     set((state) => ({ transcript: [...state.transcript, entry] })),
+  updateTranscriptSpeaker: (id, speaker) =>
+    set((state) => ({
+      transcript: state.transcript.map((entry) =>
+        entry.id === id ? { ...entry, speaker } : entry
+      ),
+    })),
   addIntervention: (intervention) =>
     set((state) => ({
       interventions: [...state.interventions, intervention],